@@ -37,8 +37,234 @@ print(EmailValidator.is_valid("test@example.com"))  # Expected: True/False
 print(report)                               # Expected: detailed validation report
 """
 
+import asyncio
+import os
+import socket
+import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from importlib import import_module
+from itertools import islice
+from pathlib import Path
 from re import compile, fullmatch
-from typing import List
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+except ImportError:  # dnspython is optional; fall back to address lookups
+    dns = None
+
+DEFAULT_DOMAIN_BLOCKLIST = Path(__file__).with_name("email_domain_blocklist.txt")
+DEFAULT_REFERENCE_DOMAINS = Path(__file__).with_name("email_reference_domains.txt")
+
+
+def _category_worker():
+    """
+    The module holding the task of count_categories_parallel, imported from
+    this file's directory; see email_category_worker for why it is separate.
+    """
+    directory = str(Path(__file__).resolve().parent)
+    if directory not in sys.path:
+        # Worker processes started with spawn or forkserver get this sys.path too
+        sys.path.append(directory)
+    return import_module("email_category_worker")
+
+
+class DomainRules:
+    """
+    Blocked email domains, indexed in hashed sets.
+
+    Two kinds of entries:
+    - "mailinator.com" blocks that domain and every subdomain of it; a bare
+      TLD such as "tk" blocks everything under it.
+    - "mailinator." (trailing dot) blocks every domain whose first label is
+      that name, under any TLD.
+
+    A lookup walks the labels of the domain once, so it costs O(labels)
+    whatever the size of the list.
+    """
+
+    def __init__(self, blocked_domains: Iterable[str] = (), blocked_names: Iterable[str] = ()):
+        self.blocked_domains = {domain.lower() for domain in blocked_domains}
+        self.blocked_names = {name.lower() for name in blocked_names}
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "DomainRules":
+        domains, names = [], []
+        for line in lines:
+            entry = line.split("#", 1)[0].strip()
+            if not entry:
+                continue
+            if entry.endswith("."):
+                names.append(entry[:-1])
+            else:
+                domains.append(entry)
+        return cls(domains, names)
+
+    @classmethod
+    def from_file(cls, path) -> "DomainRules":
+        """Load rules from a text file with one entry per line; "#" starts a comment."""
+        with open(path, encoding="utf-8") as rules_file:
+            return cls.from_lines(rules_file)
+
+    def __len__(self) -> int:
+        return len(self.blocked_domains) + len(self.blocked_names)
+
+    def is_blocked(self, domain: str) -> bool:
+        """
+        Checks a domain and its parent domains against the rules.
+
+        Args:
+            domain (str): The part of an email address after the "@".
+
+        Returns:
+            bool: True if the domain, or any domain it belongs to, is blocked.
+        """
+        domain = domain.lower()
+        dot = domain.find(".")
+        if dot > 0 and domain[:dot] in self.blocked_names:
+            return True
+        suffix = domain
+        while True:
+            if suffix in self.blocked_domains:
+                return True
+            dot = suffix.find(".")
+            if dot == -1:
+                return False
+            suffix = suffix[dot + 1:]
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between a and b: insertions, deletions,
+    substitutions and swaps of adjacent characters each cost 1.
+
+    Returns max_distance + 1 as soon as the distance is known to exceed max_distance.
+    """
+    # A shared prefix or suffix never changes the distance; typos usually leave long ones
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if not a or not b:
+        return max(len(a), len(b))
+
+    # Only cells within max_distance of the diagonal can stay within max_distance
+    too_far = max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        row_min = current[0] = i if i <= max_distance else too_far
+        char = a[i - 1]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            distance = previous[j - 1] + (char != b[j - 1])
+            if previous[j] < distance:
+                distance = previous[j] + 1
+            if current[j - 1] < distance:
+                distance = current[j - 1] + 1
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1] and previous2[j - 2] < distance:
+                distance = previous2[j - 2] + 1
+            current[j] = distance
+            if distance < row_min:
+                row_min = distance
+        if row_min > max_distance:
+            return too_far
+        previous2, previous = previous, current
+    return min(previous[-1], too_far)
+
+
+class Suggestion(NamedTuple):
+    email: str  # the corrected address
+    domain: str  # the reference domain it now uses
+    distance: int  # edits made to the domain
+    confidence: float  # 0..1, see DomainSuggester.suggest
+
+
+class DomainSuggester:
+    """
+    Nearest known-good domain for a misspelled one, SymSpell style.
+
+    Every reference domain is indexed under each string obtained by deleting
+    up to max_distance characters from its first prefix_length characters. A
+    query generates the same deletions of its own prefix, so every domain
+    within max_distance edits shares at least one key with it, and only those
+    few candidates are compared in full. A lookup costs a few dozen dict
+    probes however many domains are indexed.
+    """
+
+    def __init__(self, domains: Iterable[str], max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        # Position in the list doubles as popularity rank for breaking ties
+        self.domains: List[str] = list(dict.fromkeys(domain.lower() for domain in domains))
+        self.ranks = {domain: rank for rank, domain in enumerate(self.domains)}
+        self.deletes: Dict[str, List[int]] = {}
+        for rank, domain in enumerate(self.domains):
+            for key in self._deletions(domain[:prefix_length]):
+                self.deletes.setdefault(key, []).append(rank)
+
+    @classmethod
+    def from_file(cls, path, **kwargs) -> "DomainSuggester":
+        """Load domains from a text file with one domain per line; "#" starts a comment."""
+        with open(path, encoding="utf-8") as domains_file:
+            entries = (line.split("#", 1)[0].strip() for line in domains_file)
+            return cls([entry for entry in entries if entry], **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def _deletions(self, word: str) -> set:
+        found = {word}
+        frontier = {word}
+        for _ in range(self.max_distance):
+            frontier = {item[:i] + item[i + 1:] for item in frontier for i in range(len(item))}
+            found |= frontier
+        return found
+
+    def suggest(self, domain: str) -> Optional[Suggestion]:
+        """
+        Finds the closest reference domain.
+
+        The confidence is 1 - distance / len(domain), divided by the number of
+        reference domains at the same distance: one edit in a long domain
+        with a single nearby candidate scores high, while a short domain or an
+        ambiguous fix scores low.
+
+        Args:
+            domain (str): The part of an email address after the "@".
+
+        Returns:
+            Optional[Suggestion]: The best candidate (email is just the domain),
+                or None if no reference domain is within max_distance edits.
+        """
+        domain = domain.lower()
+        if domain in self.ranks:
+            return Suggestion(domain, domain, 0, 1.0)
+        candidates = set()
+        for key in self._deletions(domain[:self.prefix_length]):
+            candidates.update(self.deletes.get(key, ()))
+
+        best_distance, best = self.max_distance + 1, []
+        for rank in candidates:
+            distance = edit_distance(domain, self.domains[rank], best_distance)
+            if distance < best_distance:
+                best_distance, best = distance, [rank]
+            elif distance == best_distance:
+                best.append(rank)
+        if best_distance > self.max_distance:
+            return None
+        match = self.domains[min(best)]
+        confidence = max(0.0, 1 - best_distance / max(len(domain), 1)) / len(best)
+        return Suggestion(match, match, best_distance, round(confidence, 3))
 
 
 class EmailValidator:
@@ -69,6 +295,8 @@ class EmailValidator:
         r"|.*@ya[hk]?oo?\.(co[mn]?|ne[tw]?)$"
         r"|.*@h[ou]tm[ai][il]l?\.(co[mn]?|ne[tw]?)$"
     )
+    # Doubled "@" or "." as matched by pattern_typos, collapsed by suggest_correction
+    pattern_repeated_separator = compile(r"([@.])\1+")
 
     pattern_missing_parts = compile(
         r"^$"
@@ -100,16 +328,145 @@ class EmailValidator:
         r"|[^\x00-\x7F]"
     )
 
-    pattern_violate_bizrules = compile(
-        r".*@(10minutemail|tempmail|guerrillamail|mailinator|throwaway)\..*"
-        r"|.*@(g00gle|micr0soft|fac3book)\..*"
-        r"|.*\.(tk|ml|ga|cf)$"
-        r"|.*@(gmail|yahoo|hotmail|outlook|aol)\..*"
-        r"|^.*[0-9].*@.*$"
-        r"|^.{0,5}@.*$"
-        r"|^.*@.{0,3}$"
+    # Business rules on the address itself; rules on the domain live in domain_rules
+    pattern_digit = compile(r"[0-9]")
+    min_local_length = 6
+    min_domain_length = 4
+
+    # Disposable, lookalike and free-mail domains plus blocked TLDs, loaded at startup
+    domain_rules = DomainRules.from_file(DEFAULT_DOMAIN_BLOCKLIST)
+
+    # Known-good domains that typo suggestions are drawn from, most common first
+    domain_suggester = DomainSuggester.from_file(DEFAULT_REFERENCE_DOMAINS)
+
+    # Category patterns in priority order: an email belongs to the first one it fully
+    # matches. Business rules come last and are checked by violates_bizrules.
+    category_patterns = (
+        ("valid_strict", pattern_strict),
+        ("valid_lenient", pattern_lenient),
+        ("typos", pattern_typos),
+        ("missing_parts", pattern_missing_parts),
+        ("wrong_formatting", pattern_wrong_formatting),
+        ("invalid_chars", pattern_invalid_chars),
+    )
+
+    # All category patterns fused into one alternation of named groups. fullmatch
+    # takes the first alternative that spans the whole email, so lastgroup names
+    # the same category as trying each pattern in turn, in a single regex call.
+    pattern_categories = compile(
+        "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in category_patterns)
     )
 
+    @staticmethod
+    def load_domain_rules(path) -> None:
+        """
+        Replaces the domain blocklist with the rules in a file.
+
+        Args:
+            path: Text file with one domain rule per line, see DomainRules.
+        """
+        EmailValidator.domain_rules = DomainRules.from_file(path)
+
+    @staticmethod
+    def load_reference_domains(path) -> None:
+        """
+        Replaces the known-good domains used for typo suggestions.
+
+        Args:
+            path: Text file with one domain per line, see DomainSuggester.from_file.
+        """
+        EmailValidator.domain_suggester = DomainSuggester.from_file(path)
+
+    @staticmethod
+    def suggest_correction(email: str) -> Optional[Suggestion]:
+        """
+        Proposes a fixed address for an email with a mistyped domain.
+
+        Repeated "@" and "." are collapsed first, then the domain is replaced
+        by the closest known-good domain.
+
+        Args:
+            email (str): The email address, typically one categorized as "typos".
+
+        Returns:
+            Optional[Suggestion]: The corrected address and its confidence, or
+                None if there is nothing to fix beyond letter case, or no close
+                reference domain.
+        """
+        if not isinstance(email, str):
+            return None
+        fixed = EmailValidator.pattern_repeated_separator.sub(r"\1", email.strip())
+        at = fixed.find("@")
+        if at < 1:
+            return None
+        suggestion = EmailValidator.domain_suggester.suggest(fixed[at + 1:])
+        if suggestion is None:
+            return None
+        corrected = f"{fixed[:at]}@{suggestion.domain}"
+        # Domains are case-insensitive: lowercasing one is no correction
+        if corrected.lower() == email.lower():
+            return None
+        return suggestion._replace(email=corrected)
+
+    @staticmethod
+    def violates_bizrules(email: str) -> bool:
+        """
+        Checks an email address against the business rules: no digits and at least
+        six characters before the "@", at least four characters after it, and a
+        domain that is not blocked. The address is split once at its last "@".
+
+        Args:
+            email (str): The email address to check.
+
+        Returns:
+            bool: True if any business rule is violated.
+        """
+        # Line breaks fail every earlier category and were never a business rule
+        if "\n" in email:
+            return False
+        at = email.rfind("@")
+        if at == -1:
+            return False
+        if email.find("@") < EmailValidator.min_local_length:
+            return True
+        domain = email[at + 1:]
+        if len(domain) < EmailValidator.min_domain_length:
+            return True
+        if EmailValidator.pattern_digit.search(email, 0, at):
+            return True
+        return EmailValidator.domain_rules.is_blocked(domain)
+
+    @staticmethod
+    def categorize(email) -> str:
+        """
+        Returns the category of a single email address, using one fused regex call.
+
+        Args:
+            email: The value to categorize; non-strings are "wrong_type".
+
+        Returns:
+            str: One of the category keys of categorize_batch.
+        """
+        if not isinstance(email, str):
+            return "wrong_type"
+        match = EmailValidator.pattern_categories.fullmatch(email)
+        if match:
+            return match.lastgroup
+        return "violate_bizrules" if EmailValidator.violates_bizrules(email) else "other_violation"
+
+    @staticmethod
+    def categorize_sequential(email) -> str:
+        """
+        Returns the category of a single email address by trying each category
+        pattern in turn. Same result as categorize; kept as its reference.
+        """
+        if not isinstance(email, str):
+            return "wrong_type"
+        for name, pattern in EmailValidator.category_patterns:
+            if fullmatch(pattern, email):
+                return name
+        return "violate_bizrules" if EmailValidator.violates_bizrules(email) else "other_violation"
+
     @staticmethod
     def validate_batch(emails: List[str], strict: bool = False) -> List[str]:
         """
@@ -176,34 +533,119 @@ class EmailValidator:
             "violate_bizrules": [],
             "other_violation": [],
         }
+        categorize = EmailValidator.categorize
         for email in emails:
-            if not isinstance(email, str):
-                cats["wrong_type"].append(email)
-            elif fullmatch(EmailValidator.pattern_strict, email):
-                cats["valid_strict"].append(email)
-            elif fullmatch(EmailValidator.pattern_lenient, email):
-                cats["valid_lenient"].append(email)
-            elif fullmatch(EmailValidator.pattern_typos, email):
-                cats["typos"].append(email)
-            elif fullmatch(EmailValidator.pattern_missing_parts, email):
-                cats["missing_parts"].append(email)
-            elif fullmatch(EmailValidator.pattern_wrong_formatting, email):
-                cats["wrong_formatting"].append(email)
-            elif fullmatch(EmailValidator.pattern_invalid_chars, email):
-                cats["invalid_chars"].append(email)
-            elif fullmatch(EmailValidator.pattern_violate_bizrules, email):
-                cats["violate_bizrules"].append(email)
-            else:
-                cats["other_violation"].append(email)
+            cats[categorize(email)].append(email)
         return cats
 
     @staticmethod
-    def generate_report(emails: List[str]) -> str:
+    def count_categories(emails: Iterable) -> Counter:
+        """
+        Counts how many emails fall into each category, without keeping the emails.
+
+        Args:
+            emails (Iterable): Any iterable of email addresses, consumed once.
+
+        Returns:
+            Counter: Category name to count. Counters of separate chunks can be
+                added together to get the count of their concatenation.
+        """
+        return Counter(map(EmailValidator.categorize, emails))
+
+    @staticmethod
+    def count_categories_parallel(
+        emails: Iterable, workers: Optional[int] = None, chunk_size: int = 50_000
+    ) -> Counter:
+        """
+        Counts categories across a process pool, one chunk of emails per task.
+
+        At most two chunks per worker are in flight, so memory stays bounded
+        however long the input is, and an iterator or open file is never
+        materialized as a whole.
+
+        Args:
+            emails (Iterable): Email addresses, e.g. a generator or iter_file_lines().
+            workers (Optional[int]): Number of processes. Defaults to os.cpu_count().
+            chunk_size (int): Emails sent to a worker per task.
+
+        Returns:
+            Counter: Merged category counts of all chunks.
+        """
+        workers = workers or os.cpu_count() or 1
+        worker = _category_worker()
+        path = str(Path(__file__).resolve())
+        worker.register(path, EmailValidator)
+        totals: Counter = Counter()
+        iterator = iter(emails)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            max_in_flight = 2 * workers
+            pending = set()
+            while True:
+                while len(pending) < max_in_flight:
+                    chunk = list(islice(iterator, chunk_size))
+                    if not chunk:
+                        break
+                    pending.add(pool.submit(worker.count_categories, path, chunk))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    totals.update(future.result())
+        return totals
+
+    @staticmethod
+    def iter_file_lines(path) -> Iterator[str]:
+        """
+        Yields the email addresses of a text file, one per line, without line endings.
+
+        Args:
+            path: Path of a UTF-8 text file.
+        """
+        with open(path, encoding="utf-8") as emails_file:
+            for line in emails_file:
+                yield line.rstrip("\r\n")
+
+    @staticmethod
+    def format_report(counts: Counter) -> str:
+        """
+        Formats category counts as the text report of generate_report.
+
+        Args:
+            counts (Counter): Category name to count, e.g. from count_categories.
+
+        Returns:
+            str: The formatted report.
+        """
+        total = sum(counts.values())
+
+        def pct(n):
+            return f"{(n / total * 100):5.1f}%" if total else "0.0%"
+
+        return (
+            "Email Validation Report:\n"
+            f"  Total processed:       {total}\n"
+            f"  Valid (strict):        {counts['valid_strict']:3d}  ({pct(counts['valid_strict'])})\n"
+            f"  Valid (lenient):       {counts['valid_lenient']:3d}  ({pct(counts['valid_lenient'])})\n"
+            f"  Wrong type:            {counts['wrong_type']:3d}  ({pct(counts['wrong_type'])})\n"
+            f"  Typos:                 {counts['typos']:3d}  ({pct(counts['typos'])})\n"
+            f"  Missing parts:         {counts['missing_parts']:3d}  ({pct(counts['missing_parts'])})\n"
+            f"  Wrong formatting:      {counts['wrong_formatting']:3d}  ({pct(counts['wrong_formatting'])})\n"
+            f"  Invalid characters:    {counts['invalid_chars']:3d}  ({pct(counts['invalid_chars'])})\n"
+            f"  Violates biz rules:    {counts['violate_bizrules']:3d}  ({pct(counts['violate_bizrules'])})\n"
+            f"  Other violations:      {counts['other_violation']:3d}  ({pct(counts['other_violation'])})"
+        )
+
+    @staticmethod
+    def generate_report(emails: Iterable, workers: int = 1) -> str:
         """
         Generates a summary report of email validation results.
 
+        Only category counts are kept, so emails can be any iterable, including
+        iter_file_lines() over a file too large for memory.
+
         Args:
-            emails (List[str]): A list of email addresses to validate and summarize.
+            emails (Iterable): Email addresses to validate and summarize.
+            workers (int, optional): Processes to count with; 1 counts in-process. Defaults to 1.
 
         Returns:
             str: A formatted string report summarizing the validation results, including counts for each validation category:
@@ -219,44 +661,212 @@ class EmailValidator:
                 - Other violations
 
         """
-        c = EmailValidator.categorize_batch(emails)
-        total = len(emails)
+        if workers == 1:
+            counts = EmailValidator.count_categories(emails)
+        else:
+            counts = EmailValidator.count_categories_parallel(emails, workers=workers)
+        return EmailValidator.format_report(counts)
 
-        def pct(n):
-            return f"{(n / total * 100):5.1f}%" if total else "0.0%"
 
-        return (
-            "Email Validation Report:\n"
-            f"  Total processed:       {total}\n"
-            f"  Valid (strict):        {len(c['valid_strict']):3d}  ({pct(len(c['valid_strict']))})\n"
-            f"  Valid (lenient):       {len(c['valid_lenient']):3d}  ({pct(len(c['valid_lenient']))})\n"
-            f"  Wrong type:            {len(c['wrong_type']):3d}  ({pct(len(c['wrong_type']))})\n"
-            f"  Typos:                 {len(c['typos']):3d}  ({pct(len(c['typos']))})\n"
-            f"  Missing parts:         {len(c['missing_parts']):3d}  ({pct(len(c['missing_parts']))})\n"
-            f"  Wrong formatting:      {len(c['wrong_formatting']):3d}  ({pct(len(c['wrong_formatting']))})\n"
-            f"  Invalid characters:    {len(c['invalid_chars']):3d}  ({pct(len(c['invalid_chars']))})\n"
-            f"  Violates biz rules:    {len(c['violate_bizrules']):3d}  ({pct(len(c['violate_bizrules']))})\n"
-            f"  Other violations:      {len(c['other_violation']):3d}  ({pct(len(c['other_violation']))})"
-        )
+async def resolve_mx(domain: str) -> bool:
+    """
+    Checks whether a domain can receive mail.
 
+    Uses an MX lookup when dnspython is installed. Otherwise falls back to an
+    address lookup through the system resolver, which is what a mail server
+    does for a domain without MX records (RFC 5321, section 5.1).
 
-# Test your class:
-emails = [
-    "valid@example.com",
-    "invalid.email",
-    "user@domain",
-    "test@valid-site.org",
-    "",
-    "admin@company.co.uk",
-]
+    Args:
+        domain (str): The domain to look up.
 
-valid_emails = EmailValidator.validate_batch(emails)
-report = EmailValidator.generate_report(emails)
-strict_valid = EmailValidator.validate_batch(emails, strict=True)
+    Returns:
+        bool: True if the domain has an MX record (or an address to fall back to).
+    """
+    if dns is not None:
+        try:
+            await dns.asyncresolver.resolve(domain, "MX")
+            return True
+        except dns.exception.DNSException:
+            return False
+    try:
+        await asyncio.get_running_loop().getaddrinfo(domain, 25, type=socket.SOCK_STREAM)
+        return True
+    except (socket.gaierror, UnicodeError):
+        return False
+
+
+class StaticResolver:
+    """
+    In-process stand-in for resolve_mx, answering from a fixed dict.
+
+    Unknown domains resolve to False. Every lookup is counted in .calls and can
+    be delayed to simulate network latency, so a verification run can be
+    checked without network access. .peak_active is the most lookups that
+    were in progress at once.
+    """
+
+    def __init__(self, deliverable: Dict[str, bool], delay: float = 0.0):
+        self.deliverable = deliverable
+        self.delay = delay
+        self.calls: Counter = Counter()
+        self.active = 0
+        self.peak_active = 0
+
+    async def __call__(self, domain: str) -> bool:
+        self.calls[domain] += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return self.deliverable.get(domain, False)
+        finally:
+            self.active -= 1
+
+
+class DomainVerifier:
+    """
+    Asynchronous deliverability check for batches of email addresses.
+
+    Domains are deduplicated across a batch, so a list with a million
+    addresses at a hundred domains costs a hundred lookups. At most
+    `concurrency` lookups run at once, and results are cached for `ttl`
+    seconds across batches. A domain requested again while its lookup is
+    still in flight waits for that lookup instead of starting another one.
+
+    Expired results are dropped as new ones are stored, and the cache never
+    holds more than max_cache_size domains, so a long-lived verifier stays
+    bounded however many batches it sees.
+    """
+
+    def __init__(
+        self,
+        resolver: Callable[[str], Awaitable[bool]] = resolve_mx,
+        concurrency: int = 50,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = monotonic,
+        max_cache_size: int = 100_000,
+    ):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if max_cache_size < 1:
+            raise ValueError(f"max_cache_size must be at least 1, got {max_cache_size}")
+        self.resolver = resolver
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self.clock = clock
+        self.max_cache_size = max_cache_size
+        # domain -> (expires_at, deliverable), oldest first: with one ttl, that is expiry order
+        self._cache: OrderedDict = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self) -> int:
+        """Number of cached domains, expired ones not yet dropped included."""
+        return len(self._cache)
+
+    def _store(self, domain: str, deliverable: bool) -> None:
+        now = self.clock()
+        self._cache[domain] = (now + self.ttl, deliverable)
+        self._cache.move_to_end(domain)
+        # Only the oldest entries can be expired, so pruning stops at the first live one
+        while self._cache:
+            expires_at, _ = next(iter(self._cache.values()))
+            if expires_at > now and len(self._cache) <= self.max_cache_size:
+                break
+            self._cache.popitem(last=False)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """The semaphore shared by every batch on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _lookup(self, domain: str, semaphore: asyncio.Semaphore) -> bool:
+        cached = self._cache.get(domain)
+        if cached is not None and cached[0] > self.clock():
+            return cached[1]
+        if domain in self._in_flight:
+            return await asyncio.shield(self._in_flight[domain])
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[domain] = future
+        try:
+            async with semaphore:
+                try:
+                    deliverable = bool(await self.resolver(domain))
+                except (OSError, asyncio.TimeoutError):
+                    deliverable = False
+            self._store(domain, deliverable)
+            future.set_result(deliverable)
+            return deliverable
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()  # mark retrieved when nobody else awaits it
+            raise
+        finally:
+            del self._in_flight[domain]
+
+    async def verify_domains(self, domains: Iterable[str]) -> Dict[str, bool]:
+        """
+        Resolves each distinct domain at most once.
+
+        Args:
+            domains (Iterable[str]): Domains, duplicates allowed; compared case-insensitively.
+
+        Returns:
+            Dict[str, bool]: Lowercased domain to whether it can receive mail.
+        """
+        unique = list(dict.fromkeys(domain.lower() for domain in domains))
+        semaphore = self._get_semaphore()
+        results = await asyncio.gather(*(self._lookup(domain, semaphore) for domain in unique))
+        return dict(zip(unique, results))
+
+    async def verify_batch(self, emails: Iterable, strict: bool = False) -> List[bool]:
+        """
+        Checks syntax and domain deliverability of every email.
+
+        Args:
+            emails (Iterable): Email addresses to verify.
+            strict (bool, optional): Syntax check strictness, as in EmailValidator.is_valid. Defaults to False.
+
+        Returns:
+            List[bool]: One result per email, in input order. Emails that fail
+                the syntax check are False without a lookup.
+        """
+        domains = [
+            email[email.rfind("@") + 1 :].lower() if EmailValidator.is_valid(email, strict) else None
+            for email in emails
+        ]
+        deliverable = await self.verify_domains(domain for domain in domains if domain is not None)
+        return [domain is not None and deliverable[domain] for domain in domains]
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
+
+# Test your class:
+if __name__ == "__main__":
+    emails = [
+        "valid@example.com",
+        "invalid.email",
+        "user@domain",
+        "test@valid-site.org",
+        "",
+        "admin@company.co.uk",
+    ]
+
+    valid_emails = EmailValidator.validate_batch(emails)
+    report = EmailValidator.generate_report(emails)
+    strict_valid = EmailValidator.validate_batch(emails, strict=True)
+
+    print(len(valid_emails))  # Expected: count of valid emails
+    print(EmailValidator.is_valid("test@example.com"))  # Expected: True/False
+    print(report)  # Expected: detailed validation report
 
-print(len(valid_emails))  # Expected: count of valid emails
-print(EmailValidator.is_valid("test@example.com"))  # Expected: True/False
-print(report)  # Expected: detailed validation report
 
 """
 === BUSINESS COMMUNICATION SUMMARY ===
@@ -0,0 +1,114 @@
+"""
+Benchmarks of the bulk paths of 05_email_validator.py: fused categorization,
+category counting in-process and across a process pool, domain
+suggestions, and a deliverability check against a simulated resolver.
+
+    python bench_email_validator.py            # all benchmarks
+    python bench_email_validator.py --verify   # the deliverability demo only
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from importlib import import_module
+from time import perf_counter
+from typing import List, Optional
+
+# The exercise file name starts with a digit, so it cannot be imported with an import statement
+email_validator = import_module("05_email_validator")
+DomainSuggester = email_validator.DomainSuggester
+DomainVerifier = email_validator.DomainVerifier
+EmailValidator = email_validator.EmailValidator
+StaticResolver = email_validator.StaticResolver
+
+
+def make_mixed_quality_emails(n: int, seed: int = 42) -> List[str]:
+    """Synthetic emails covering every category, for benchmarking."""
+    rng = random.Random(seed)
+    samples = [
+        "valid@example.com", "first.last@company.co.uk", "x_1@sub.domain.org", "user@gmial.com",
+        "user..name@example.com", "invalid.email", "user@domain", "", "a@b@c.com", "user@-domain.com",
+        "us er@example.com", "user@exa_mple.com", "joe42@mailinator.com", "bob@site.tk", "???",
+    ]
+    return [f"{rng.randint(0, 999)}{rng.choice(samples)}" if rng.random() < 0.3 else rng.choice(samples) for _ in range(n)]
+
+
+def benchmark_categorize(n: int = 1_000_000) -> None:
+    emails = make_mixed_quality_emails(n)
+    timings = {}
+    for name, categorize in (
+        ("sequential", EmailValidator.categorize_sequential),
+        ("fused", EmailValidator.categorize),
+    ):
+        start = perf_counter()
+        categories = [categorize(email) for email in emails]
+        timings[name] = perf_counter() - start
+        print(f"{name:<11} {n / timings[name]:>12,.0f} emails/s")
+    assert categories == [EmailValidator.categorize_sequential(email) for email in emails]
+    print(f"speedup     {timings['sequential'] / timings['fused']:.2f}x")
+
+
+def benchmark_report(n: int = 2_000_000, workers: Optional[int] = None) -> None:
+    emails = make_mixed_quality_emails(n)
+    start = perf_counter()
+    batches = EmailValidator.categorize_batch(emails)
+    print(f"{'batch':<11} {n / (perf_counter() - start):>12,.0f} emails/s")
+    expected = Counter({name: len(batch) for name, batch in batches.items() if batch})
+    del batches
+    for name, count in (
+        ("counting", EmailValidator.count_categories),
+        ("parallel", lambda emails: EmailValidator.count_categories_parallel(iter(emails), workers)),
+    ):
+        start = perf_counter()
+        counts = count(emails)
+        print(f"{name:<11} {n / (perf_counter() - start):>12,.0f} emails/s")
+        assert counts == expected
+
+
+def benchmark_suggestions(n_domains: int = 100_000, n_queries: int = 2_000) -> None:
+    rng = random.Random(42)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    domains = [
+        "".join(rng.choice(letters) for _ in range(rng.randint(4, 12))) + rng.choice([".com", ".net", ".org", ".de"])
+        for _ in range(n_domains)
+    ]
+    start = perf_counter()
+    suggester = DomainSuggester(domains)
+    print(f"index       {n_domains:,} domains in {perf_counter() - start:.1f}s")
+    queries = []
+    for domain in rng.sample(domains, n_queries):
+        at = rng.randrange(len(domain))
+        queries.append(domain[:at] + rng.choice(letters) + domain[at + 1:])
+    start = perf_counter()
+    found = sum(suggester.suggest(query) is not None for query in queries)
+    elapsed = perf_counter() - start
+    print(f"suggest     {elapsed / n_queries * 1e6:,.0f} us/lookup, {found}/{n_queries} corrected")
+
+
+def demo_verification(n: int = 100_000) -> None:
+    emails = make_mixed_quality_emails(n)
+    resolver = StaticResolver({"example.com": True, "company.co.uk": True, "sub.domain.org": True}, delay=0.01)
+    verifier = DomainVerifier(resolver, concurrency=10)
+    start = perf_counter()
+    deliverable = asyncio.run(verifier.verify_batch(emails))
+    elapsed = perf_counter() - start
+    print(f"verified    {n:,} emails, {sum(deliverable):,} deliverable, "
+          f"{sum(resolver.calls.values())} lookups in {elapsed:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--verify", action="store_true", help="run only the deliverability demo")
+    args = parser.parse_args()
+    if args.verify:
+        demo_verification()
+        return
+    benchmark_categorize()
+    benchmark_report()
+    benchmark_suggestions()
+    demo_verification()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Process-pool task of EmailValidator.count_categories_parallel.
+
+A task sent to a worker process is pickled as a reference to its function's
+module, and 05_email_validator cannot be imported by name: the file name
+starts with a digit, and it may have been loaded under any name. The task
+therefore lives here, and takes the path of the validator file, which a
+worker process loads once if it did not inherit it from its parent.
+"""
+
+from collections import Counter
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Dict, List
+
+_validators: Dict[str, type] = {}  # validator file path -> its EmailValidator class
+
+
+def register(path: str, validator: type) -> None:
+    """Makes a loaded validator available to forked workers without loading it again."""
+    _validators[path] = validator
+
+
+def _validator(path: str) -> type:
+    validator = _validators.get(path)
+    if validator is None:
+        spec = spec_from_file_location("_email_validator_worker", path)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        validator = _validators[path] = module.EmailValidator
+    return validator
+
+
+def count_categories(path: str, emails: List) -> Counter:
+    """EmailValidator.count_categories of one chunk, with the validator of the file at path."""
+    return _validator(path).count_categories(emails)
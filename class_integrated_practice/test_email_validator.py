@@ -0,0 +1,348 @@
+import asyncio
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from itertools import product
+from multiprocessing import get_context
+from re import compile, fullmatch
+
+from bench_email_validator import make_mixed_quality_emails
+
+# The exercise file name starts with a digit, so it cannot be imported with an import statement
+email_validator = import_module("05_email_validator")
+EmailValidator = email_validator.EmailValidator
+
+CATEGORY_SAMPLES = {
+    "wrong_type": [123, None, ["a@b.com"]],
+    "valid_strict": ["valid@example.com", "first.last@company.co.uk", "joe42@mailinator.com"],
+    "valid_lenient": ["ab@x.io", "user@-domain.com", "user@gmail..com"],
+    "typos": ["user@@example.com", "us er@gmal.co"],
+    "missing_parts": ["", "invalid.email", "user@domain"],
+    "wrong_formatting": ["a@b@c.com"],
+    "invalid_chars": ["user@exa_mple.com", "user@exam ple.com", "x@y.z\n"],
+    "violate_bizrules": ["us er@example.com", "a b@example.com"],
+    "other_violation": ["???"],
+}
+
+def test_fused_categorize():
+    """
+    Test that the fused regex gives the category of trying each pattern in
+    turn, for samples of every category and for a mixed synthetic batch.
+    """
+
+    for category, samples in CATEGORY_SAMPLES.items():
+        for email in samples:
+            fused = EmailValidator.categorize(email)
+            sequential = EmailValidator.categorize_sequential(email)
+            assert fused == sequential == category, (
+                f"Categorize test failed for {email!r}: expected {category}, got {fused} (sequential {sequential})"
+            )
+    assert set(CATEGORY_SAMPLES) == set(EmailValidator.categorize_batch([])), "Every category should be sampled"
+
+    emails = make_mixed_quality_emails(5_000)
+    fused = list(map(EmailValidator.categorize, emails))
+    assert fused == list(map(EmailValidator.categorize_sequential, emails)), "Fused and sequential categories differ"
+
+    print("✓ Fused categorize tests passed!")
+
+def test_domain_rules():
+    """
+    Test domain entries (which cover their subdomains), first-label entries
+    under any TLD, bare TLDs, and loading rules from lines with comments.
+    """
+
+    rules = email_validator.DomainRules.from_lines([
+        "# comment line",
+        "spam.example  # blocks spam.example and its subdomains",
+        "mailinator.",
+        "tk",
+        "",
+    ])
+    assert len(rules) == 3
+
+    cases = {
+        "spam.example": True,
+        "mx.SPAM.example": True,
+        "notspam.example": False,
+        "spam.example.org": False,
+        "mailinator.com": True,
+        "Mailinator.co.uk": True,
+        "mail.mailinator.com": False,  # first label only
+        "mailinatorx.com": False,
+        "site.tk": True,
+        "a.b.tk": True,
+        "tk.com": False,
+        "example.com": False,
+        "localhost": False,
+    }
+    for domain, expected in cases.items():
+        result = rules.is_blocked(domain)
+        assert result == expected, f"Rule test failed for {domain!r}: expected {expected}, got {result}"
+
+    # The default blocklist, applied through the business rules
+    assert EmailValidator.violates_bizrules("someone@mailinator.com")
+    assert EmailValidator.violates_bizrules("someone@site.tk")
+    assert not EmailValidator.violates_bizrules("someone@example.com")
+    assert EmailValidator.violates_bizrules("joe42@example.com"), "Digits before the @ break a business rule"
+
+    print("✓ Domain rule tests passed!")
+
+# The business-rule pattern the domain blocklist replaced, matched with fullmatch
+OLD_PATTERN_VIOLATE_BIZRULES = compile(
+    r".*@(10minutemail|tempmail|guerrillamail|mailinator|throwaway)\..*"
+    r"|.*@(g00gle|micr0soft|fac3book)\..*"
+    r"|.*\.(tk|ml|ga|cf)$"
+    r"|.*@(gmail|yahoo|hotmail|outlook|aol)\..*"
+    r"|^.*[0-9].*@.*$"
+    r"|^.{0,5}@.*$"
+    r"|^.*@.{0,3}$"
+)
+
+def test_bizrules_match_replaced_regex():
+    """
+    Test that the business rules categorize a fixed corpus as the regex they
+    replaced did, except that blocklist lookups now ignore case: domains the
+    regex let through only because of their capitals are listed as changes.
+    """
+
+    def old_categorize(email):
+        for category, pattern in EmailValidator.category_patterns:
+            if fullmatch(pattern, email):
+                return category
+        return "violate_bizrules" if OLD_PATTERN_VIOLATE_BIZRULES.fullmatch(email) else "other_violation"
+
+    local_parts = ["ab", "abcdef", "abc1def", "a b cdef", "agmail", "user name"]
+    domains = [
+        "mailinator.a", "Mailinator.a", "mailinator.com", "gmail.c", "GMAIL.c", "sub.gmail.x",
+        "site.tk", "site.TK", "x.ab", "abc", "example.c", "x y.com", "g00gle.b", "a.b.c",
+    ]
+    changed = {
+        "abcdef@Mailinator.a", "abcdef@GMAIL.c",
+        "agmail@Mailinator.a", "agmail@GMAIL.c",
+        "a b cdef@Mailinator.a", "a b cdef@GMAIL.c", "a b cdef@site.TK",
+        "user name@Mailinator.a", "user name@GMAIL.c", "user name@site.TK",
+    }
+
+    reached = 0
+    for local_part, domain in product(local_parts, domains):
+        email = f"{local_part}@{domain}"
+        old, new = old_categorize(email), EmailValidator.categorize(email)
+        if email in changed:
+            assert (old, new) == ("other_violation", "violate_bizrules"), (
+                f"Expected change failed for {email!r}: got {old} -> {new}"
+            )
+        else:
+            assert old == new, f"Business rule test failed for {email!r}: regex gave {old}, got {new}"
+        reached += new in ("violate_bizrules", "other_violation")
+    assert reached > len(changed), "The corpus should mostly reach the business rules"
+
+    print("✓ Business rules vs replaced regex tests passed!")
+
+def test_count_categories_parallel():
+    """
+    Test that counting chunks across a process pool gives the in-process
+    counts, also when the validator file was loaded under another name and
+    when workers start fresh instead of forking.
+    """
+
+    emails = make_mixed_quality_emails(2_000)
+    expected = EmailValidator.count_categories(emails)
+    assert expected == Counter(map(EmailValidator.categorize_sequential, emails))
+
+    result = EmailValidator.count_categories_parallel(iter(emails), workers=2, chunk_size=300)
+    assert result == expected, f"Parallel count failed: expected {expected}, got {result}"
+    assert EmailValidator.count_categories_parallel([], workers=2) == Counter()
+
+    spec = spec_from_file_location("ev", email_validator.__file__)
+    renamed = module_from_spec(spec)
+    spec.loader.exec_module(renamed)
+    result = renamed.EmailValidator.count_categories_parallel(emails, workers=2, chunk_size=700)
+    assert result == expected, f"Renamed module count failed: expected {expected}, got {result}"
+
+    # A spawned worker inherits nothing and loads the validator file itself
+    worker = email_validator._category_worker()
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        result = pool.submit(worker.count_categories, email_validator.__file__, emails).result()
+    assert result == expected, f"Spawned worker count failed: expected {expected}, got {result}"
+
+    report = EmailValidator.generate_report(emails, workers=2)
+    assert report == EmailValidator.format_report(expected)
+
+    print("✓ Parallel count tests passed!")
+
+def test_domain_verifier():
+    """
+    Test that each distinct domain is resolved once per batch, whatever its
+    case, with at most `concurrency` lookups at a time, and that failing
+    lookups count as undeliverable.
+    """
+
+    resolver = email_validator.StaticResolver({"example.com": True, "company.co.uk": True}, delay=0.001)
+    verifier = email_validator.DomainVerifier(resolver, concurrency=3)
+    domains = ["example.com", "EXAMPLE.com", "company.co.uk", "nowhere.test"] + [f"d{i}.test" for i in range(20)]
+
+    result = asyncio.run(verifier.verify_domains(domains * 3))
+    assert result["example.com"] and result["company.co.uk"] and not result["nowhere.test"]
+    assert "EXAMPLE.com" not in result and len(result) == 23
+    assert set(resolver.calls.values()) == {1}, f"Each domain should be resolved once: {resolver.calls}"
+    assert resolver.peak_active == 3, f"Expected 3 concurrent lookups at most, got {resolver.peak_active}"
+
+    emails = ["someone@Example.com", "invalid.email", "someone@nowhere.test", 42]
+    assert asyncio.run(verifier.verify_batch(emails)) == [True, False, False, False]
+    assert sum(resolver.calls.values()) == 23, "Cached domains should not be resolved again"
+
+    async def failing(domain):
+        raise OSError("network unreachable")
+
+    result = asyncio.run(email_validator.DomainVerifier(failing).verify_domains(["example.com"]))
+    assert result == {"example.com": False}, f"OSError should mean undeliverable, got {result}"
+
+    print("✓ Domain verifier tests passed!")
+
+def test_domain_verifier_sharing():
+    """
+    Test that concurrent batches share the lookups in flight and the
+    concurrency bound.
+    """
+
+    resolver = email_validator.StaticResolver({"example.com": True}, delay=0.01)
+    verifier = email_validator.DomainVerifier(resolver, concurrency=2)
+
+    async def overlapping_batches():
+        return await asyncio.gather(
+            verifier.verify_domains(["example.com", "a.test", "b.test"]),
+            verifier.verify_domains(["Example.com", "c.test", "d.test"]),
+        )
+
+    first, second = asyncio.run(overlapping_batches())
+    assert first["example.com"] and second["example.com"]
+    assert resolver.calls["example.com"] == 1, f"In-flight lookup not shared: {resolver.calls}"
+    assert resolver.peak_active == 2, f"Batches should share the bound of 2, got {resolver.peak_active}"
+
+    print("✓ Domain verifier sharing tests passed!")
+
+def test_domain_verifier_cache():
+    """
+    Test TTL expiry with an injected clock, and that expired or surplus
+    entries are dropped so the cache stays bounded.
+    """
+
+    now = [0.0]
+    resolver = email_validator.StaticResolver({"example.com": True})
+    verifier = email_validator.DomainVerifier(resolver, ttl=10.0, clock=lambda: now[0], max_cache_size=5)
+
+    asyncio.run(verifier.verify_domains(["example.com"]))
+    now[0] = 9.0
+    asyncio.run(verifier.verify_domains(["example.com"]))
+    assert resolver.calls["example.com"] == 1, "A live entry should be served from the cache"
+    now[0] = 10.0
+    asyncio.run(verifier.verify_domains(["example.com"]))
+    assert resolver.calls["example.com"] == 2, "An expired entry should be resolved again"
+
+    now[0] = 15.0
+    asyncio.run(verifier.verify_domains([f"d{i}.test" for i in range(3)]))
+    assert len(verifier) == 4
+    now[0] = 21.0  # example.com expires at 20.0
+    asyncio.run(verifier.verify_domains(["e.test"]))
+    assert len(verifier) == 4 and "example.com" not in verifier._cache, "Expired entries should be dropped"
+
+    asyncio.run(verifier.verify_domains([f"batch{i}.test" for i in range(100)]))
+    assert len(verifier) == 5, f"The cache should hold at most 5 domains, holds {len(verifier)}"
+    assert list(verifier._cache)[-1] == "batch99.test", "The oldest entries should go first"
+
+    print("✓ Domain verifier cache tests passed!")
+
+def reference_edit_distance(a, b):
+    """Full optimal string alignment table, without the shortcuts of edit_distance."""
+    table = [[i + j if not i or not j else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            table[i][j] = min(
+                table[i - 1][j] + 1,
+                table[i][j - 1] + 1,
+                table[i - 1][j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                table[i][j] = min(table[i][j], table[i - 2][j - 2] + 1)
+    return table[-1][-1]
+
+def test_edit_distance():
+    """
+    Test edit_distance against the full table, and that a distance above
+    max_distance is cut off at max_distance + 1.
+    """
+
+    cases = [
+        ("gmail.com", "gmail.com", 2, 0),
+        ("gmail.com", "gmial.com", 2, 1),  # swapped neighbours are one edit
+        ("gmail.com", "gmal.com", 2, 1),
+        ("hotmail.com", "hotmial.co", 2, 2),
+        ("kitten", "sitting", 3, 3),
+        ("kitten", "sitting", 2, 3),
+        ("abc", "xyz", 1, 2),
+        ("", "abc", 5, 3),
+        ("", "abcdef", 2, 3),
+        ("yahoo.com", "yahooo.com", 0, 1),
+    ]
+    for a, b, max_distance, expected in cases:
+        result = email_validator.edit_distance(a, b, max_distance)
+        assert result == expected, f"Distance test failed for {a!r}, {b!r}: expected {expected}, got {result}"
+
+    rng = random.Random(7)
+    for _ in range(2_000):
+        a = "".join(rng.choice("abc.") for _ in range(rng.randint(0, 8)))
+        b = "".join(rng.choice("abc.") for _ in range(rng.randint(0, 8)))
+        max_distance = rng.randint(0, 4)
+        expected = min(reference_edit_distance(a, b), max_distance + 1)
+        result = email_validator.edit_distance(a, b, max_distance)
+        assert result == expected, f"Distance test failed for {a!r}, {b!r}, {max_distance}: expected {expected}, got {result}"
+
+    print("✓ Edit distance tests passed!")
+
+def test_suggestions():
+    """
+    Test domain suggestions and address corrections, including that a
+    difference in letter case only is not a typo.
+    """
+
+    suggester = email_validator.DomainSuggester(["gmail.com", "gmx.com", "mail.com", "ymail.com"])
+    assert suggester.suggest("gmial.com").domain == "gmail.com"
+    assert suggester.suggest("gmx.co") == ("gmx.com", "gmx.com", 1, 0.833)
+    assert suggester.suggest("GMAIL.com").distance == 0
+    assert suggester.suggest("qqqqqqq.org") is None
+
+    # gail.com is one edit from both gmail.com and mail.com: half the confidence, the more common one wins
+    ambiguous = suggester.suggest("gail.com")
+    assert ambiguous.domain == "gmail.com" and ambiguous.confidence == 0.438, f"Got {ambiguous}"
+
+    cases = {
+        "user@gmial.com": "user@gmail.com",
+        "User@GMIAL.com": "User@gmail.com",
+        "user@@gmial..com": "user@gmail.com",
+        "user@hotmial.com": "user@hotmail.com",
+    }
+    for email, expected in cases.items():
+        suggestion = EmailValidator.suggest_correction(email)
+        assert suggestion is not None and suggestion.email == expected, (
+            f"Correction test failed for {email!r}: expected {expected!r}, got {suggestion}"
+        )
+    assert EmailValidator.suggest_correction("user@@gmail.com").distance == 0, "Collapsing @@ alone is a fix"
+
+    for email in ["user@gmail.com", "User@GMAIL.com", "user@zzzzzzzz.qq", "nodomain", "@gmail.com", None]:
+        suggestion = EmailValidator.suggest_correction(email)
+        assert suggestion is None, f"Expected no correction for {email!r}, got {suggestion}"
+
+    print("✓ Suggestion tests passed!")
+
+if __name__ == "__main__":
+    test_fused_categorize()
+    test_domain_rules()
+    test_bizrules_match_replaced_regex()
+    test_count_categories_parallel()
+    test_domain_verifier()
+    test_domain_verifier_sharing()
+    test_domain_verifier_cache()
+    test_edit_distance()
+    test_suggestions()
@@ -0,0 +1,289 @@
+"""
+Streaming aggregation of parsed access-log lines.
+
+AccessLogAggregator keeps, per (endpoint, method, status class), a request
+count and a LatencySketch of response times, so memory depends on the
+number of keys and not on the number of lines. Numeric path segments are
+folded into "{id}" so "/api/users/123" and "/api/users/456" share a key.
+Aggregators add up with +, which is what merging shards (the partial
+results of parallel_aggregate_log_file) and time windows comes down to:
+
+    total = parallel_aggregate_log_file(path, aggregate_access_log)
+    total.summary()
+"""
+
+import math
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from itertools import groupby
+from re import compile
+from typing import Any, NamedTuple
+
+# Relative error of the latency quantiles: 1% of the true value
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Response times at or below this many seconds all count as zero
+MIN_LATENCY = 1e-6
+
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+# An all-digit path segment, e.g. the "123" of "/api/users/123"
+_ID_SEGMENT_RE = compile(r"(?<=/)[0-9]+(?=/|$)")
+
+
+class LatencySketch:
+    """
+    Mergeable quantile sketch with bounded relative error (DDSketch-style).
+
+    A value v goes into bucket ceil(log(v) / log(gamma)), gamma = (1 + a) / (1 - a),
+    and a quantile is read back as the midpoint of its bucket, which is within
+    a relative error a of the true value. Buckets only exist for occupied
+    ranges, so from 1 microsecond to a day at a = 1% there are at most ~1,300
+    of them however many values are added. Merging adds bucket counts, so the
+    merge of two sketches equals the sketch of the combined values.
+    """
+
+    __slots__ = ("relative_accuracy", "_log_gamma", "buckets", "zero_count", "count", "total", "min", "max")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be between 0 and 1, got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= MIN_LATENCY:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        """Add the values of other to this sketch, in place."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        buckets = self.buckets
+        for index, count in other.buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "LatencySketch":
+        return LatencySketch(self.relative_accuracy).merge(self)
+
+    def quantile(self, q: float) -> float | None:
+        """Approximate q-quantile (0 <= q <= 1) of the added values; None if there are none."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        gamma = math.exp(self._log_gamma)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * gamma ** index / (gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Endpoint with its all-digit path segments replaced by "{id}", so ids do not multiply keys."""
+    return _ID_SEGMENT_RE.sub("{id}", endpoint)
+
+
+def status_class(status: int) -> str:
+    return f"{status // 100}xx"
+
+
+class AggregateKey(NamedTuple):
+    endpoint: str
+    method: str
+    status_class: str
+
+
+class AccessLogAggregator:
+    """
+    Counts and latency sketches of access-log lines per (endpoint, method, status class).
+
+    Feed it ACCESS_LOG tuples (timestamp, method, endpoint, status,
+    response_time) with update(), or single requests with add(). Error rates
+    are derived from the status classes: 5xx over all requests of the same
+    endpoint and method.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        normalize_endpoint: Callable[[str], str] = endpoint_template,
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.normalize_endpoint = normalize_endpoint
+        self.sketches: dict[AggregateKey, LatencySketch] = {}
+
+    def __len__(self) -> int:
+        return len(self.sketches)
+
+    def _sketch(self, key: AggregateKey) -> LatencySketch:
+        sketch = self.sketches.get(key)
+        if sketch is None:
+            sketch = self.sketches[key] = LatencySketch(self.relative_accuracy)
+        return sketch
+
+    def add(self, endpoint: str, method: str, status: int, response_time: float) -> None:
+        key = AggregateKey(self.normalize_endpoint(endpoint), method, status_class(status))
+        self._sketch(key).add(response_time)
+
+    def update(self, records: Iterable[tuple]) -> "AccessLogAggregator":
+        """Add ACCESS_LOG tuples, e.g. from iter_parse_log or parse_range."""
+        normalize_endpoint, sketches = self.normalize_endpoint, self.sketches
+        for _, method, endpoint, status, response_time in records:
+            key = (normalize_endpoint(endpoint), method, status_class(status))
+            sketch = sketches.get(key)
+            if sketch is None:
+                sketch = self._sketch(AggregateKey(*key))
+            sketch.add(response_time)
+        return self
+
+    def merge(self, other: "AccessLogAggregator") -> "AccessLogAggregator":
+        """Add the counts and sketches of other to this aggregator, in place."""
+        for key, sketch in other.sketches.items():
+            self._sketch(key).merge(sketch)
+        return self
+
+    def copy(self) -> "AccessLogAggregator":
+        return AccessLogAggregator(self.relative_accuracy, self.normalize_endpoint).merge(self)
+
+    def __add__(self, other: "AccessLogAggregator") -> "AccessLogAggregator":
+        return self.copy().merge(other)
+
+    def __iadd__(self, other: "AccessLogAggregator") -> "AccessLogAggregator":
+        return self.merge(other)
+
+    def rollup(self, key: AggregateKey | tuple[str, str, str]) -> LatencySketch:
+        """
+        Merged sketch of every key matching key, where None is a wildcard,
+        e.g. ("/health", None, None) for all requests to /health.
+        """
+        merged = LatencySketch(self.relative_accuracy)
+        for candidate, sketch in self.sketches.items():
+            if all(want is None or want == have for want, have in zip(key, candidate)):
+                merged.merge(sketch)
+        return merged
+
+    def summary(self, quantiles: Iterable[float] = SUMMARY_QUANTILES) -> list[dict[str, Any]]:
+        """One row per key with count, error rate, mean and latency quantiles, busiest first."""
+        quantiles = tuple(quantiles)
+        totals: dict[tuple[str, str], int] = {}
+        errors: dict[tuple[str, str], int] = {}
+        for key, sketch in self.sketches.items():
+            group = (key.endpoint, key.method)
+            totals[group] = totals.get(group, 0) + sketch.count
+            if key.status_class == "5xx":
+                errors[group] = errors.get(group, 0) + sketch.count
+
+        rows = []
+        for key, sketch in sorted(self.sketches.items(), key=lambda item: (-item[1].count, item[0])):
+            group = (key.endpoint, key.method)
+            row: dict[str, Any] = {
+                **key._asdict(),
+                "count": sketch.count,
+                "error_rate": errors.get(group, 0) / totals[group],
+                "mean": sketch.mean,
+            }
+            for q in quantiles:
+                row[f"p{q * 100:g}"] = sketch.quantile(q)
+            rows.append(row)
+        return rows
+
+
+def aggregate_access_log(records: Iterable[tuple]) -> AccessLogAggregator:
+    """Aggregate of ACCESS_LOG tuples; a picklable aggregate for parallel_aggregate_log_file."""
+    return AccessLogAggregator().update(records)
+
+
+class WindowedAggregator:
+    """
+    AccessLogAggregators per fixed time window of the log timestamps.
+
+    Windows are keyed by their start in seconds since the epoch (timestamps
+    are read as UTC). With max_windows set, only the most recent windows are
+    kept, bounding memory for a never-ending stream; lines that arrive for a
+    window older than all retained ones are dropped.
+    """
+
+    def __init__(self, window_seconds: int = 60, max_windows: int | None = None, **aggregator_options: Any):
+        if window_seconds < 1:
+            raise ValueError("window_seconds must be at least 1")
+        self.window_seconds = window_seconds
+        self.max_windows = max_windows
+        self.aggregator_options = aggregator_options
+        self.windows: dict[int, AccessLogAggregator] = {}
+
+    def _window(self, start: int) -> AccessLogAggregator:
+        window = self.windows.get(start)
+        if window is None:
+            window = self.windows[start] = AccessLogAggregator(**self.aggregator_options)
+            if self.max_windows is not None and len(self.windows) > self.max_windows:
+                del self.windows[min(self.windows)]
+        return window
+
+    def window_start(self, timestamp: str) -> int:
+        moment = datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc)
+        seconds = int(moment.timestamp())
+        return seconds - seconds % self.window_seconds
+
+    def update(self, records: Iterable[tuple]) -> "WindowedAggregator":
+        """Add ACCESS_LOG tuples to the windows of their timestamps, streaming."""
+        last = [None, None]  # timestamp, window start; logs repeat a timestamp many times
+
+        def window_of(record: tuple) -> int:
+            if record[0] != last[0]:
+                last[:] = record[0], self.window_start(record[0])
+            return last[1]
+
+        for start, records_in_window in groupby(records, key=window_of):
+            self._window(start).update(records_in_window)
+        return self
+
+    def merge(self, other: "WindowedAggregator") -> "WindowedAggregator":
+        if other.window_seconds != self.window_seconds:
+            raise ValueError("Cannot merge aggregators with different window sizes")
+        for start, aggregator in sorted(other.windows.items()):
+            self._window(start).merge(aggregator)
+        return self
+
+    def __add__(self, other: "WindowedAggregator") -> "WindowedAggregator":
+        merged = WindowedAggregator(self.window_seconds, self.max_windows, **self.aggregator_options)
+        return merged.merge(self).merge(other)
+
+    def combined(self, since: int | None = None, until: int | None = None) -> AccessLogAggregator:
+        """One aggregator over the windows starting in [since, until)."""
+        total = AccessLogAggregator(**self.aggregator_options)
+        for start, aggregator in self.windows.items():
+            if (since is None or start >= since) and (until is None or start < until):
+                total.merge(aggregator)
+        return total
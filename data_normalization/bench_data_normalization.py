@@ -0,0 +1,703 @@
+"""
+Benchmark suite for the data_normalization functions.
+
+Every suite case runs in a fresh process on seeded synthetic data and reports
+rows/sec, peak RSS and peak traced allocations; results are written as JSON
+so runs of different versions can be diffed. Run from the data_normalization
+directory:
+
+    python bench_data_normalization.py                       # 10K, 1M and 10M rows
+    python bench_data_normalization.py --sizes 10000 --cases emails/ --output new.json
+    python bench_data_normalization.py --compare-to old.json --output new.json
+    python bench_data_normalization.py --focused             # engine comparisons only
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable, Iterable
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from multiprocessing import get_context
+from time import perf_counter
+
+import normalize_columns
+from aggregate_access_log import aggregate_access_log
+from integrate_sources import CRM_MAPPING, SALES_MAPPING, integrate_sources
+from memoized_normalizer import MemoizedNormalizer
+from normalize_emails import normalize_emails
+from normalize_phone_number import normalize_phone_numbers, normalize_phone_numbers_e164
+from normalize_product_names import SUFFIX_REPLACEMENTS, SuffixReplacer, normalize_product_names
+from normalize_timestamps import normalize_timestamps
+from parallel_normalize import parallel_normalize
+from parallel_parse_log import count_values, parallel_aggregate_log_file, parallel_parse_log_file
+from parse_log_entries import ACCESS_LOG, parse_log_entries, parse_log_file
+from pipeline import composite_key, is_valid_product, product_load_pipeline, tag_source
+from resolve_entities import DEFAULT_THRESHOLD, deduplicate, name_key, similarity
+from surrogate_key_store import SurrogateKeyStore
+from surrogate_keys import SurrogateKeyGenerator, generate_composite_keys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = (10_000, 1_000_000, 10_000_000)
+DEFAULT_SEED = 42
+
+EMAIL_DOMAINS = ["gmail.com", "Yahoo.Com", "company.co.uk", "university.EDU", "sub.domain.org"]
+PHONE_FORMATS = ["({}) {}-{}", "{}-{}-{}", "{}.{}.{}", "+1 {} {} {}", "{}{}{}", "+1-{}-{}-{}", " ({}) {}-{} "]
+PRODUCT_NAMES = ["apple", "MICROSOFT", "google", "amazon.com", "tesla,", "meta platforms", "adobe systems", "oracle"]
+PRODUCT_CATEGORIES = ["Electronics", "Books", "Kitchen", "Office", "Sports"]
+PRODUCT_SUFFIXES = ["Inc.", "inc", "CORPORATION", "Incorporated", "LLC", "Corp", ""]
+LOG_METHODS = ["GET"] * 6 + ["POST"] * 2 + ["PUT", "DELETE"]
+LOG_ENDPOINTS = ["/api/users", "/api/orders", "/api/products", "/api/users/{}", "/api/orders/{}", "/health"]
+LOG_STATUSES = [200] * 85 + [201] * 5 + [404] * 6 + [500] * 4
+# European dates, the last format parse_timestamp used to try, plus occasional strays
+CRM_INDUSTRIES = ["Technology", "Retail", "Finance", "Healthcare", "Energy"]
+SALES_SECTORS = ["Tech", "Retail", "Financial", "Health", "Utilities"]
+TIMESTAMP_FORMATS = ["%d-%m-%Y %H:%M:%S"] * 97 + ["%Y-%m-%dT%H:%M:%SZ", "%Y/%m/%d %H:%M:%S", "%m/%d/%y %H:%M:%S"]
+
+
+def make_emails(n: int, seed: int = 42) -> list[str]:
+    """Mixed-quality synthetic addresses: roughly 60% valid, the rest malformed."""
+    rng = random.Random(seed)
+    letters = string.ascii_letters + string.digits
+    emails: list[str] = []
+    for _ in range(n):
+        local = "".join(rng.choices(letters, k=rng.randint(3, 12)))
+        domain = rng.choice(EMAIL_DOMAINS)
+        kind = rng.random()
+        if kind < 0.6:
+            emails.append(f"  {local}@{domain} ")
+        elif kind < 0.75:
+            emails.append(f"{local}.{domain}")
+        elif kind < 0.85:
+            emails.append(f"{local}@")
+        elif kind < 0.95:
+            emails.append(f"{local}@{domain.split('.')[0]}")
+        else:
+            emails.append(f"{local}@@{domain}")
+    return emails
+
+
+def make_phone_numbers(n: int, seed: int = 42) -> list[str]:
+    """Phone numbers in the mixed formats of test_data_normalize_phone_numbers.py, ~10% malformed."""
+    rng = random.Random(seed)
+    phones: list[str] = []
+    for _ in range(n):
+        area, exchange, line = rng.randint(200, 999), rng.randint(100, 999), rng.randint(0, 9999)
+        phone = rng.choice(PHONE_FORMATS).format(area, exchange, f"{line:04d}")
+        if rng.random() < 0.1:
+            phone = phone[:-2] if rng.random() < 0.5 else "not-a-phone-number"
+        phones.append(phone)
+    return phones
+
+
+def make_product_names(n: int, seed: int = 42) -> list[str]:
+    """Company-style product names with legal-entity suffixes and noisy casing."""
+    rng = random.Random(seed)
+    return [
+        f"  {rng.choice(PRODUCT_NAMES)} {rng.choice(PRODUCT_SUFFIXES)} " if rng.random() < 0.97 else " "
+        for _ in range(n)
+    ]
+
+
+def make_timestamps(n: int, seed: int = 42) -> list[str]:
+    """Timestamps of one mostly-European feed, ~2% unparseable."""
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1).timestamp()
+    timestamps: list[str] = []
+    for _ in range(n):
+        moment = datetime.fromtimestamp(start + rng.randrange(5 * 365 * 86_400))
+        timestamps.append(moment.strftime(rng.choice(TIMESTAMP_FORMATS)) if rng.random() < 0.98 else "not a date")
+    return timestamps
+
+
+def make_access_log_lines(n: int, seed: int = 42) -> list[str]:
+    """Access-log lines as in map_log_entry_parsing.py, with a newline like lines read from a file."""
+    rng = random.Random(seed)
+    start = datetime(2024, 6, 18).timestamp()
+    lines: list[str] = []
+    for i in range(n):
+        moment = datetime.fromtimestamp(start + i // 50).strftime("%Y-%m-%d %H:%M:%S")
+        endpoint = rng.choice(LOG_ENDPOINTS).format(rng.randint(1, 9999))
+        lines.append(
+            f"{moment} {rng.choice(LOG_METHODS)} {endpoint} {rng.choice(LOG_STATUSES)} {rng.expovariate(20):.3f}\n"
+        )
+    return lines
+
+
+def extract_metrics(lines: list[str]) -> list[dict]:
+    """The dict-per-line extract_metrics of map_log_entry_parsing.py, as a baseline."""
+    metrics = []
+    for log_entry in lines:
+        parts = log_entry.split()
+        metrics.append({
+            "timestamp": parts[0] + " " + parts[1],
+            "method": parts[2],
+            "endpoint": parts[3],
+            "status": int(parts[4]),
+            "response_time": float(parts[5]),
+        })
+    return metrics
+
+
+def make_source_records(n: int, seed: int = 42) -> list[dict]:
+    """Records of map_multi_source_data_integration.py: n // 2 from the CRM system, then the rest from Sales."""
+    rng = random.Random(seed)
+    records: list[dict] = []
+    for i in range(n // 2):
+        records.append({
+            "client_id": f"CRM{i:06d}",
+            "company_name": rng.choice(PRODUCT_NAMES).title(),
+            "revenue": rng.randrange(1_000, 1_000_000),
+            "industry": rng.choice(CRM_INDUSTRIES),
+        })
+    for i in range(n - n // 2):
+        records.append({
+            "customer_ref": f"SAL_{i:06d}",
+            "org_name": f"{rng.choice(PRODUCT_NAMES).title()} {rng.choice(PRODUCT_SUFFIXES)}".strip(),
+            "total_sales": f"{rng.randrange(1_000, 1_000_000):,}",
+            "sector": rng.choice(SALES_SECTORS),
+        })
+    return records
+
+
+def transform_crm_data(record: dict) -> dict:
+    return {
+        "id": record["client_id"],
+        "name": record["company_name"],
+        "revenue": record["revenue"],
+        "category": record["industry"],
+        "source": "CRM",
+    }
+
+
+def transform_sales_data(record: dict) -> dict:
+    return {
+        "id": record["customer_ref"],
+        "name": record["org_name"],
+        "revenue": int(record["total_sales"].replace(",", "")),
+        "category": record["sector"],
+        "source": "Sales",
+    }
+
+
+def integrate_hand_written(records: list[dict]) -> list[dict]:
+    """The hand-written transforms of map_multi_source_data_integration.py, as a baseline."""
+    half = len(records) // 2
+    return list(map(transform_crm_data, records[:half])) + list(map(transform_sales_data, records[half:]))
+
+
+def integrate_mapped(records: list[dict], output: str = "dict") -> list:
+    half = len(records) // 2
+    return integrate_sources([(CRM_MAPPING, records[:half]), (SALES_MAPPING, records[half:])], output)
+
+
+def make_company_records(n: int, seed: int = 42) -> list[dict]:
+    """Integrated records naming ~n / 3 companies, with varying legal suffixes and ~5% one-letter typos."""
+    rng = random.Random(seed)
+    companies = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 12))).title() for _ in range(max(1, n // 3))
+    ]
+    records: list[dict] = []
+    for i in range(n):
+        name = rng.choice(companies)
+        if rng.random() < 0.05:
+            position = rng.randrange(len(name))
+            name = name[:position] + rng.choice(string.ascii_lowercase) + name[position + 1:]
+        records.append({"id": f"R{i:07d}", "name": f"{name} {rng.choice(PRODUCT_SUFFIXES)}".strip()})
+    return records
+
+
+def deduplicate_all_pairs(records: list[dict], threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Number of fuzzy-matching key pairs found by comparing every distinct key with every other one."""
+    keys = list(dict.fromkeys(map(name_key, records)))
+    return sum(
+        bool(similarity(key, other, threshold)) for position, key in enumerate(keys) for other in keys[:position]
+    )
+
+
+def make_business_records(n: int, seed: int = 42) -> list[dict]:
+    """(customer_id, product_id) rows of map_dw_key_generation.py drawing from n // 20 distinct pairs, fresh strings per row."""
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(100_000), rng.randrange(10_000)) for _ in range(max(1, n // 20))]
+    records: list[dict] = []
+    for _ in range(n):
+        customer, product = rng.choice(pairs)
+        records.append({"customer_id": f"CUST{customer:06d}", "product_id": f"PROD{product:05d}"})
+    return records
+
+
+def encode_surrogate_keys(records: list[dict], output: str = "array"):
+    return SurrogateKeyGenerator().encode(records, output)
+
+
+def make_product_catalog(n: int, seed: int = 42) -> list[dict]:
+    """Product records of filter_valid_product_record.py, ~25% with a missing field or a price that is not positive."""
+    rng = random.Random(seed)
+    products: list[dict] = []
+    for i in range(n):
+        products.append({
+            "sku": f"PROD{i:07d}" if rng.random() < 0.97 else "",
+            "name": rng.choice(PRODUCT_NAMES).title() if rng.random() < 0.97 else "",
+            "price": rng.choice([round(rng.uniform(1, 2_000), 2)] * 8 + [0, None]),
+            "category": rng.choice(PRODUCT_CATEGORIES) if rng.random() < 0.97 else "",
+        })
+    return products
+
+
+def load_products_materialized(products: list[dict], sink: Callable = len):
+    """The steps of filter_valid_product_record.py, map_etl_source_tagging.py and map_dw_key_generation.py, one list each."""
+    valid_products = list(filter(is_valid_product, products))
+    tagged_products = list(map(lambda product: tag_source(product, "CATALOG"), valid_products))
+    return sink(list(map(composite_key, tagged_products)))
+
+
+def load_products_pipeline(products: list[dict], sink: Callable = len):
+    return product_load_pipeline(products, "CATALOG").sink(sink)
+
+
+def count_records(records: Iterable) -> int:
+    """A sink that looks at every record and keeps none, like writing them out."""
+    return sum(1 for _ in records)
+
+
+def make_suffix_rules(k: int, seed: int = 42) -> dict[str, str]:
+    """SUFFIX_REPLACEMENTS padded to k rules with synthetic title-cased legal-entity suffixes."""
+    rng = random.Random(seed)
+    rules = dict(SUFFIX_REPLACEMENTS)
+    while len(rules) < k:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))).title()
+        rules[word + rng.choice(["", ".", " Ltd", " Holdings"])] = word[:3]
+    return rules
+
+
+def make_zipf(values: list[str], n: int, s: float = 1.1, seed: int = 42) -> list[str]:
+    """n draws from values with Zipf(s) rank frequencies, so a few values dominate."""
+    rng = random.Random(seed)
+    weights = [1 / rank ** s for rank in range(1, len(values) + 1)]
+    return rng.choices(values, weights=weights, k=n)
+
+
+def time_rows(func: Callable[[list], object], data: list, repeat: int = 3) -> float:
+    """Best-of-repeat throughput of func(data), in rows per second."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func(data)
+        best = min(best, perf_counter() - start)
+    return len(data) / best if best else float("inf")
+
+
+def report(title: str, results: dict[str, float], baseline: str) -> None:
+    print(title)
+    for name, rows_per_sec in results.items():
+        speedup = rows_per_sec / results[baseline]
+        print(f"  {name:<24} {rows_per_sec:>14,.0f} rows/s  ({speedup:4.2f}x)")
+
+
+def bench_email_engines(n: int = 1_000_000) -> dict[str, float]:
+    data = make_emails(n)
+    results = {
+        engine: time_rows(lambda rows, engine=engine: normalize_emails(rows, engine=engine), data)
+        for engine in ("regex", "prefilter")
+    }
+    report(f"normalize_emails engines, {n:,} rows", results, baseline="regex")
+    return results
+
+
+def bench_phone_engines(n: int = 10_000_000) -> dict[str, float]:
+    data = make_phone_numbers(n)
+    results = {
+        engine: time_rows(lambda rows, engine=engine: normalize_phone_numbers(rows, engine=engine), data, repeat=1)
+        for engine in ("regex", "translate")
+    }
+    report(f"normalize_phone_numbers engines, {n:,} rows", results, baseline="regex")
+    return results
+
+
+def bench_suffix_engines(n: int = 200_000, rule_counts: tuple[int, ...] = (10, 100, 1000)) -> dict[str, float]:
+    data = make_product_names(n)
+    all_results: dict[str, float] = {}
+    for k in rule_counts:
+        rules = make_suffix_rules(k)
+        replacer = SuffixReplacer(rules)
+        results = {
+            f"sequential k={k}": time_rows(lambda rows: normalize_product_names(rows, rules), data, repeat=1),
+            f"single_pass k={k}": time_rows(
+                lambda rows: normalize_product_names(rows, replacer, engine="single_pass"), data, repeat=1
+            ),
+        }
+        report(f"normalize_product_names engines, {k} rules, {n:,} rows", results, baseline=f"sequential k={k}")
+        all_results.update(results)
+    return all_results
+
+
+def bench_memoized(n: int = 1_000_000, distinct: int = 100_000, maxsize: int = 10_000) -> dict[str, float]:
+    datasets = {
+        "emails": (make_zipf(make_emails(distinct), n), normalize_emails),
+        "product_names": (make_zipf(make_product_names(distinct), n), normalize_product_names),
+    }
+    all_results: dict[str, float] = {}
+    for kind, (data, normalizer) in datasets.items():
+        memoized = MemoizedNormalizer(kind, maxsize=maxsize)
+        results = {
+            f"{kind} plain": time_rows(normalizer, data, repeat=1),
+            f"{kind} memoized": time_rows(memoized, data, repeat=1),
+        }
+        report(f"{kind} Zipf input, {n:,} rows, LRU maxsize {maxsize:,}", results, baseline=f"{kind} plain")
+        print(f"  hit rate {memoized.hit_rate:.1%}")
+        all_results.update(results)
+    return all_results
+
+
+def bench_parallel_scaling(n: int = 1_000_000, max_workers: int | None = None) -> dict[str, float]:
+    max_workers = max_workers or os.cpu_count() or 1
+    # Powers of two up to max_workers, plus max_workers itself
+    worker_counts = sorted({1, max_workers, *(w for w in (2, 4, 8, 16, 32, 64) if w < max_workers)})
+    datasets = {
+        "emails": make_emails(n),
+        "phone_numbers": make_phone_numbers(n),
+        "product_names": make_product_names(n),
+    }
+    all_results: dict[str, float] = {}
+    for kind, data in datasets.items():
+        results = {
+            f"{kind} workers={workers}": time_rows(
+                lambda rows, kind=kind, workers=workers: parallel_normalize(kind, rows, workers=workers), data, repeat=1
+            )
+            for workers in worker_counts
+        }
+        report(f"parallel_normalize scaling, {kind}, {n:,} rows", results, baseline=f"{kind} workers=1")
+        all_results.update(results)
+    return all_results
+
+
+def bench_timestamp_engines(n: int = 1_000_000) -> dict[str, float]:
+    data = make_timestamps(n)
+    results = {
+        engine: time_rows(lambda rows, engine=engine: normalize_timestamps(rows, engine=engine), data, repeat=1)
+        for engine in ("strptime", "sniffing")
+    }
+    if normalize_columns.np is not None:
+        column = normalize_columns.as_string_array(data)
+        results["column"] = time_rows(normalize_columns.parse_timestamp_column, column, repeat=1)
+    report(f"normalize_timestamps engines, {n:,} rows", results, baseline="strptime")
+    return results
+
+
+def bench_log_file(n: int = 5_000_000) -> dict[str, float]:
+    """Lines/sec of streaming a log file from disk, which also counts reading and decoding it."""
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "access.log")
+        with open(path, "w", encoding="utf-8") as log_file:
+            for start in range(0, n, 1_000_000):
+                log_file.writelines(make_access_log_lines(min(1_000_000, n - start), seed=start))
+        size = os.path.getsize(path)
+        workers = os.cpu_count() or 1
+        count_statuses = partial(count_values, position=ACCESS_LOG.field_names.index("status"))
+        runs = {
+            "file tuple": lambda: sum(1 for _ in parse_log_file(path, ACCESS_LOG)),
+            "file record": lambda: sum(1 for _ in parse_log_file(path, ACCESS_LOG, "record")),
+            "mmap in-process": lambda: sum(1 for _ in parallel_parse_log_file(path, workers=1)),
+            f"mmap pool workers={workers}": lambda: sum(1 for _ in parallel_parse_log_file(path, workers=workers)),
+            f"mmap aggregate workers={workers}": lambda: sum(
+                parallel_aggregate_log_file(path, count_statuses, workers=workers).values()
+            ),
+        }
+        for name, run in runs.items():
+            start = perf_counter()
+            count = run()
+            results[name] = count / (perf_counter() - start)
+        report(f"parse_log_file, {n:,} lines, {size / 2 ** 20:,.0f} MiB", results, baseline="file tuple")
+        print(f"  {size / 2 ** 20 / (n / results['file tuple']):.0f} MiB/s")
+    return results
+
+
+def bench_integration(n: int = 1_000_000) -> dict[str, float]:
+    data = make_source_records(n)
+    results = {
+        "hand_written": time_rows(integrate_hand_written, data),
+        "mapped dict": time_rows(integrate_mapped, data),
+        "mapped tuple": time_rows(partial(integrate_mapped, output="tuple"), data),
+    }
+    report(f"integrate_sources, {n:,} records", results, baseline="hand_written")
+    return results
+
+
+def bench_entity_resolution(n: int = 3_000, large_n: int = 300_000) -> dict[str, float]:
+    """Fuzzy deduplication with blocking against the all-pairs comparison it avoids."""
+    data = make_company_records(n)
+    results = {
+        "all_pairs": time_rows(deduplicate_all_pairs, data, repeat=1),
+        "blocked": time_rows(deduplicate, data, repeat=1),
+        "exact only": time_rows(partial(deduplicate, threshold=None), data, repeat=1),
+    }
+    report(f"deduplicate, {n:,} records", results, baseline="all_pairs")
+    large = make_company_records(large_n)
+    results[f"blocked {large_n:,}"] = time_rows(deduplicate, large, repeat=1)
+    print(f"  blocked at {large_n:,} records: {results[f'blocked {large_n:,}']:,.0f} rows/s")
+    return results
+
+
+def bench_surrogate_keys(n: int = 1_000_000) -> dict[str, float]:
+    """Building composite key strings against encoding surrogate IDs, and counting rows per key with each."""
+    data = make_business_records(n)
+    results = {
+        "composite strings": time_rows(generate_composite_keys, data),
+        "surrogate array('q')": time_rows(encode_surrogate_keys, data),
+    }
+    keys = SurrogateKeyGenerator()
+    keys.encode(data)
+    results["surrogate, known keys"] = time_rows(keys.encode, data)
+    report(f"surrogate keys, {n:,} rows", results, baseline="composite strings")
+
+    strings, ids = generate_composite_keys(data), keys.encode(data, "numpy" if normalize_columns.np else "array")
+    counts = {"Counter(strings)": time_rows(Counter, strings), "Counter(ids)": time_rows(Counter, ids)}
+    if normalize_columns.np is not None:
+        counts["bincount(ids)"] = time_rows(normalize_columns.np.bincount, ids)
+    report("  rows per key downstream", counts, baseline="Counter(strings)")
+    return results | counts
+
+
+def bench_key_store(n: int = 1_000_000, loads: int = 5) -> dict[str, float]:
+    """Incremental loads into a SurrogateKeyStore, and its cold start against reloading a saved generator."""
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        store = SurrogateKeyStore(os.path.join(directory, "store"))
+        generator = SurrogateKeyGenerator()
+        for load in range(loads):
+            # Each seed draws its own n // 20 pairs, so every load grows the store
+            data = make_business_records(n, seed=load)
+            results[f"load {load + 1}"] = time_rows(store.lookup_or_insert, data, repeat=1)
+            generator.encode(data)
+        report(f"SurrogateKeyStore, {loads} loads of {n:,} rows", results, baseline="load 1")
+
+        generator.save(os.path.join(directory, "keys.csv"))
+        start = perf_counter()
+        SurrogateKeyGenerator.load(os.path.join(directory, "keys.csv"))
+        results["cold start csv"] = perf_counter() - start
+        start = perf_counter()
+        SurrogateKeyStore(os.path.join(directory, "store"))
+        results["cold start store"] = perf_counter() - start
+        print(
+            f"  cold start with {len(store):,} keys: {results['cold start csv'] * 1000:,.1f} ms from CSV,"
+            f" {results['cold start store'] * 1000:,.2f} ms mapping the store"
+        )
+    return results
+
+
+def bench_pipeline(n: int = 1_000_000) -> dict[str, float]:
+    """Materialized steps against the fused pipeline, into a list and into a streaming sink."""
+    data = make_product_catalog(n)
+    results = {
+        "materialized -> list": time_rows(partial(load_products_materialized, sink=list), data),
+        "pipeline -> list": time_rows(partial(load_products_pipeline, sink=list), data),
+        "materialized -> stream": time_rows(partial(load_products_materialized, sink=count_records), data),
+        "pipeline -> stream": time_rows(partial(load_products_pipeline, sink=count_records), data),
+    }
+    report(f"product load, {n:,} records", results, baseline="materialized -> list")
+    for name, load in (("materialized", load_products_materialized), ("pipeline", load_products_pipeline)):
+        tracemalloc.start()
+        load(data, sink=count_records)
+        print(f"  {name} -> stream peak alloc {tracemalloc.get_traced_memory()[1] / 2 ** 20:,.1f} MiB")
+        tracemalloc.stop()
+    return results
+
+
+def run_focused() -> None:
+    bench_email_engines()
+    bench_phone_engines()
+    bench_timestamp_engines()
+    bench_log_file()
+    bench_integration()
+    bench_entity_resolution()
+    bench_surrogate_keys()
+    if normalize_columns.np is not None:
+        bench_key_store()
+    bench_pipeline()
+    bench_suffix_engines()
+    bench_memoized()
+    bench_parallel_scaling()
+
+
+# name -> (seeded data generator, untimed preparation or None, timed function)
+SuiteCase = tuple[Callable[[int, int], list[str]], Callable | None, Callable]
+
+SUITE_CASES: dict[str, SuiteCase] = {
+    "emails/regex": (make_emails, None, partial(normalize_emails, engine="regex")),
+    "emails/prefilter": (make_emails, None, partial(normalize_emails, engine="prefilter")),
+    # A fresh cache per call, so repeated timing runs do not start warm
+    "emails/memoized": (make_emails, None, lambda rows: MemoizedNormalizer("emails")(rows)),
+    "phone_numbers/regex": (make_phone_numbers, None, partial(normalize_phone_numbers, engine="regex")),
+    "phone_numbers/translate": (make_phone_numbers, None, partial(normalize_phone_numbers, engine="translate")),
+    "phone_numbers/e164": (make_phone_numbers, None, normalize_phone_numbers_e164),
+    "product_names/sequential": (make_product_names, None, normalize_product_names),
+    "product_names/single_pass": (make_product_names, None, partial(normalize_product_names, engine="single_pass")),
+    "timestamps/strptime": (make_timestamps, None, partial(normalize_timestamps, engine="strptime")),
+    "timestamps/sniffing": (make_timestamps, None, partial(normalize_timestamps, engine="sniffing")),
+    "logs/extract_metrics": (make_access_log_lines, None, extract_metrics),
+    "logs/tuple": (make_access_log_lines, None, parse_log_entries),
+    "logs/record": (make_access_log_lines, None, partial(parse_log_entries, output="record")),
+    "logs/aggregate": (make_access_log_lines, parse_log_entries, aggregate_access_log),
+    "integration/hand_written": (make_source_records, None, integrate_hand_written),
+    "integration/mapped": (make_source_records, None, integrate_mapped),
+    "entities/exact": (make_company_records, None, partial(deduplicate, threshold=None)),
+    "entities/blocked": (make_company_records, None, deduplicate),
+    "keys/composite_strings": (make_business_records, None, generate_composite_keys),
+    "keys/surrogate": (make_business_records, None, encode_surrogate_keys),
+    "pipeline/materialized": (make_product_catalog, None, partial(load_products_materialized, sink=count_records)),
+    "pipeline/fused": (make_product_catalog, None, partial(load_products_pipeline, sink=count_records)),
+}
+if normalize_columns.np is not None:
+    SUITE_CASES.update({
+        "emails/column": (make_emails, normalize_columns.as_string_array, normalize_columns.normalize_email_column),
+        "phone_numbers/column": (
+            make_phone_numbers, normalize_columns.as_string_array, normalize_columns.normalize_phone_number_column
+        ),
+        "product_names/column": (
+            make_product_names, normalize_columns.as_string_array, normalize_columns.normalize_product_name_column
+        ),
+        "timestamps/column": (make_timestamps, normalize_columns.as_string_array, normalize_columns.parse_timestamp_column),
+    })
+
+
+def peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def run_case(name: str, rows: int, seed: int = DEFAULT_SEED, trace: bool = True, repeat: int = 3) -> dict:
+    """Time one suite case; meant to run in a fresh process so peak RSS is its own."""
+    make_data, prepare, func = SUITE_CASES[name]
+    data = make_data(rows, seed)
+    if prepare is not None:
+        data = prepare(data)
+    gc.collect()
+    rss_before = peak_rss_bytes()
+
+    rows_per_sec = time_rows(func, data, repeat)
+
+    peak_alloc = None
+    if trace:
+        # A second, traced run: tracemalloc slows the code down too much to time it
+        tracemalloc.start()
+        func(data)
+        peak_alloc = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "case": name,
+        "rows": rows,
+        "seed": seed,
+        "repeat": repeat,
+        "rows_per_sec": rows_per_sec,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "rss_before_bytes": rss_before,
+        "peak_alloc_bytes": peak_alloc,
+    }
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    cases: list[str] | None = None,
+    seed: int = DEFAULT_SEED,
+    trace: bool = True,
+    repeat: int = 3,
+) -> dict:
+    results = []
+    spawn = get_context("spawn")
+    for rows in sizes:
+        for name in cases or SUITE_CASES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                result = pool.submit(run_case, name, rows, seed, trace, repeat).result()
+            results.append(result)
+            print(format_result(result))
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": getattr(normalize_columns.np, "__version__", None),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _mib(value: int | None) -> str:
+    return f"{value / 2 ** 20:8.1f} MiB" if value is not None else "     n/a    "
+
+
+def format_result(result: dict) -> str:
+    return (
+        f"{result['case']:<28} {result['rows']:>11,} rows {result['rows_per_sec']:>13,.0f} rows/s"
+        f"  peak RSS {_mib(result['peak_rss_bytes'])}  peak alloc {_mib(result['peak_alloc_bytes'])}"
+    )
+
+
+def diff_results(old: dict, new: dict) -> list[str]:
+    """One line per case and size present in both runs, with the rows/sec change."""
+    old_by_key = {(r["case"], r["rows"]): r for r in old["results"]}
+    lines = []
+    for result in new["results"]:
+        previous = old_by_key.get((result["case"], result["rows"]))
+        if previous is None or not previous["rows_per_sec"] or not result["rows_per_sec"]:
+            continue
+        change = result["rows_per_sec"] / previous["rows_per_sec"] - 1
+        lines.append(
+            f"{result['case']:<28} {result['rows']:>11,} rows "
+            f"{previous['rows_per_sec']:>13,.0f} -> {result['rows_per_sec']:>13,.0f} rows/s ({change:+.1%})"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", help="case names or prefixes, e.g. emails/ or phone_numbers/regex")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the best one is reported")
+    parser.add_argument("--no-trace", action="store_true", help="skip the tracemalloc allocation pass")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare-to", help="earlier JSON result file to diff against")
+    parser.add_argument("--focused", action="store_true", help="run the engine comparison benchmarks instead")
+    args = parser.parse_args(argv)
+
+    if args.focused:
+        run_focused()
+        return
+    cases = None
+    if args.cases:
+        cases = [name for name in SUITE_CASES if any(name.startswith(prefix) for prefix in args.cases)]
+        if not cases:
+            parser.error(f"no suite case matches {args.cases}; available: {', '.join(SUITE_CASES)}")
+
+    run = run_suite(tuple(args.sizes), cases, args.seed, trace=not args.no_trace, repeat=args.repeat)
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(run, output, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare_to:
+        with open(args.compare_to, encoding="utf-8") as previous:
+            print(f"\nChange since {args.compare_to}:")
+            print("\n".join(diff_results(json.load(previous), run)))
+
+
+if __name__ == "__main__":
+    main()
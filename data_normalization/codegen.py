@@ -0,0 +1,43 @@
+"""
+Shared scaffolding of the modules that compile a declarative schema into a
+generated Python function: parse_log_entries, integrate_sources and
+pipeline. Each builds the function's source itself; the checks, the
+converter names the source refers to and the exec step live here.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+
+def check_output(output: str, outputs: tuple[str, ...]) -> None:
+    if output not in outputs:
+        raise ValueError(f"Unknown output {output!r}, expected one of {list(outputs)}")
+
+
+def check_field_names(owner: str, names: tuple[str, ...]) -> None:
+    """At least one field and no duplicates; owner names the schema in errors, e.g. "Schema 'access_log'"."""
+    if not names:
+        raise ValueError(f"{owner} has no fields")
+    if len(set(names)) != len(names):
+        raise ValueError(f"{owner} has duplicate field names")
+
+
+def converter_namespace(fields: Iterable[Any]) -> dict[str, Any]:
+    """The converter of each field that has one, as _convert<position> for the generated source."""
+    return {
+        f"_convert{position}": field.converter
+        for position, field in enumerate(fields)
+        if field.converter is not None
+    }
+
+
+def compile_function(source: str, filename: str, namespace: dict[str, Any], name: str):
+    """
+    Execute source in namespace and return its function name, with the
+    source kept in the __source__ attribute. Other functions defined by
+    source stay in namespace.
+    """
+    exec(compile(source, filename, "exec"), namespace)
+    function = namespace[name]
+    function.__source__ = source
+    return function
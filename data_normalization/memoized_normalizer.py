@@ -0,0 +1,60 @@
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+
+from normalize_emails import normalize_email
+from normalize_phone_number import normalize_phone_number
+from normalize_product_names import normalize_product_name
+
+# Per-value normalizers; each returns None for rows that are dropped
+VALUE_NORMALIZERS: dict[str, Callable[[str], str | None]] = {
+    "emails": normalize_email,
+    "phone_numbers": normalize_phone_number,
+    "product_names": normalize_product_name,
+}
+
+DEFAULT_MAXSIZE = 100_000
+
+
+class MemoizedNormalizer:
+    """
+    Normalizer with a bounded LRU cache in front of the per-value step.
+
+    Pays off on repetitive columns, where a small set of distinct values
+    covers most rows: repeats cost one dict lookup instead of the full
+    strip/lower/regex or strip/title/replace work.
+    """
+
+    def __init__(self, kind: str, maxsize: int = DEFAULT_MAXSIZE):
+        if kind not in VALUE_NORMALIZERS:
+            raise ValueError(f"Unknown kind {kind!r}, expected one of {sorted(VALUE_NORMALIZERS)}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.kind = kind
+        self.maxsize = maxsize
+        self._normalize_value = lru_cache(maxsize=maxsize)(VALUE_NORMALIZERS[kind])
+
+    def iter_normalize(self, data: Iterable[str]) -> Iterator[str]:
+        for normalized in map(self._normalize_value, data):
+            if normalized is not None:
+                yield normalized
+
+    def __call__(self, data: Iterable[str]) -> list[str]:
+        return list(self.iter_normalize(data))
+
+    @property
+    def hits(self) -> int:
+        return self._normalize_value.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        return self._normalize_value.cache_info().misses
+
+    @property
+    def hit_rate(self) -> float:
+        info = self._normalize_value.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
+
+    def cache_clear(self) -> None:
+        """Drop cached values and reset the hit/miss counters."""
+        self._normalize_value.cache_clear()
@@ -0,0 +1,32 @@
+from enum import IntEnum
+
+
+class NormalizationReport:
+    """
+    Accepted values plus one reject-reason code per input row.
+
+    Codes are stored one byte per row in a bytearray (0 means accepted), so
+    a report over millions of rows costs about a byte per row on top of the
+    accepted values, and counting a reason is a single C-level scan.
+    """
+
+    def __init__(self, reasons_enum: type[IntEnum]):
+        self.reasons_enum = reasons_enum
+        self.accepted: list[str] = []
+        self.reasons = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.reasons)
+
+    def reason(self, row: int) -> IntEnum:
+        return self.reasons_enum(self.reasons[row])
+
+    def counts(self) -> dict[str, int]:
+        """Number of rows per reason name, including "accepted"."""
+        return {member.name.lower(): self.reasons.count(member.value) for member in self.reasons_enum}
+
+    def rejected_rows(self, reason: IntEnum | None = None) -> list[int]:
+        """Input row indices rejected for reason, or for any reason if None."""
+        if reason is not None:
+            return [row for row, code in enumerate(self.reasons) if code == reason]
+        return [row for row, code in enumerate(self.reasons) if code]
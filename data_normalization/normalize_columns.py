@@ -0,0 +1,253 @@
+"""
+Columnar variants of the data_normalization functions.
+
+Each function takes an array-like string column (list, numpy array, or a
+pyarrow Array/ChunkedArray) and returns a NormalizedColumn: the cleaned
+values plus a boolean validity mask, both aligned row-for-row with the
+input. Invalid rows are kept as "" (NaT for timestamps) instead of being
+dropped, so the result lines up with the other columns of the same table.
+
+Columns are held as fixed-width numpy unicode arrays. Besides numpy.char
+calls for strip/lower/title/replace, validation works on the code point
+matrix (rows x width, uint32) of a block of rows, so there is no
+per-row Python work except for the rare rows outside ASCII/Latin-1, which
+go through the per-value normalizers. numpy is imported lazily so the rest
+of the package does not depend on it.
+"""
+
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from normalize_emails import EMAIL_RE
+from normalize_phone_number import normalize_phone_number
+from normalize_product_names import SUFFIX_REPLACEMENTS
+from normalize_timestamps import DEFAULT_SAMPLE_SIZE, TimestampNormalizer, parse_strptime, timestamp_format
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# Rows per block, bounding the size of the rows x width code point matrices
+BLOCK_ROWS = 65_536
+
+
+class NormalizedColumn(NamedTuple):
+    values: Any  # numpy unicode array, "" where valid is False
+    valid: Any  # numpy bool array
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("normalize_columns requires numpy: pip install numpy")
+
+
+def as_string_array(column: Iterable[str | None]) -> Any:
+    """Fixed-width numpy unicode array of column; nulls become ""."""
+    _require_numpy()
+    if hasattr(column, "to_numpy") and not isinstance(column, np.ndarray):
+        try:
+            column = column.to_numpy(zero_copy_only=False)  # pyarrow
+        except TypeError:
+            column = column.to_numpy()
+    array = np.asarray(column)
+    if array.dtype == object:
+        array = np.where(np.equal(array, None), "", array)
+    if array.dtype.kind != "U":
+        array = array.astype(str)
+    return array
+
+
+def code_points(array: Any) -> Any:
+    """(rows, width) uint32 view of a fixed-width unicode array; padding is 0."""
+    width = max(array.dtype.itemsize // 4, 1)
+    return np.ascontiguousarray(array).view(np.uint32).reshape(len(array), width)
+
+
+def _ascii_table(chars: str) -> Any:
+    table = np.zeros(128, dtype=bool)
+    table[[ord(char) for char in chars]] = True
+    return table
+
+
+_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_WORD = _LETTERS + "0123456789_"
+
+
+def _email_block(emails: Any) -> Any:
+    codes = code_points(emails)
+    width = codes.shape[1]
+    length = np.char.str_len(emails)
+    positions = np.arange(width)
+
+    is_at = codes == 64
+    at_pos = is_at.argmax(axis=1)
+    is_dot = codes == 46
+    last_dot = width - 1 - is_dot[:, ::-1].argmax(axis=1)
+
+    # The pattern, piece by piece: one "@" after a non-empty local part, a
+    # non-empty domain, then a dot and a TLD of two or more ASCII letters.
+    valid = (
+        (is_at.sum(axis=1) == 1)
+        & (at_pos >= 1)
+        & is_dot.any(axis=1)
+        & (last_dot > at_pos + 1)
+        & (length - last_dot - 1 >= 2)
+    )
+
+    # Region of every position: 0 local, 1 "@", 2 domain, 3 last dot, 4 TLD,
+    # 5 padding; one lookup then checks each character against its region.
+    at_pos, last_dot, length = at_pos[:, None], last_dot[:, None], length[:, None]
+    region = (
+        (positions >= at_pos).view(np.int8)
+        + (positions > at_pos)
+        + (positions >= last_dot)
+        + (positions > last_dot)
+        + (positions >= length)
+    )
+    valid &= _ALLOWED[region, np.minimum(codes, 127)].all(axis=1)
+
+    # \w also accepts non-ASCII letters and digits; let the regex decide those rows
+    non_ascii = (codes >= 128).any(axis=1)
+    if non_ascii.any():
+        valid[non_ascii] = [EMAIL_RE.fullmatch(email) is not None for email in emails[non_ascii]]
+    return valid
+
+
+def _blocks(array: Any) -> Iterable[slice]:
+    for start in range(0, len(array), BLOCK_ROWS):
+        yield slice(start, start + BLOCK_ROWS)
+
+
+def normalize_email_column(column: Iterable[str | None]) -> NormalizedColumn:
+    """Columnar normalize_emails: lowercased, stripped emails and their mask."""
+    emails = np.char.lower(np.char.strip(as_string_array(column)))
+    valid = np.zeros(len(emails), dtype=bool)
+    for block in _blocks(emails):
+        valid[block] = _email_block(emails[block])
+    return NormalizedColumn(np.where(valid, emails, ""), valid)
+
+
+def _phone_block(phones: Any, digits_out: Any, valid_out: Any) -> None:
+    codes = code_points(phones).copy()
+    if codes.shape[1] >= 2:
+        # Drop the "1" of a leading "+1"; the "+" is not a digit anyway
+        plus_one = (codes[:, 0] == 43) & (codes[:, 1] == 49)
+        codes[plus_one, 1] = 0
+    is_digit = (codes >= 48) & (codes <= 57)
+    valid = is_digit.sum(axis=1) == 10
+    digits = codes[valid][is_digit[valid]].reshape(-1, 10)
+    digits_out[valid] = np.ascontiguousarray(digits).view("<U10").reshape(-1)
+    valid_out[:] = valid
+
+    # \D keeps non-ASCII decimal digits; only rows beyond Latin-1 can hold
+    # those, so let the per-value normalizer decide them
+    wide = (codes >= 256).any(axis=1)
+    if wide.any():
+        normalized = [normalize_phone_number(phone) for phone in phones[wide]]
+        digits_out[wide] = [phone or "" for phone in normalized]
+        valid_out[wide] = [phone is not None for phone in normalized]
+
+
+def normalize_phone_number_column(column: Iterable[str | None]) -> NormalizedColumn:
+    """Columnar normalize_phone_numbers: ten-digit values and their mask."""
+    phones = as_string_array(column)
+    digits = np.zeros(len(phones), dtype="<U10")
+    valid = np.zeros(len(phones), dtype=bool)
+    for block in _blocks(phones):
+        _phone_block(phones[block], digits[block], valid[block])
+    return NormalizedColumn(digits, valid)
+
+
+def normalize_product_name_column(
+    column: Iterable[str | None], replacements: dict[str, str] = SUFFIX_REPLACEMENTS
+) -> NormalizedColumn:
+    """Columnar normalize_product_names, applying the rules in dictionary order."""
+    names = np.char.title(np.char.strip(as_string_array(column)))
+    # np.char.replace cannot size its output for an empty column
+    for original, replacement in replacements.items() if len(names) else ():
+        names = np.char.replace(names, original, replacement)
+    valid = np.char.str_len(names) >= 2
+    return NormalizedColumn(np.where(valid, names, ""), valid)
+
+
+def _field_values(codes: Any, field: slice | None, valid: Any) -> Any:
+    """Integer value of a fixed-width digit field of every row; clears valid for non-digits."""
+    if field is None:
+        return np.zeros(len(codes), dtype=np.int64)
+    # uint32 wraps below "0", so one comparison checks both ends of the range
+    digits = codes[:, field] - np.uint32(48)
+    valid &= (digits <= 9).all(axis=1)
+    weights = (10 ** np.arange(digits.shape[1] - 1, -1, -1)).astype(np.uint32)
+    return (digits @ weights).astype(np.int64)
+
+
+def _timestamp_block(stamps: Any, fmt: Any, values_out: Any, fallback_out: Any) -> None:
+    codes = code_points(stamps)
+    length = np.char.str_len(stamps)
+    # strptime is more lenient than fixed offsets (" 9" for "09", non-ASCII
+    # digits, literals in any case), so it gets a look at every row rejected here
+    fallback_out[:] = length > 0
+    if codes.shape[1] < fmt.width:
+        return
+    valid = length == fmt.width
+    for offset, char in fmt.separators:
+        valid &= codes[:, offset] == ord(char)
+    year, month, day, hour, minute, second = (_field_values(codes, field, valid) for field in fmt.fields)
+    if fmt.short_year:
+        year += np.where(year >= 69, 1900, 2000)  # strptime's %y rule
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (hour < 24) & (minute < 60) & (second < 60)
+
+    # Day arithmetic on datetime64[D]; a day past the end of its month
+    # (February 30) lands in the next month and is rejected
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype("datetime64[M]")
+    dates = months.astype("datetime64[D]") + np.where(valid, day - 1, 0)
+    valid &= dates.astype("datetime64[M]") == months
+    values = dates.astype("datetime64[s]") + (hour * 3600 + minute * 60 + second)
+    values_out[valid] = values[valid]
+    fallback_out[valid] = False
+
+
+def parse_timestamp_column(column: Iterable[str | None], strptime_format: str | None = None) -> NormalizedColumn:
+    """
+    Columnar timestamp parsing into a datetime64[s] array, NaT where a row does not parse.
+
+    strptime_format declares the format of the column; if None, it is sniffed
+    from the first non-empty values among normalize_timestamps.DEFAULT_FORMATS.
+    Rows of the declared width are parsed by slicing fields out of the code
+    point matrix; only the rows that rejects (e.g. "2024-1-5" without zero
+    padding, or plain garbage) go through strptime, so the result is the
+    same as parsing each row with the format, at per-row cost only for
+    malformed rows.
+    """
+    stamps = np.char.strip(as_string_array(column))
+    if strptime_format is None:
+        sample = [stamp for stamp in stamps[:DEFAULT_SAMPLE_SIZE * 10].tolist() if stamp][:DEFAULT_SAMPLE_SIZE]
+        strptime_format = TimestampNormalizer().sniff(sample)
+    values = np.full(len(stamps), np.datetime64("NaT"), dtype="datetime64[s]")
+    if strptime_format is None or not len(stamps):
+        return NormalizedColumn(values, np.zeros(len(stamps), dtype=bool))
+
+    fmt = timestamp_format(strptime_format)
+    if fmt.width is None:
+        fallback = np.char.str_len(stamps) > 0
+    else:
+        fallback = np.zeros(len(stamps), dtype=bool)
+        for block in _blocks(stamps):
+            _timestamp_block(stamps[block], fmt, values[block], fallback[block])
+    for row in np.flatnonzero(fallback):
+        parsed = parse_strptime(str(stamps[row]), fmt)
+        if parsed is not None:
+            values[row] = np.datetime64(parsed.replace(" ", "T"))
+    return NormalizedColumn(values, ~np.isnat(values))
+
+
+if np is not None:
+    _ALLOWED = np.stack([
+        _ascii_table(_WORD + ".+-"),  # local part
+        _ascii_table("@"),
+        _ascii_table(_WORD + ".-"),  # domain
+        _ascii_table("."),
+        _ascii_table(_LETTERS),  # TLD
+        np.ones(128, dtype=bool),  # padding
+    ])
@@ -1,10 +1,131 @@
-from re import fullmatch
+from collections.abc import Iterable, Iterator
+from enum import IntEnum
+from re import compile, fullmatch
 
-def normalize_emails(data: list[str]) -> list[str]:
-    normalized_emails: list[str] = []
-    email_pattern = "^[\w.+-]+@[\w.-]+\.[A-Za-z]{2,}$" # type: ignore
+from normalization_report import NormalizationReport
+
+EMAIL_PATTERN = r"^[\w.+-]+@[\w.-]+\.[A-Za-z]{2,}$"
+
+# Compiled once at import so the hot loop skips the re module cache lookup
+EMAIL_RE = compile(EMAIL_PATTERN)
+_email_fullmatch = EMAIL_RE.fullmatch
+
+# Shortest string the pattern can accept, e.g. "a@b.co"
+MIN_EMAIL_LENGTH = 6
+
+# Large read/write buffers so file-to-file runs are not dominated by syscalls
+FILE_BUFFER_SIZE = 1 << 20
+
+
+def _iter_regex(data: Iterable[str]) -> Iterator[str]:
     for email in data:
         email_cleaned = email.strip().lower()
-        if fullmatch(email_pattern, email_cleaned):
-            normalized_emails.append(email_cleaned)
-    return normalized_emails
\ No newline at end of file
+        if fullmatch(EMAIL_PATTERN, email_cleaned):
+            yield email_cleaned
+
+
+def normalize_email(email: str) -> str | None:
+    """Clean and validate one email; None if it is invalid."""
+    email_cleaned = email.strip().lower()
+    # Cheap structural checks reject most invalid rows before the regex runs;
+    # each one is implied by the pattern, so the result is identical.
+    if len(email_cleaned) < MIN_EMAIL_LENGTH:
+        return None
+    at = email_cleaned.find("@")
+    if at < 1 or at != email_cleaned.rfind("@"):
+        return None
+    if email_cleaned.find(".", at + 2) == -1:
+        return None
+    return email_cleaned if _email_fullmatch(email_cleaned) else None
+
+
+def _iter_prefilter(data: Iterable[str]) -> Iterator[str]:
+    for email in data:
+        email_cleaned = normalize_email(email)
+        if email_cleaned is not None:
+            yield email_cleaned
+
+
+ENGINES = {
+    "regex": _iter_regex,
+    "prefilter": _iter_prefilter,
+}
+
+
+def iter_normalize_emails(data: Iterable[str], engine: str = "prefilter") -> Iterator[str]:
+    """Lazily yield cleaned, valid emails; memory use does not grow with the input."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {sorted(ENGINES)}")
+    return ENGINES[engine](data)
+
+
+def normalize_emails(data: list[str], engine: str = "prefilter") -> list[str]:
+    return list(iter_normalize_emails(data, engine))
+
+
+class EmailReason(IntEnum):
+    ACCEPTED = 0
+    EMPTY = 1
+    MISSING_AT = 2
+    MULTIPLE_AT = 3
+    MISSING_LOCAL_PART = 4
+    MISSING_DOMAIN = 5
+    INVALID_FORMAT = 6
+    MISSING_TLD = 7
+
+
+def email_reason(email_cleaned: str) -> EmailReason:
+    """Why a cleaned email is rejected, or ACCEPTED; the same checks as normalize_email."""
+    if not email_cleaned:
+        return EmailReason.EMPTY
+    at = email_cleaned.find("@")
+    if at == -1:
+        return EmailReason.MISSING_AT
+    if at != email_cleaned.rfind("@"):
+        return EmailReason.MULTIPLE_AT
+    if at == 0:
+        return EmailReason.MISSING_LOCAL_PART
+    if email_cleaned.find(".", at + 2) == -1:
+        # "user@" and "user@.com" lack the domain name, "user@domain" only its TLD
+        if at + 1 == len(email_cleaned) or email_cleaned[at + 1] == ".":
+            return EmailReason.MISSING_DOMAIN
+        return EmailReason.MISSING_TLD
+    if len(email_cleaned) < MIN_EMAIL_LENGTH or not _email_fullmatch(email_cleaned):
+        return EmailReason.INVALID_FORMAT
+    return EmailReason.ACCEPTED
+
+
+def normalize_emails_with_reasons(data: Iterable[str]) -> NormalizationReport:
+    """
+    Normalize emails and record why each rejected row was dropped, in one pass.
+
+    Returns:
+        NormalizationReport: Accepted emails in input order, plus an EmailReason
+            code per input row.
+    """
+    report = NormalizationReport(EmailReason)
+    accept = report.accepted.append
+    record = report.reasons.append
+    for email in data:
+        email_cleaned = email.strip().lower()
+        reason = email_reason(email_cleaned)
+        if reason == EmailReason.ACCEPTED:
+            accept(email_cleaned)
+        record(reason)
+    return report
+
+
+def normalize_emails_file(source_path: str, target_path: str, buffer_size: int = FILE_BUFFER_SIZE) -> int:
+    """
+    Normalize a file with one email per line into another file, line by line.
+
+    Returns:
+        int: Number of valid emails written to target_path.
+    """
+    written = 0
+    with open(source_path, encoding="utf-8", buffering=buffer_size) as source, \
+            open(target_path, "w", encoding="utf-8", buffering=buffer_size) as target:
+        for email in iter_normalize_emails(source):
+            target.write(email + "\n")
+            written += 1
+    return written
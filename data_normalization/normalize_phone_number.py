@@ -1,12 +1,240 @@
+from collections.abc import Iterable
+from enum import IntEnum
 from re import compile
+from typing import NamedTuple
+from unicodedata import decimal
 
-def normalize_phone_numbers(data: list[str]) -> list[str]:
+from normalization_report import NormalizationReport
+
+_non_digit_re = compile(r"\D")
+
+# Deletion tables built once at import. ASCII rows (almost all of them) go
+# through bytes.translate, the fastest C path; other rows use the str table,
+# and since \D also drops rarer non-ASCII characters, rows still holding any
+# fall back to the regex.
+_NON_DIGIT_BYTES = bytes(i for i in range(128) if not chr(i).isdecimal())
+_DIGITS_ONLY = str.maketrans("", "", "".join(c for c in map(chr, range(256)) if not c.isdecimal()))
+
+
+def _strip_non_digits(phone_number: str) -> str:
+    if phone_number.isascii():
+        return phone_number.encode().translate(None, _NON_DIGIT_BYTES).decode()
+    digits = phone_number.translate(_DIGITS_ONLY)
+    return digits if digits.isdecimal() else _non_digit_re.sub("", digits)
+
+
+def _normalize_regex(data: Iterable[str]) -> list[str]:
     normalized_phone_numbers: list[str] = []
-    _non_digit_re = compile(r"\D")
     for phone_number in data:
         if phone_number.startswith("+1"):
             phone_number = phone_number.replace("+1", "", 1)
         phone_number_cleaned = _non_digit_re.sub("", phone_number)
         if len(phone_number_cleaned) == 10:
             normalized_phone_numbers.append(phone_number_cleaned)
-    return normalized_phone_numbers
\ No newline at end of file
+    return normalized_phone_numbers
+
+
+def normalize_phone_number(phone_number: str) -> str | None:
+    """Ten-digit form of one phone number; None if it does not have ten digits."""
+    if phone_number.startswith("+1"):
+        phone_number = phone_number[2:]
+    phone_number_cleaned = _strip_non_digits(phone_number)
+    return phone_number_cleaned if len(phone_number_cleaned) == 10 else None
+
+
+def _normalize_translate(data: Iterable[str]) -> list[str]:
+    normalized_phone_numbers: list[str] = []
+    for phone_number in data:
+        phone_number_cleaned = normalize_phone_number(phone_number)
+        if phone_number_cleaned is not None:
+            normalized_phone_numbers.append(phone_number_cleaned)
+    return normalized_phone_numbers
+
+
+ENGINES = {
+    "regex": _normalize_regex,
+    "translate": _normalize_translate,
+}
+
+
+def normalize_phone_numbers(data: list[str], engine: str = "translate") -> list[str]:
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {sorted(ENGINES)}")
+    return ENGINES[engine](data)
+
+
+class PhoneReason(IntEnum):
+    ACCEPTED = 0
+    EMPTY = 1
+    NO_DIGITS = 2
+    TOO_FEW_DIGITS = 3
+    TOO_MANY_DIGITS = 4
+
+
+def normalize_phone_numbers_with_reasons(data: Iterable[str]) -> NormalizationReport:
+    """
+    Normalize phone numbers and record why each rejected row was dropped, in one pass.
+
+    Returns:
+        NormalizationReport: Accepted ten-digit numbers in input order, plus a
+            PhoneReason code per input row.
+    """
+    report = NormalizationReport(PhoneReason)
+    accept = report.accepted.append
+    record = report.reasons.append
+    for phone_number in data:
+        if phone_number.startswith("+1"):
+            phone_number = phone_number[2:]
+        digits = _strip_non_digits(phone_number)
+        if len(digits) == 10:
+            accept(digits)
+            record(PhoneReason.ACCEPTED)
+        elif not digits:
+            record(PhoneReason.NO_DIGITS if phone_number.strip() else PhoneReason.EMPTY)
+        else:
+            record(PhoneReason.TOO_FEW_DIGITS if len(digits) < 10 else PhoneReason.TOO_MANY_DIGITS)
+    return report
+
+
+class CallingCodeRule(NamedTuple):
+    calling_code: str
+    min_length: int  # national significant number length bounds
+    max_length: int
+    trunk_prefix: str = "0"
+    international_prefix: str = "00"
+
+
+CALLING_CODE_RULES = [
+    CallingCodeRule("1", 10, 10, trunk_prefix="1", international_prefix="011"),
+    CallingCodeRule("7", 10, 10, trunk_prefix="8", international_prefix="810"),
+    CallingCodeRule("20", 8, 10),
+    CallingCodeRule("27", 9, 9),
+    CallingCodeRule("30", 10, 10, trunk_prefix=""),
+    CallingCodeRule("31", 9, 9),
+    CallingCodeRule("32", 8, 9),
+    CallingCodeRule("33", 9, 9),
+    CallingCodeRule("34", 9, 9, trunk_prefix=""),
+    CallingCodeRule("36", 8, 9, trunk_prefix="06"),
+    CallingCodeRule("39", 6, 11, trunk_prefix=""),
+    CallingCodeRule("40", 9, 9),
+    CallingCodeRule("41", 9, 9),
+    CallingCodeRule("43", 4, 13),
+    CallingCodeRule("44", 9, 10),
+    CallingCodeRule("45", 8, 8, trunk_prefix=""),
+    CallingCodeRule("46", 7, 10),
+    CallingCodeRule("47", 8, 8, trunk_prefix=""),
+    CallingCodeRule("48", 9, 9, trunk_prefix=""),
+    CallingCodeRule("49", 6, 13),
+    CallingCodeRule("52", 10, 10, trunk_prefix=""),
+    CallingCodeRule("55", 10, 11),
+    CallingCodeRule("61", 9, 9, international_prefix="0011"),
+    CallingCodeRule("64", 8, 10),
+    CallingCodeRule("81", 9, 10, international_prefix="010"),
+    CallingCodeRule("82", 8, 10, international_prefix="001"),
+    CallingCodeRule("86", 10, 11),
+    CallingCodeRule("90", 10, 10),
+    CallingCodeRule("91", 10, 10),
+    CallingCodeRule("351", 9, 9, trunk_prefix=""),
+    CallingCodeRule("352", 4, 11, trunk_prefix=""),
+    CallingCodeRule("353", 7, 9),
+    CallingCodeRule("354", 7, 7, trunk_prefix=""),
+    CallingCodeRule("358", 5, 12),
+    CallingCodeRule("359", 8, 9),
+    CallingCodeRule("370", 8, 8, trunk_prefix="8"),
+    CallingCodeRule("371", 8, 8, trunk_prefix=""),
+    CallingCodeRule("372", 7, 8, trunk_prefix=""),
+    CallingCodeRule("380", 9, 9),
+    CallingCodeRule("385", 8, 9),
+    CallingCodeRule("386", 8, 8),
+    CallingCodeRule("420", 9, 9, trunk_prefix=""),
+    CallingCodeRule("421", 9, 9),
+]
+
+# Key under which a trie node stores the rule for the prefix that ends there
+_RULE = ""
+
+
+def build_calling_code_trie(rules: Iterable[CallingCodeRule]) -> dict:
+    """Nested dicts keyed by digit; a node holding _RULE ends a calling code."""
+    trie: dict = {}
+    for rule in rules:
+        node = trie
+        for digit in rule.calling_code:
+            node = node.setdefault(digit, {})
+        node[_RULE] = rule
+    return trie
+
+
+# Built once at import; lookups only walk it
+CALLING_CODE_TRIE = build_calling_code_trie(CALLING_CODE_RULES)
+RULES_BY_CALLING_CODE = {rule.calling_code: rule for rule in CALLING_CODE_RULES}
+
+
+def match_calling_code(digits: str, trie: dict = CALLING_CODE_TRIE) -> CallingCodeRule | None:
+    """Longest calling-code prefix of digits, in O(prefix length)."""
+    node = trie
+    match = None
+    for digit in digits:
+        node = node.get(digit)
+        if node is None:
+            break
+        match = node.get(_RULE, match)
+    return match
+
+
+def _to_digits(phone_number: str) -> str:
+    digits = _strip_non_digits(phone_number)
+    return digits if digits.isascii() else "".join(str(decimal(c)) for c in digits)
+
+
+def _national_number(rule: CallingCodeRule, digits: str) -> str | None:
+    if rule.min_length <= len(digits) <= rule.max_length:
+        return digits
+    # "+44 (0)20 ..." and national "020 ..." both carry the trunk prefix
+    trunk = rule.trunk_prefix
+    if trunk and digits.startswith(trunk):
+        digits = digits[len(trunk):]
+        if rule.min_length <= len(digits) <= rule.max_length:
+            return digits
+    return None
+
+
+def normalize_phone_number_e164(phone_number: str, default_rule: CallingCodeRule) -> str | None:
+    phone_number = phone_number.strip()
+    international = phone_number.startswith("+")
+    digits = _to_digits(phone_number)
+    if not international and digits.startswith(default_rule.international_prefix):
+        international = True
+        digits = digits[len(default_rule.international_prefix):]
+    if international:
+        rule = match_calling_code(digits)
+        if rule is None:
+            return None
+        national = _national_number(rule, digits[len(rule.calling_code):])
+    else:
+        rule = default_rule
+        national = _national_number(rule, digits)
+    if national is None:
+        return None
+    return "+" + rule.calling_code + national
+
+
+def normalize_phone_numbers_e164(data: Iterable[str], default_calling_code: str = "1") -> list[str]:
+    """
+    Normalize phone numbers to E.164 ("+<calling code><national number>").
+
+    Numbers written with "+" or the default country's international prefix are
+    matched against CALLING_CODE_TRIE; all other numbers are treated as
+    national numbers of default_calling_code. Numbers whose national part
+    breaks the country's length rules, or whose calling code is unknown,
+    are dropped.
+    """
+    if default_calling_code not in RULES_BY_CALLING_CODE:
+        raise ValueError(f"Unknown default calling code {default_calling_code!r}")
+    default_rule = RULES_BY_CALLING_CODE[default_calling_code]
+    normalized_phone_numbers: list[str] = []
+    for phone_number in data:
+        normalized = normalize_phone_number_e164(phone_number, default_rule)
+        if normalized is not None:
+            normalized_phone_numbers.append(normalized)
+    return normalized_phone_numbers
@@ -1,17 +1,117 @@
+from collections.abc import Iterable
+from re import compile, escape
+
 # Define dictionary here once, so the dictionary does not need to be created every time it gets called
 SUFFIX_REPLACEMENTS = {
     "Corporation": "Corp",
-    "Incorporated": "Inc", 
+    "Incorporated": "Inc",
     "Inc.": "Inc"
 }
 
-def normalize_product_names(data: list[str]) -> list[str]:
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex source matching any of words, laid out as a character trie.
+
+    Shared prefixes are factored out ("Inc(?:orporated|\\.)"), so the regex
+    engine follows a single path per position instead of trying every word,
+    and a longer word is always preferred over a shorter one it extends.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = ("(?:" + body + ")" if len(branches) == 1 else body) + "?"
+        return body
+
+    return build(trie)
+
+
+class SuffixReplacer:
+    """
+    Applies a replacement dictionary in one left-to-right scan per name.
+
+    Matches are leftmost-longest and not re-scanned, so a replacement never
+    feeds into another rule. The sequential engine instead applies rules one
+    after another in dictionary order, which only differs when a replacement
+    creates a new match, e.g. "Incorporated." -> "Inc." -> "Inc".
+    """
+
+    def __init__(self, replacements: dict[str, str]):
+        self.replacements = dict(replacements)
+        keys = [key for key in self.replacements if key]
+        self._sub = compile(trie_pattern(keys)).sub if keys else None
+        lookup = self.replacements.__getitem__
+        self._replace_match = lambda match: lookup(match.group())
+
+    def __call__(self, name: str) -> str:
+        if self._sub is None:
+            return name
+        return self._sub(self._replace_match, name)
+
+
+DEFAULT_SUFFIX_REPLACER = SuffixReplacer(SUFFIX_REPLACEMENTS)
+
+
+def normalize_product_name(product_name: str, replacements: dict[str, str] = SUFFIX_REPLACEMENTS) -> str | None:
+    """Clean one product name with the sequential rules; None if it is too short."""
+    product_name_cleaned = product_name.strip().title()
+    for original, replacement in replacements.items():
+        if original in product_name_cleaned:
+            product_name_cleaned = product_name_cleaned.replace(original, replacement)
+    return product_name_cleaned if len(product_name_cleaned) >= 2 else None
+
+
+def _normalize_sequential(data: Iterable[str], replacements: dict[str, str]) -> list[str]:
     normalized_product_names: list[str] = []
     for product_name in data:
-        product_name_cleaned = product_name.strip().title()
-        for original, replacement in SUFFIX_REPLACEMENTS.items():
-            if original in product_name_cleaned:
-                product_name_cleaned = product_name_cleaned.replace(original, replacement)
+        product_name_cleaned = normalize_product_name(product_name, replacements)
+        if product_name_cleaned is not None:
+            normalized_product_names.append(product_name_cleaned)
+    return normalized_product_names
+
+
+def _normalize_single_pass(data: Iterable[str], replacer: SuffixReplacer) -> list[str]:
+    normalized_product_names: list[str] = []
+    for product_name in data:
+        product_name_cleaned = replacer(product_name.strip().title())
         if len(product_name_cleaned) >= 2:
             normalized_product_names.append(product_name_cleaned)
-    return normalized_product_names
\ No newline at end of file
+    return normalized_product_names
+
+
+def normalize_product_names(
+    data: list[str],
+    replacements: dict[str, str] | SuffixReplacer = SUFFIX_REPLACEMENTS,
+    engine: str = "sequential",
+) -> list[str]:
+    """
+    Args:
+        data (list[str]): Raw product names.
+        replacements (dict[str, str] | SuffixReplacer, optional): Suffix rules. Pass a
+            prebuilt SuffixReplacer to reuse its compiled pattern across calls.
+        engine (str, optional): "sequential" scans each name once per rule;
+            "single_pass" scans it once regardless of the number of rules.
+    """
+    if engine == "sequential":
+        if isinstance(replacements, SuffixReplacer):
+            replacements = replacements.replacements
+        return _normalize_sequential(data, replacements)
+    if engine == "single_pass":
+        if replacements is SUFFIX_REPLACEMENTS:
+            replacer = DEFAULT_SUFFIX_REPLACER
+        elif isinstance(replacements, SuffixReplacer):
+            replacer = replacements
+        else:
+            replacer = SuffixReplacer(replacements)
+        return _normalize_single_pass(data, replacer)
+    raise ValueError(f"Unknown engine {engine!r}, expected 'sequential' or 'single_pass'")
@@ -0,0 +1,208 @@
+"""
+Timestamp normalization to ISO "YYYY-MM-DD HH:MM:SS".
+
+A feed usually sends every row of a column in the same format, so
+TimestampNormalizer keeps the formats of each source ordered by their last
+success: after the first row (or a sniffed sample), each value is parsed
+on the first try. Formats made only of zero-padded numeric fields are
+parsed by slicing at fixed offsets; strptime is only the fallback for
+values that are not fixed width, e.g. "2024-1-5T10:30:45Z".
+"""
+
+from collections.abc import Hashable, Iterable, Iterator
+from datetime import datetime
+from itertools import chain, islice
+from typing import NamedTuple
+
+# Input formats in order of preference for a source nothing is known about yet
+DEFAULT_FORMATS = (
+    "%Y-%m-%dT%H:%M:%SZ",  # ISO with timezone
+    "%Y/%m/%d %H:%M:%S",  # US format with slashes
+    "%d-%m-%Y %H:%M:%S",  # European format
+    "%m/%d/%y %H:%M:%S",  # Short year format
+)
+
+# Rows sniff() looks at to choose the first format of a source
+DEFAULT_SAMPLE_SIZE = 100
+
+# Field widths of the strptime directives the fixed-width parser understands
+_FIELD_WIDTHS = {"Y": 4, "y": 2, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2}
+_FIELD_ORDER = "YmdHMS"
+
+
+class TimestampFormat(NamedTuple):
+    strptime_format: str
+    width: int | None  # None when the format is not fixed width
+    separators: tuple[tuple[int, str], ...]  # (offset, literal character)
+    fields: tuple[slice | None, ...]  # year, month, day, hour, minute, second; None if absent
+    short_year: bool
+
+
+def timestamp_format(strptime_format: str) -> TimestampFormat:
+    """Fixed-width layout of a strptime format, or width None if it has no such layout."""
+    offset, separators, fields = 0, [], {}
+    directives = iter(strptime_format)
+    for char in directives:
+        if char != "%":
+            separators.append((offset, char))
+            offset += 1
+            continue
+        directive = next(directives, "")
+        field = "Y" if directive == "y" else directive
+        if directive not in _FIELD_WIDTHS or field in fields:
+            return TimestampFormat(strptime_format, None, (), (), False)
+        fields[field] = slice(offset, offset + _FIELD_WIDTHS[directive])
+        offset += _FIELD_WIDTHS[directive]
+    # The date is required; a missing time of day is midnight, as with strptime
+    if not {"Y", "m", "d"} <= fields.keys():
+        return TimestampFormat(strptime_format, None, (), (), False)
+    return TimestampFormat(
+        strptime_format, offset, tuple(separators), tuple(fields.get(f) for f in _FIELD_ORDER), "%y" in strptime_format
+    )
+
+
+def parse_fixed_width(value: str, fmt: TimestampFormat) -> str | None:
+    """Normalize value laid out exactly as fmt, by slicing; None if it does not fit."""
+    if len(value) != fmt.width:
+        return None
+    for offset, char in fmt.separators:
+        if value[offset] != char:
+            return None
+    year, month, day, hour, minute, second = (value[field] if field else "00" for field in fmt.fields)
+    digits = year + month + day + hour + minute + second
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    if fmt.short_year:
+        # strptime's %y rule: 69-99 are 19xx, 00-68 are 20xx
+        year = ("19" if year >= "69" else "20") + year
+    try:
+        # Only for its range checks: month 13, February 30, hour 24, ...
+        datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return None
+    return f"{year}-{month}-{day} {hour}:{minute}:{second}"
+
+
+def parse_strptime(value: str, fmt: TimestampFormat) -> str | None:
+    try:
+        # Unlike strftime("%Y"), isoformat zero-pads years before 1000
+        return datetime.strptime(value, fmt.strptime_format).isoformat(" ", "seconds")
+    except ValueError:
+        return None
+
+
+def parse_timestamp(value: str, fmt: TimestampFormat) -> str | None:
+    """Normalize value if it is in format fmt, else None."""
+    if fmt.width is not None:
+        return parse_fixed_width(value, fmt)
+    return parse_strptime(value, fmt)
+
+
+class TimestampNormalizer:
+    """
+    Normalizes timestamps, remembering per source which format worked last.
+
+    Each source (a column name, a feed id, ...) has its own order of formats.
+    A value is tried against the formats in that order, and the format that
+    parses it moves to the front, so a source in a single format pays for one
+    parse per value. Values none of the formats fit by slicing get a second
+    pass through strptime in the same order.
+    """
+
+    def __init__(self, formats: Iterable[str] = DEFAULT_FORMATS, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.formats = [timestamp_format(fmt) for fmt in formats]
+        if not self.formats:
+            raise ValueError("TimestampNormalizer needs at least one format")
+        self.sample_size = sample_size
+        self._order: dict[Hashable, list[TimestampFormat]] = {}
+
+    def preferred_format(self, source: Hashable = None) -> str:
+        """The strptime format tried first for source."""
+        return self._order.get(source, self.formats)[0].strptime_format
+
+    def sniff(self, sample: Iterable[str], source: Hashable = None) -> str | None:
+        """
+        Orders the formats of source by how many values of sample each one parses.
+
+        Returns the winning strptime format, or None if none parses any value.
+        """
+        sample = [value.strip() for value in sample]
+        hits = [sum(parse_timestamp(value, fmt) is not None for value in sample) for fmt in self.formats]
+        # sorted is stable, so ties keep the configured order
+        ranking = sorted(range(len(self.formats)), key=hits.__getitem__, reverse=True)
+        self._order[source] = [self.formats[index] for index in ranking]
+        return self.formats[ranking[0]].strptime_format if hits[ranking[0]] else None
+
+    def normalize(self, value: str, source: Hashable = None) -> str | None:
+        """Normalize one timestamp; None if no format parses it."""
+        value = value.strip()
+        order = self._order.get(source)
+        if order is None:
+            order = self._order[source] = list(self.formats)
+        for parse in (parse_timestamp, parse_strptime):
+            for position, fmt in enumerate(order):
+                result = parse(value, fmt)
+                if result is not None:
+                    if position:
+                        order.insert(0, order.pop(position))
+                    return result
+        return None
+
+    def iter_normalize(self, data: Iterable[str], source: Hashable = None) -> Iterator[str]:
+        """
+        Lazily yield normalized timestamps, dropping the ones no format parses.
+
+        The format order of a source seen for the first time is sniffed from
+        its first sample_size values.
+        """
+        data = iter(data)
+        if source not in self._order:
+            sample = list(islice(data, self.sample_size))
+            self.sniff(sample, source)
+            data = chain(sample, data)
+        normalize = self.normalize
+        for value in data:
+            result = normalize(value, source)
+            if result is not None:
+                yield result
+
+
+_DEFAULT_LAYOUTS = [timestamp_format(fmt) for fmt in DEFAULT_FORMATS]
+
+
+def normalize_timestamp(value: str) -> str | None:
+    """Normalize one timestamp by trying DEFAULT_FORMATS in order; None if none parses it."""
+    value = value.strip()
+    for fmt in _DEFAULT_LAYOUTS:
+        result = parse_strptime(value, fmt)
+        if result is not None:
+            return result
+    return None
+
+
+def _iter_strptime(data: Iterable[str]) -> Iterator[str]:
+    for value in data:
+        result = normalize_timestamp(value)
+        if result is not None:
+            yield result
+
+
+def _iter_sniffing(data: Iterable[str]) -> Iterator[str]:
+    return TimestampNormalizer().iter_normalize(data)
+
+
+ENGINES = {
+    "strptime": _iter_strptime,
+    "sniffing": _iter_sniffing,
+}
+
+
+def iter_normalize_timestamps(data: Iterable[str], engine: str = "sniffing") -> Iterator[str]:
+    """Lazily yield normalized timestamps; memory use does not grow with the input."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {sorted(ENGINES)}")
+    return ENGINES[engine](data)
+
+
+def normalize_timestamps(data: list[str], engine: str = "sniffing") -> list[str]:
+    return list(iter_normalize_timestamps(data, engine))
@@ -0,0 +1,58 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from normalize_emails import normalize_emails
+from normalize_phone_number import normalize_phone_numbers
+from normalize_product_names import normalize_product_names
+
+# Module-level functions so worker processes can unpickle them by reference
+NORMALIZERS = {
+    "emails": normalize_emails,
+    "phone_numbers": normalize_phone_numbers,
+    "product_names": normalize_product_names,
+}
+
+# Rows per task; large enough that pickling one list amortizes the IPC round trip
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def iter_chunks(data: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    iterator = iter(data)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def parallel_normalize(
+    kind: str,
+    data: Iterable[str],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[str]:
+    """
+    Normalize data across a process pool, one chunk of rows per task.
+
+    Args:
+        kind (str): One of "emails", "phone_numbers" or "product_names".
+        data (Iterable[str]): Raw values to normalize.
+        workers (int | None, optional): Number of processes. Defaults to os.cpu_count().
+            With workers=1 the data is normalized in-process, without a pool.
+        chunk_size (int, optional): Rows sent to a worker per task.
+
+    Returns:
+        list[str]: Normalized values, in input order.
+    """
+    if kind not in NORMALIZERS:
+        raise ValueError(f"Unknown kind {kind!r}, expected one of {sorted(NORMALIZERS)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    normalizer = NORMALIZERS[kind]
+    if workers == 1:
+        return normalizer(list(data))
+
+    normalized: list[str] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields chunk results in submission order, so input order is kept
+        for chunk_result in pool.map(normalizer, iter_chunks(data, chunk_size)):
+            normalized.extend(chunk_result)
+    return normalized
@@ -0,0 +1,123 @@
+"""
+Parallel parsing of large log files through mmap.
+
+The file is cut into byte ranges that each end just after a newline, so no
+line is split between two ranges. Only (path, start, end) is sent to a
+worker; the worker maps the file itself, decodes its own range and parses
+it with the compiled schema parser of parse_log_entries. What comes back is
+either the parsed tuples of the range or, with parallel_aggregate_log_file,
+a small partial aggregate that the parent merges, so the raw text never
+crosses a process boundary.
+"""
+
+import mmap
+import os
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial, reduce
+from multiprocessing import Pool
+from operator import add, itemgetter
+from typing import Any
+
+from parse_log_entries import ACCESS_LOG, LogSchema, compile_parser
+
+# Bytes per task: big enough to amortize a task round trip; smaller ranges
+# decode and split a little faster (1M-16M measured) and keep worker memory low
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+
+def newline_aligned_ranges(path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> list[tuple[int, int]]:
+    """(start, end) byte ranges covering the file, each about chunk_bytes long and ending after a newline."""
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be at least 1")
+    size = os.path.getsize(path)
+    if not size:
+        return []  # mmap cannot map an empty file
+    ranges = []
+    with open(path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            newline = mapped.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_range(
+    path, start: int, end: int, schema: LogSchema = ACCESS_LOG, aggregate: Callable | None = None
+) -> Any:
+    """Parse the lines of one byte range; returns the tuples, or aggregate(tuples) if given."""
+    with open(path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = mapped[start:end].decode("utf-8", errors="replace")
+    # Lines end at "\n" only, as parse_log_file reads them; the parser's
+    # split() drops the "\r" of "\r\n" line endings
+    records = filter(None, map(compile_parser(schema), text.split("\n")))
+    return aggregate(records) if aggregate is not None else list(records)
+
+
+def _run_range(worker: Callable, path, bounds: tuple[int, int]) -> Any:
+    return worker(path, *bounds)
+
+
+def _map_ranges(path, worker: Callable, workers: int | None, chunk_bytes: int) -> Iterator[Any]:
+    ranges = newline_aligned_ranges(path, chunk_bytes)
+    if workers == 1 or not ranges:
+        yield from (worker(path, start, end) for start, end in ranges)
+        return
+    with Pool(workers) as pool:
+        # imap() yields each range's result in file order as soon as it and
+        # the ones before it are done; one range per task, as a range is
+        # already chunk_bytes of lines
+        yield from pool.imap(partial(_run_range, worker, path), ranges, chunksize=1)
+
+
+def parallel_parse_log_file(
+    path,
+    schema: LogSchema = ACCESS_LOG,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[tuple]:
+    """
+    Parse a log file across a process pool, one newline-aligned byte range per task.
+
+    Args:
+        path: The log file.
+        schema (LogSchema, optional): Line format, see parse_log_entries. Defaults to ACCESS_LOG.
+        workers (int | None, optional): Number of processes. Defaults to os.cpu_count().
+            With workers=1 the ranges are parsed in-process, without a pool.
+        chunk_bytes (int, optional): Approximate size of one range.
+
+    Returns:
+        Iterator[tuple]: The parsed lines as tuples, in file order; lines that
+            do not fit the schema are skipped.
+    """
+    worker = partial(parse_range, schema=schema)
+    for records in _map_ranges(path, worker, workers, chunk_bytes):
+        yield from records
+
+
+def parallel_aggregate_log_file(
+    path,
+    aggregate: Callable[[Iterable[tuple]], Any],
+    merge: Callable[[Any, Any], Any] = add,
+    schema: LogSchema = ACCESS_LOG,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Any:
+    """
+    Aggregate a log file across a process pool without shipping parsed lines back.
+
+    Every worker reduces its range with aggregate, and the parent combines
+    the partial results pairwise with merge, so aggregate and merge must be
+    picklable (module-level functions or partials of them) and merge must be
+    associative. An empty file gives aggregate of no lines.
+    """
+    worker = partial(parse_range, schema=schema, aggregate=aggregate)
+    partials = _map_ranges(path, worker, workers, chunk_bytes)
+    return reduce(merge, partials, aggregate(iter(())))
+
+
+def count_values(records: Iterable[tuple], position: int) -> Counter:
+    """Counter of the field at position, e.g. partial(count_values, position=3) for the status."""
+    return Counter(map(itemgetter(position), records))
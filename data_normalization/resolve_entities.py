@@ -0,0 +1,231 @@
+"""
+Matching and deduplication of entities across sources by company name.
+
+Names are reduced to a match key with the legal-entity suffixes stripped,
+so "TechCorp", "TechCorp Inc." and "techcorp, LLC" share the key
+"techcorp". Records with equal keys are found through a hash index in
+O(n + m). Keys without an exact partner can fall back to a fuzzy match,
+but only against keys in the same block (same first or last characters),
+never against all of them:
+
+    pairs = hash_join(crm_records, sales_records, threshold=0.9)
+    clusters = deduplicate(integrate_sources(...))
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from difflib import SequenceMatcher
+from re import IGNORECASE, compile
+from typing import Any
+
+from normalize_product_names import trie_pattern
+
+# Trailing words that name a legal form rather than the company
+LEGAL_SUFFIXES = (
+    "Inc", "Incorporated", "Corp", "Corporation", "Co", "Company", "LLC", "Ltd", "Limited",
+    "LLP", "PLC", "GmbH", "AG", "SA", "BV", "NV", "Holdings", "Group",
+)
+
+# Fuzzy matches must be at least this similar (difflib ratio, 0 to 1); one
+# substituted letter in an 8-letter name scores 0.875
+DEFAULT_THRESHOLD = 0.85
+
+# Characters of the key's start and end that decide which keys are compared
+DEFAULT_BLOCK_LENGTH = 3
+
+
+def suffix_pattern(suffixes: Iterable[str]):
+    """
+    Compiled regex matching a run of legal suffixes at the end of a name,
+    with the separators and dots around them, e.g. ", Inc." or " Corp LLC".
+    The suffixes are whole words, so the "Co" of "RetailCo" is kept.
+    """
+    return compile(rf"(?:[\s,]+(?:{trie_pattern(suffixes)})\.?)+[\s.]*$", IGNORECASE)
+
+
+_DEFAULT_SUFFIX_RE = suffix_pattern(LEGAL_SUFFIXES)
+
+
+def entity_key(name: str, suffix_re=_DEFAULT_SUFFIX_RE) -> str:
+    """Match key of a name: case folded, legal suffixes and punctuation stripped, single spaces."""
+    name = suffix_re.sub("", name.strip())
+    return " ".join("".join(char for char in name.casefold() if char.isalnum() or char.isspace()).split())
+
+
+def name_key(record: dict) -> str:
+    """entity_key of the "name" field of a record in the integrate_sources schema."""
+    return entity_key(record["name"])
+
+
+def similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """
+    difflib ratio of a and b, or 0.0 as soon as it is certain to be below
+    threshold. The length bound and the quick ratios are upper bounds of the
+    ratio that cost far less than computing it.
+    """
+    if a == b:
+        return 1.0
+    total = len(a) + len(b)
+    if not total or 2 * min(len(a), len(b)) / total < threshold:
+        return 0.0
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else 0.0
+
+
+class FuzzyIndex:
+    """
+    Hash index from match keys to values, with a blocked fuzzy fallback.
+
+    Every key is also filed under its blocks, its first and its last
+    block_length characters. A fuzzy lookup only compares the keys sharing
+    a block with the one looked up, which catches a typo anywhere except at
+    both ends at once and keeps lookups far below a scan of every key.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, block_length: int = DEFAULT_BLOCK_LENGTH):
+        if not 0 <= threshold <= 1:
+            raise ValueError(f"threshold must be between 0 and 1, got {threshold}")
+        if block_length < 1:
+            raise ValueError("block_length must be at least 1")
+        self.threshold = threshold
+        self.block_length = block_length
+        self.exact: dict[str, list[Any]] = {}
+        self.blocks: dict[tuple[bool, str], list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def _blocks(self, key: str) -> set[tuple[bool, str]]:
+        return {(False, key[:self.block_length]), (True, key[-self.block_length:])}
+
+    def add(self, key: str, value: Any) -> None:
+        values = self.exact.get(key)
+        if values is None:
+            values = self.exact[key] = []
+            for block in self._blocks(key):
+                self.blocks.setdefault(block, []).append(key)
+        values.append(value)
+
+    def candidates(self, key: str) -> Iterator[str]:
+        """Indexed keys sharing a block with key, each once."""
+        seen = set()
+        for block in self._blocks(key):
+            for candidate in self.blocks.get(block, ()):
+                if candidate not in seen:
+                    seen.add(candidate)
+                    yield candidate
+
+    def best_match(self, key: str) -> str | None:
+        """key itself if indexed, else the most similar indexed key above threshold, else None."""
+        if key in self.exact:
+            return key
+        best, best_ratio = None, 0.0
+        for candidate in self.candidates(key):
+            # Raising the bar to the best ratio so far prunes the remaining candidates sooner
+            ratio = similarity(key, candidate, max(self.threshold, best_ratio))
+            if ratio > best_ratio:
+                best, best_ratio = candidate, ratio
+        return best
+
+    def lookup(self, key: str, fuzzy: bool = True) -> list[Any]:
+        """Values under key, or under its best fuzzy match; [] if there is none."""
+        if not fuzzy:
+            return self.exact.get(key, [])
+        match = self.best_match(key)
+        return self.exact[match] if match is not None else []
+
+
+def hash_join(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    left_key: Callable[[Any], str] = name_key,
+    right_key: Callable[[Any], str] = name_key,
+    threshold: float | None = None,
+    block_length: int = DEFAULT_BLOCK_LENGTH,
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Left outer join of two record streams on their match keys.
+
+    right is loaded into a FuzzyIndex, then left is streamed through it, so
+    the join is O(n + m) plus, with a threshold, the fuzzy lookups of the
+    left keys that have no exact partner. Yields (left record, right record)
+    for every match and (left record, None) for a left record without one.
+    An empty key (a blank name, or one of only punctuation or legal
+    suffixes) matches nothing on either side. Neither stream is read
+    before the first next().
+    """
+    # Created now, so a bad threshold raises here rather than on the first next()
+    index = FuzzyIndex(1.0 if threshold is None else threshold, block_length)
+    return _join(left, right, left_key, right_key, index, threshold is not None)
+
+
+def _join(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    left_key: Callable[[Any], str],
+    right_key: Callable[[Any], str],
+    index: FuzzyIndex,
+    fuzzy: bool,
+) -> Iterator[tuple[Any, Any]]:
+    for record in right:
+        key = right_key(record)
+        if key:
+            index.add(key, record)
+    for record in left:
+        key = left_key(record)
+        matches = index.lookup(key, fuzzy) if key else []
+        if not matches:
+            yield record, None
+        for match in matches:
+            yield record, match
+
+
+def deduplicate(
+    records: Iterable[Any],
+    key: Callable[[Any], str] = name_key,
+    threshold: float | None = DEFAULT_THRESHOLD,
+    block_length: int = DEFAULT_BLOCK_LENGTH,
+) -> list[list[Any]]:
+    """
+    Group records that describe the same entity, e.g. the CRM and Sales
+    records of one company after integrate_sources.
+
+    Records with equal keys always share a group. With a threshold, each
+    new distinct key is also compared with the earlier keys of its blocks,
+    and similar keys merge their groups, transitively. A record with an
+    empty key says nothing about its entity and gets a group of its own.
+    Groups come out in the order of their first record, records in input order.
+    """
+    index = FuzzyIndex(threshold, block_length) if threshold is not None else None
+    parent: dict[str, str] = {}
+    keyed: list[tuple[str, Any]] = []
+
+    def find(key: str) -> str:
+        root = key
+        while parent[root] != root:
+            root = parent[root]
+        while parent[key] != root:  # path compression
+            parent[key], key = root, parent[key]
+        return root
+
+    for record in records:
+        record_key = key(record)
+        keyed.append((record_key, record))
+        if not record_key or record_key in parent:
+            continue
+        parent[record_key] = record_key
+        if index is not None:
+            for candidate in index.candidates(record_key):
+                if similarity(record_key, candidate, threshold):
+                    parent[find(record_key)] = find(candidate)
+            index.add(record_key, record_key)
+
+    groups: dict[Any, list[Any]] = {}
+    for record_key, record in keyed:
+        if record_key:
+            groups.setdefault(find(record_key), []).append(record)
+        else:
+            groups[object()] = [record]
+    return list(groups.values())
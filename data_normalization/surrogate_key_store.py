@@ -0,0 +1,271 @@
+"""
+Persistent surrogate key store for incremental warehouse loads.
+
+SurrogateKeyStore keeps the key map of SurrogateKeyGenerator on disk, so
+an ID once assigned to a business key stays the same across runs. A
+store is a directory of three files:
+
+    keys.log     the composite key bytes, appended in ID order
+    offsets.i64  int64 end offset of each key in keys.log, appended in ID order
+    index.bin    header (key count, key fields), then the 64-bit key hashes
+                 sorted, then the ID of each hash, as two flat arrays; keys
+                 whose hashes collide sit side by side under the same hash
+
+Opening a store memory-maps index.bin instead of reading the keys and
+rebuilding a dict, so a cold start costs the same for a thousand keys as
+for a hundred million. A batch is dictionary-encoded in memory first, and
+only its distinct keys are hashed and binary-searched in the mapped index.
+
+Appends are crash safe: new keys go to the end of keys.log and
+offsets.i64, and a new index.bin is written next to the old one and
+renamed over it. The rename is the commit; the count in the header of the
+index says how much of the two logs is committed, and anything past that,
+left by a crash, is cut off when the store is opened. One process may
+write to a store at a time.
+"""
+
+import json
+import mmap
+import os
+from collections.abc import Iterable, Sequence
+from hashlib import blake2b
+from typing import Any
+
+from surrogate_keys import UNKNOWN_ID, SurrogateKeyGenerator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+KEYS_FILE = "keys.log"
+OFFSETS_FILE = "offsets.i64"
+INDEX_FILE = "index.bin"
+
+_MAGIC = b"SKSTORE1"
+_HEADER_SIZE = 4096  # magic, key count, key fields as JSON; padded so the arrays are aligned
+
+# Joins the fields of a composite key in keys.log; not allowed inside a field
+FIELD_SEPARATOR = "\x1f"
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("surrogate_key_store requires numpy: pip install numpy")
+
+
+def key_hash(key: bytes) -> int:
+    """
+    Stable 64-bit hash of a composite key. Unlike hash(), it is the same in
+    every process. With verify=False, a hash found once in the index is
+    taken as its key, which for 10 million keys is wrong with a probability
+    of about 3 in a million; with verify=True, and always for a hash the
+    index holds more than once, lookups compare the stored bytes.
+    """
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+def _fsync_directory(path: str) -> None:
+    if os.name != "posix":
+        return
+    directory = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(directory)
+    finally:
+        os.close(directory)
+
+
+class SurrogateKeyStore:
+    """
+    On-disk map from business keys to stable dense surrogate IDs.
+
+    IDs are assigned 0, 1, 2, ... in order of first appearance, as by
+    SurrogateKeyGenerator, and never change or get reused. Use
+    lookup_or_insert (or encode) for each batch of a load, lookup to
+    resolve keys without assigning any.
+
+    A batch that adds keys rewrites and fsyncs the whole sorted index, so
+    its cost grows with the size of the store as well as of the batch:
+    about 16 bytes written per stored key. Few large batches load faster
+    than many small ones. Batches that add no keys write nothing.
+    """
+
+    def __init__(self, path, key_fields: Sequence[str] = ("customer_id", "product_id")):
+        _require_numpy()
+        self.path = os.fspath(path)
+        self.key_fields = tuple(key_fields)
+        if not self.key_fields:
+            raise ValueError("SurrogateKeyStore needs at least one key field")
+        os.makedirs(self.path, exist_ok=True)
+        if not os.path.exists(self._file(INDEX_FILE)):
+            self._write_index(np.empty(0, np.uint64), np.empty(0, np.int64))
+        self._open_index()
+        if self._stored_fields != self.key_fields:
+            raise ValueError(f"Store {self.path!r} has key fields {self._stored_fields}, not {self.key_fields}")
+        self._recover()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _open_index(self) -> None:
+        with open(self._file(INDEX_FILE), "rb") as index_file:
+            header = index_file.read(_HEADER_SIZE)
+        if header[:8] != _MAGIC:
+            raise ValueError(f"{self._file(INDEX_FILE)!r} is not a surrogate key index")
+        self._count = int.from_bytes(header[8:16], "little")
+        fields_size = int.from_bytes(header[16:24], "little")
+        self._stored_fields = tuple(json.loads(header[24:24 + fields_size]))
+        if self._count:
+            mapped = np.memmap(self._file(INDEX_FILE), dtype=np.uint64, mode="r", offset=_HEADER_SIZE)
+            self._hashes = mapped[:self._count]
+            self._ids = mapped[self._count:2 * self._count].view(np.int64)
+        else:
+            self._hashes, self._ids = np.empty(0, np.uint64), np.empty(0, np.int64)
+
+    def _write_index(self, hashes: Any, ids: Any) -> None:
+        """Write a complete index next to the current one, then rename it over it: the commit point."""
+        fields = json.dumps(self.key_fields).encode()
+        if 24 + len(fields) > _HEADER_SIZE:
+            raise ValueError("Key field names are too long for the index header")
+        header = _MAGIC + len(hashes).to_bytes(8, "little") + len(fields).to_bytes(8, "little") + fields
+        temporary = self._file(INDEX_FILE + ".tmp")
+        with open(temporary, "wb") as index_file:
+            index_file.write(header.ljust(_HEADER_SIZE, b"\0"))
+            index_file.write(np.ascontiguousarray(hashes, dtype="<u8").tobytes())
+            index_file.write(np.ascontiguousarray(ids, dtype="<i8").tobytes())
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        os.replace(temporary, self._file(INDEX_FILE))
+        _fsync_directory(self.path)
+
+    def _end_offsets(self) -> Any:
+        if not self._count:
+            return np.empty(0, np.int64)
+        return np.memmap(self._file(OFFSETS_FILE), dtype="<i8", mode="r", shape=(self._count,))
+
+    def _recover(self) -> None:
+        """Cut off whatever an interrupted append left after the committed keys."""
+        committed_offsets = self._count * 8
+        committed_keys = int(self._end_offsets()[-1]) if self._count else 0
+        for name, size in ((OFFSETS_FILE, committed_offsets), (KEYS_FILE, committed_keys)):
+            with open(self._file(name), "ab") as log_file:
+                if log_file.tell() < size:
+                    raise ValueError(f"{self._file(name)!r} is shorter than its committed size")
+                if log_file.tell() > size:
+                    log_file.truncate(size)
+        self._key_bytes = committed_keys
+
+    def _encode_key(self, key: Any) -> bytes:
+        fields = (key,) if type(key) is str else key
+        if any(FIELD_SEPARATOR in field for field in fields):
+            raise ValueError(f"Business key {key!r} contains the field separator")
+        return FIELD_SEPARATOR.join(fields).encode("utf-8")
+
+    def _resolve(self, keys: list[bytes], hashes: Any, verify: bool) -> Any:
+        """
+        Stored ID of each distinct key, UNKNOWN_ID if it has none. A key
+        whose hash is stored once is that entry, or with verify=True that
+        entry if the stored bytes are equal; a hash stored more than once
+        belongs to colliding keys, which are told apart by their bytes.
+        """
+        ids = np.full(len(keys), UNKNOWN_ID, dtype=np.int64)
+        if not self._count or not len(keys):
+            return ids
+        starts = np.searchsorted(self._hashes, hashes, side="left")
+        run_lengths = np.searchsorted(self._hashes, hashes, side="right") - starts
+        single = run_lengths == 1
+        ids[single] = self._ids[starts[single]]
+        if verify:
+            matched = np.flatnonzero(single)
+            for index, stored in zip(matched.tolist(), self._stored_keys(ids[matched])):
+                if stored != keys[index]:
+                    ids[index] = UNKNOWN_ID
+        for index in np.flatnonzero(run_lengths > 1).tolist():
+            run = self._ids[starts[index]:starts[index] + run_lengths[index]]
+            for surrogate_id, stored in zip(run.tolist(), self._stored_keys(run)):
+                if stored == keys[index]:
+                    ids[index] = surrogate_id
+                    break
+        return ids
+
+    def _distinct(self, rows: Iterable[Any]) -> tuple[Any, list[bytes], Any]:
+        """Batch position of each row, and the bytes and hashes of the distinct keys."""
+        batch = SurrogateKeyGenerator(self.key_fields)
+        positions = batch.encode(rows, "numpy")
+        keys = [self._encode_key(batch.business_key(position)) for position in range(len(batch))]
+        hashes = np.fromiter(map(key_hash, keys), dtype=np.uint64, count=len(keys))
+        return positions, keys, hashes
+
+    def lookup(self, rows: Iterable[Any], verify: bool = False) -> Any:
+        """numpy int64 IDs of the business keys of rows; UNKNOWN_ID for keys not in the store."""
+        positions, keys, hashes = self._distinct(rows)
+        return self._resolve(keys, hashes, verify)[positions]
+
+    def lookup_or_insert(self, rows: Iterable[Any], verify: bool = True) -> Any:
+        """
+        numpy int64 IDs of the business keys of rows, assigning and
+        committing IDs for the keys not in the store yet. The batch is one
+        append: after a crash the store has either all its new keys or none.
+
+        Every key found by its hash is checked against its stored bytes, so
+        a new key whose hash collides with a stored one gets an ID of its
+        own. verify=False skips the check for hashes stored once and saves
+        reading their keys back, at the risk described in key_hash. New keys
+        of one batch are distinct, so they get distinct IDs even when their
+        hashes are equal.
+        """
+        positions, keys, hashes = self._distinct(rows)
+        ids = self._resolve(keys, hashes, verify)
+        new = np.flatnonzero(ids == UNKNOWN_ID)
+        if len(new):
+            ids[new] = np.arange(self._count, self._count + len(new))
+            self._append([keys[index] for index in new], hashes[new], ids[new])
+        return ids[positions]
+
+    encode = lookup_or_insert
+
+    def _append(self, keys: list[bytes], hashes: Any, ids: Any) -> None:
+        ends = self._key_bytes + np.cumsum(np.fromiter(map(len, keys), dtype=np.int64, count=len(keys)))
+        for name, data in ((KEYS_FILE, b"".join(keys)), (OFFSETS_FILE, ends.astype("<i8").tobytes())):
+            with open(self._file(name), "ab") as log_file:
+                log_file.write(data)
+                log_file.flush()
+                os.fsync(log_file.fileno())
+
+        order = np.argsort(hashes)
+        hashes, ids = hashes[order], ids[order]
+        # Merge the sorted new hashes into the sorted index in one O(n + m) pass
+        at = np.searchsorted(self._hashes, hashes)
+        self._write_index(np.insert(self._hashes, at, hashes), np.insert(self._ids, at, ids))
+        self._open_index()
+        self._key_bytes = int(ends[-1])
+
+    def _stored_keys(self, surrogate_ids: Any) -> list[bytes]:
+        """Stored bytes of each of the committed surrogate_ids, mapping the offsets and keys.log once."""
+        if not len(surrogate_ids):
+            return []
+        ends = self._end_offsets()
+        stops = ends[surrogate_ids]
+        starts = np.where(surrogate_ids > 0, ends[surrogate_ids - 1], 0)
+        if not self._key_bytes:
+            return [b""] * len(surrogate_ids)  # mmap cannot map an empty keys.log
+        with open(self._file(KEYS_FILE), "rb") as keys_file, \
+                mmap.mmap(keys_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return [mapped[start:stop] for start, stop in zip(starts.tolist(), stops.tolist())]
+
+    def stored_key(self, surrogate_id: int) -> bytes:
+        if not 0 <= surrogate_id < self._count:
+            raise IndexError(f"No business key for surrogate ID {surrogate_id}")
+        return self._stored_keys(np.array([surrogate_id], dtype=np.int64))[0]
+
+    def business_key(self, surrogate_id: int) -> Any:
+        """The business key of an ID, a tuple of strings or a string; IndexError if unassigned."""
+        fields = self.stored_key(surrogate_id).decode("utf-8").split(FIELD_SEPARATOR)
+        return fields[0] if len(self.key_fields) == 1 else tuple(fields)
+
+    def composite_key(self, surrogate_id: int, separator: str = "_") -> str:
+        key = self.business_key(surrogate_id)
+        return key if type(key) is str else separator.join(key)
@@ -0,0 +1,164 @@
+"""
+Dictionary encoding of business keys into dense integer surrogate IDs.
+
+map_dw_key_generation.py builds a "CUST001_PROD123" string per row, so a
+pair that repeats a million times becomes a million equal strings.
+SurrogateKeyGenerator instead gives each distinct business key the next
+integer ID once and encodes a batch of rows into an array('q') (or a numpy
+int64 array) of 8 bytes per row; joins and group-bys downstream compare
+integers instead of strings. The composite string of an ID is only built
+when asked for:
+
+    keys = SurrogateKeyGenerator(("customer_id", "product_id"))
+    ids = keys.encode(business_data)      # array('q', [0, 1, 2])
+    keys.composite_key(ids[0])            # 'CUST001_PROD123'
+    keys.save("keys.csv")
+"""
+
+import csv
+import os
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import repeat
+from operator import itemgetter
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+OUTPUTS = ("array", "numpy")
+
+# ID lookup() gives a business key that has no surrogate ID
+UNKNOWN_ID = -1
+
+
+class _KeyIds(dict):
+    """Business key -> ID; a missing key is assigned the next ID on lookup."""
+
+    __slots__ = ("keys_by_id",)
+
+    def __init__(self):
+        super().__init__()
+        self.keys_by_id: list[Any] = []
+
+    def __missing__(self, key: Any) -> int:
+        # One interned copy per distinct key, however many rows repeat it
+        key = sys.intern(key) if type(key) is str else tuple(map(sys.intern, key))
+        surrogate_id = self[key] = len(self.keys_by_id)
+        self.keys_by_id.append(key)
+        return surrogate_id
+
+
+class SurrogateKeyGenerator:
+    """
+    Assigns dense surrogate IDs 0, 1, 2, ... to business keys in order of
+    first appearance.
+
+    A business key is the tuple of the key_fields of a row (the value
+    itself for a single field), which must be strings. Encoding a batch
+    is one dict lookup per row, done in C through map(); only new keys run
+    Python code. The same generator must be used for every batch whose IDs
+    are compared, or reloaded with load() between runs.
+    """
+
+    def __init__(self, key_fields: Sequence[str] = ("customer_id", "product_id"), separator: str = "_"):
+        if not key_fields:
+            raise ValueError("SurrogateKeyGenerator needs at least one key field")
+        self.key_fields = tuple(key_fields)
+        self.separator = separator
+        self._business_key = itemgetter(*self.key_fields)
+        self._ids = _KeyIds()
+
+    def __len__(self) -> int:
+        return len(self._ids.keys_by_id)
+
+    def __contains__(self, business_key: Any) -> bool:
+        return business_key in self._ids
+
+    def surrogate_id(self, row: Any) -> int:
+        """ID of the business key of one row, assigned if it is new."""
+        return self._ids[self._business_key(row)]
+
+    def encode(self, rows: Iterable[Any], output: str = "array") -> Any:
+        """
+        IDs of the business keys of rows, assigning IDs to new keys, as an
+        array('q') (output="array") or a numpy int64 array sharing its
+        buffer (output="numpy").
+        """
+        if output not in OUTPUTS:
+            raise ValueError(f"Unknown output {output!r}, expected one of {list(OUTPUTS)}")
+        ids = array("q", map(self._ids.__getitem__, map(self._business_key, rows)))
+        return _as_output(ids, output)
+
+    def lookup(self, rows: Iterable[Any], output: str = "array") -> Any:
+        """Like encode, but without assigning IDs: unknown keys get UNKNOWN_ID."""
+        if output not in OUTPUTS:
+            raise ValueError(f"Unknown output {output!r}, expected one of {list(OUTPUTS)}")
+        keys = map(self._business_key, rows)
+        ids = array("q", map(dict.get, repeat(self._ids), keys, repeat(UNKNOWN_ID)))
+        return _as_output(ids, output)
+
+    def business_key(self, surrogate_id: int) -> Any:
+        """The business key of an ID, a tuple of strings or a string; IndexError if unassigned."""
+        if surrogate_id < 0:
+            raise IndexError(f"No business key for surrogate ID {surrogate_id}")
+        return self._ids.keys_by_id[surrogate_id]
+
+    def composite_key(self, surrogate_id: int) -> str:
+        """The key fields of an ID joined by separator, e.g. "CUST001_PROD123", built only now."""
+        key = self.business_key(surrogate_id)
+        return sys.intern(key if type(key) is str else self.separator.join(key))
+
+    def composite_keys(self, surrogate_ids: Iterable[int]) -> list[str]:
+        return list(map(self.composite_key, surrogate_ids))
+
+    def save(self, path) -> None:
+        """
+        Write the keys in ID order as CSV with the key fields as header. The
+        file is written next to path and then renamed over it, so a crash
+        leaves the previous file intact.
+        """
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "w", encoding="utf-8", newline="") as key_file:
+            writer = csv.writer(key_file)
+            writer.writerow(self.key_fields)
+            single = len(self.key_fields) == 1
+            writer.writerows(((key,) for key in self._ids.keys_by_id) if single else self._ids.keys_by_id)
+            key_file.flush()
+            os.fsync(key_file.fileno())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path, separator: str = "_") -> "SurrogateKeyGenerator":
+        """A generator with the keys and IDs saved at path."""
+        with open(path, encoding="utf-8", newline="") as key_file:
+            reader = csv.reader(key_file)
+            header = next(reader, None)
+            if not header:
+                raise ValueError(f"{os.fspath(path)!r} is not a saved SurrogateKeyGenerator")
+            generator = cls(header, separator)
+            ids = generator._ids
+            for row in reader:
+                if len(row) != len(header):
+                    raise ValueError(f"Line {reader.line_num} of {os.fspath(path)!r} has {len(row)} fields")
+                key = row[0] if len(row) == 1 else tuple(row)
+                if key in ids:
+                    raise ValueError(f"Line {reader.line_num} of {os.fspath(path)!r} repeats the key {key!r}")
+                ids[key]  # assigns the next ID
+        return generator
+
+
+def _as_output(ids: array, output: str) -> Any:
+    if output == "array":
+        return ids
+    if np is None:
+        raise ImportError("output='numpy' requires numpy")
+    return np.frombuffer(ids, dtype=np.int64)
+
+
+def generate_composite_keys(rows: Iterable[Any], key_fields: Sequence[str] = ("customer_id", "product_id")) -> list[str]:
+    """The per-row string keys of map_dw_key_generation.py, e.g. "CUST001_PROD123"."""
+    return ["_".join(map(row.__getitem__, key_fields)) for row in rows]
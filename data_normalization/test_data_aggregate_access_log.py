@@ -0,0 +1,119 @@
+import math
+import random
+
+from aggregate_access_log import (
+    AccessLogAggregator,
+    LatencySketch,
+    WindowedAggregator,
+    aggregate_access_log,
+    endpoint_template,
+)
+from parse_log_entries import parse_log_entries
+
+LOG_LINES = [
+    "2024-06-18 10:23:45 GET /api/users 200 0.045",
+    "2024-06-18 10:24:12 POST /api/orders 201 0.234",
+    "2024-06-18 10:24:33 GET /api/products 404 0.012",
+    "2024-06-18 10:25:01 PUT /api/users/123 500 1.205",
+    "2024-06-18 10:25:15 GET /health 200 0.003",
+    "2024-06-18 10:25:30 PUT /api/users/456 200 0.300",
+    "2024-06-18 10:25:45 PUT /api/users/789 200 0.100",
+]
+
+def _same_summary(left: list[dict], right: list[dict]) -> bool:
+    """Summaries agree exactly except for float rounding of the means."""
+    return len(left) == len(right) and all(
+        {**a, "mean": None} == {**b, "mean": None} and math.isclose(a["mean"], b["mean"])
+        for a, b in zip(left, right)
+    )
+
+def test_sketch_quantiles_and_merge():
+    """
+    Test that sketch quantiles stay within the relative accuracy of the
+    exact ones, and that merged shards equal a sketch of all values.
+    """
+
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-3, 1.2) for _ in range(20_000)] + [0.0] * 10
+    sketch, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+    for index, value in enumerate(values):
+        sketch.add(value)
+        (left if index % 2 else right).add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99, 1.0):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        estimate = sketch.quantile(q)
+        assert abs(estimate - exact) <= 0.01 * exact, f"p{q * 100:g} off: expected ~{exact}, got {estimate}"
+    assert sketch.quantile(0.0) == 0.0 and LatencySketch().quantile(0.5) is None
+    assert len(sketch.buckets) < 1_000, "Sketch memory should not grow with the values"
+
+    merged = left.copy().merge(right)
+    assert (merged.buckets, merged.count, merged.zero_count) == (sketch.buckets, sketch.count, sketch.zero_count)
+
+    try:
+        LatencySketch(0.01).merge(LatencySketch(0.02))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError merging sketches of different accuracy")
+
+    print("✓ Latency sketch tests passed!")
+
+def test_aggregator_keys_and_error_rates():
+    """
+    Test the (endpoint, method, status class) keys, id folding and error rates.
+    """
+
+    aggregator = aggregate_access_log(parse_log_entries(LOG_LINES))
+    rows = {(row["endpoint"], row["method"], row["status_class"]): row for row in aggregator.summary()}
+
+    assert endpoint_template("/api/users/123/orders/7") == "/api/users/{id}/orders/{id}"
+    assert set(rows) == {
+        ("/api/users", "GET", "2xx"), ("/api/orders", "POST", "2xx"), ("/api/products", "GET", "4xx"),
+        ("/api/users/{id}", "PUT", "5xx"), ("/api/users/{id}", "PUT", "2xx"), ("/health", "GET", "2xx"),
+    }, f"Unexpected keys {sorted(rows)}"
+
+    user_updates = rows[("/api/users/{id}", "PUT", "2xx")]
+    assert user_updates["count"] == 2 and math.isclose(user_updates["error_rate"], 1 / 3)
+    assert rows[("/api/products", "GET", "4xx")]["error_rate"] == 0.0, "Only 5xx count as errors"
+    assert math.isclose(user_updates["p50"], 0.1, rel_tol=0.01), f"p50 test failed: got {user_updates['p50']}"
+    assert math.isclose(aggregator.sketches[("/api/users/{id}", "PUT", "2xx")].quantile(1.0), 0.3, rel_tol=0.01)
+    assert aggregator.rollup(("/api/users/{id}", "PUT", None)).count == 3
+
+    print("✓ Aggregator key tests passed!")
+
+def test_merging_shards_and_windows():
+    """
+    Test that aggregating shards or windows separately and merging them gives
+    the same summary as aggregating everything at once.
+    """
+
+    records = parse_log_entries(LOG_LINES)
+    whole = aggregate_access_log(records)
+
+    shards = aggregate_access_log(records[:3]) + aggregate_access_log(records[3:])
+    assert _same_summary(shards.summary(), whole.summary()), "Merged shards differ from one pass"
+
+    accumulated = AccessLogAggregator()
+    for record in records:
+        accumulated += aggregate_access_log([record])
+    assert _same_summary(accumulated.summary(), whole.summary()), "In-place merging differs from one pass"
+
+    windows = WindowedAggregator(window_seconds=60).update(records)
+    assert len(windows.windows) == 3, f"Expected windows 10:23, 10:24 and 10:25, got {sorted(windows.windows)}"
+    assert _same_summary(windows.combined().summary(), whole.summary()), "Merged windows differ from one pass"
+
+    halves = WindowedAggregator(60).update(records[:4]) + WindowedAggregator(60).update(records[4:])
+    assert _same_summary(halves.combined().summary(), whole.summary())
+
+    latest = WindowedAggregator(window_seconds=60, max_windows=1).update(records)
+    assert len(latest.windows) == 1 and len(latest.combined().rollup((None, None, None)).buckets) > 0
+    assert latest.combined().rollup((None, None, None)).count == 4, "Only the 10:25 window should be kept"
+
+    print("✓ Shard and window merging tests passed!")
+
+if __name__ == "__main__":
+    test_sketch_quantiles_and_merge()
+    test_aggregator_keys_and_error_rates()
+    test_merging_shards_and_windows()
@@ -0,0 +1,46 @@
+from bench_data_normalization import (
+    SUITE_CASES,
+    diff_results,
+    make_emails,
+    make_phone_numbers,
+    make_product_names,
+    run_case,
+)
+
+def test_generators_are_seeded():
+    """
+    Test that the synthetic datasets are reproducible, so results of
+    different versions are measured on the same rows.
+    """
+
+    for make_data in (make_emails, make_phone_numbers, make_product_names):
+        assert make_data(100, seed=7) == make_data(100, seed=7), f"{make_data.__name__} is not reproducible"
+        assert make_data(100, seed=7) != make_data(100, seed=8), f"{make_data.__name__} ignores its seed"
+        assert len(make_data(100)) == 100
+
+    print("✓ Generator tests passed!")
+
+def test_run_case_and_diff():
+    """
+    Test one in-process suite run and the diff of two result files.
+    """
+
+    for name in SUITE_CASES:
+        result = run_case(name, rows=50, repeat=1)
+        assert result["case"] == name and result["rows"] == 50
+        assert result["rows_per_sec"] > 0, f"{name} reported no throughput"
+        assert result["peak_alloc_bytes"] > 0, f"{name} reported no allocations"
+
+    old = {"results": [{"case": "emails/regex", "rows": 10, "rows_per_sec": 100.0}]}
+    new = {"results": [
+        {"case": "emails/regex", "rows": 10, "rows_per_sec": 150.0},
+        {"case": "emails/prefilter", "rows": 10, "rows_per_sec": 200.0},
+    ]}
+    lines = diff_results(old, new)
+    assert len(lines) == 1 and "+50.0%" in lines[0], f"Diff test failed: got {lines}"
+
+    print("✓ Suite run tests passed!")
+
+if __name__ == "__main__":
+    test_generators_are_seeded()
+    test_run_case_and_diff()
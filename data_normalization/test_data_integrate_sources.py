@@ -0,0 +1,131 @@
+from integrate_sources import (
+    CRM_MAPPING,
+    SALES_MAPPING,
+    FieldMap,
+    SourceMapping,
+    compile_mapping,
+    integrate_sources,
+    iter_integrate,
+)
+
+CRM_DATA = [
+    {"client_id": "CRM001", "company_name": "TechCorp", "revenue": 50000, "industry": "Technology"},
+    {"client_id": "CRM002", "company_name": "RetailCo", "revenue": 75000, "industry": "Retail"},
+]
+
+SALES_DATA = [
+    {"customer_ref": "SAL_001", "org_name": "TechCorp Inc.", "total_sales": "50,000", "sector": "Tech"},
+    {"customer_ref": "SAL_002", "org_name": "RetailCo LLC", "total_sales": "n/a", "sector": "Retail"},
+    {"customer_ref": "SAL_003", "org_name": "FinanceInc Corp", "sector": "Financial"},
+]
+
+def test_sample_data():
+    """
+    Test the exercise's CRM and Sales records, skipping the records with an
+    unparseable or missing amount and reporting each one.
+    """
+
+    expected = [
+        {"id": "CRM001", "name": "TechCorp", "revenue": 50000, "category": "Technology", "source": "CRM"},
+        {"id": "CRM002", "name": "RetailCo", "revenue": 75000, "category": "Retail", "source": "CRM"},
+        {"id": "SAL_001", "name": "TechCorp Inc.", "revenue": 50000, "category": "Tech", "source": "Sales"},
+    ]
+
+    rejects = []
+    sources = [(CRM_MAPPING, CRM_DATA), (SALES_MAPPING, SALES_DATA)]
+    result = integrate_sources(sources, on_error="skip", on_reject=lambda record, error: rejects.append(error))
+    assert result == expected, f"Sample test failed: expected {expected}, got {result}"
+    assert list(result[0]) == list(expected[0]), "Fields should come out in the unified order"
+    assert [type(error) for error in rejects] == [ValueError, KeyError], f"Rejects not reported: {rejects}"
+    assert integrate_sources(sources, on_error="skip") == expected
+
+    print("✓ Integration sample data test passed!")
+
+def test_heterogeneous_sources():
+    """
+    Test that a source of CSV-style rows, mapped by index and declaring its
+    fields in another order, lines up with the dict sources.
+    """
+
+    csv_mapping = SourceMapping("csv", (
+        FieldMap("category", 3),
+        FieldMap("revenue", 2, converter=int),
+        FieldMap("name", 1),
+        FieldMap("id", 0),
+    ), {"source": "CSV"})
+    rows = iter([("CSV_9", "Acme", "1200", "Tools"), ("CSV_10", "short row")])
+
+    result = list(iter_integrate([(SALES_MAPPING, SALES_DATA[:1]), (csv_mapping, rows)], "tuple", "skip"))
+    expected = [("SAL_001", "TechCorp Inc.", 50000, "Tech", "Sales"), ("CSV_9", "Acme", 1200, "Tools", "CSV")]
+    assert result == expected, f"Tuple test failed: expected {expected}, got {result}"
+
+    transform = compile_mapping(csv_mapping, on_error="skip")
+    assert "record[3]" in transform.__source__, "The generated source should be kept"
+    assert transform(("CSV_9", "Acme", "1200", "Tools"))["revenue"] == 1200
+    assert transform(("CSV_10",)) is None
+    assert len(list(transform.iter_records([("CSV_9", "Acme", "1200", "Tools"), ("CSV_10",)]))) == 1
+
+    print("✓ Heterogeneous source tests passed!")
+
+def test_record_errors():
+    """
+    Test that records which do not map raise by default, like the
+    hand-written transforms, and that skipping never hides a broken converter.
+    """
+
+    mapping = SourceMapping("upper", (FieldMap("a", "a", lambda value: value.upper()),))
+    transform = compile_mapping(mapping)
+    assert transform({"a": "ok"}) == {"a": "OK"}
+    for record, error in (({"b": 1}, KeyError), ({"a": 5}, AttributeError)):
+        for run in (transform, lambda record: list(transform.iter_records([record]))):
+            try:
+                run(record)
+            except error:
+                pass
+            else:
+                raise AssertionError(f"Expected {error.__name__} for {record}")
+
+    rejects = []
+    skipping = compile_mapping(mapping, on_error="skip", on_reject=lambda record, error: rejects.append(record))
+    assert list(skipping.iter_records([{"a": "ok"}, {"b": 1}])) == [{"a": "OK"}]
+    assert skipping({"b": 2}) is None and rejects == [{"b": 1}, {"b": 2}], f"Rejects not reported: {rejects}"
+    try:
+        skipping({"a": 5})
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("A converter bug should raise even when skipping")
+
+    print("✓ Record error tests passed!")
+
+def test_invalid_mappings():
+    """
+    Test that mappings which cannot produce the unified schema are rejected
+    before any record is read.
+    """
+
+    bad = [
+        lambda: compile_mapping(SourceMapping("dup", (FieldMap("id", "a"), FieldMap("id", "b")))),
+        lambda: compile_mapping(SourceMapping("tags", (FieldMap("source", "a"),), {"source": "X"})),
+        lambda: compile_mapping(SourceMapping("nested", (FieldMap("id", ["a", "b"]),))),
+        lambda: compile_mapping(CRM_MAPPING, output="json"),
+        lambda: compile_mapping(CRM_MAPPING, on_error="ignore"),
+        lambda: compile_mapping(CRM_MAPPING, on_reject=print),
+        lambda: iter_integrate([(CRM_MAPPING, []), (SourceMapping("narrow", (FieldMap("id", "a"),)), [])]),
+    ]
+    for index, make in enumerate(bad):
+        try:
+            make()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected ValueError for invalid mapping {index}")
+    assert integrate_sources([]) == []
+
+    print("✓ Invalid mapping tests passed!")
+
+if __name__ == "__main__":
+    test_sample_data()
+    test_heterogeneous_sources()
+    test_record_errors()
+    test_invalid_mappings()
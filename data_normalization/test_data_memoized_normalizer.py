@@ -0,0 +1,56 @@
+from memoized_normalizer import MemoizedNormalizer
+from normalize_emails import normalize_emails
+from normalize_phone_number import normalize_phone_numbers
+from normalize_product_names import normalize_product_names
+
+def test_matches_uncached_normalizers():
+    """
+    Test that the memoized layer returns exactly what the plain normalizers return,
+    for repetitive input of every supported kind.
+    """
+
+    emails = [" Alice@GMAIL.com ", "invalid-email", " Alice@GMAIL.com ", "frank@valid-domain.org"] * 3
+    phones = ["(555) 123-4567", "555-123-45", "(555) 123-4567", "+1 555 123 4567"] * 3
+    products = ["  Apple Inc.  ", "A", "  Apple Inc.  ", "oracle corporation"] * 3
+
+    for kind, data, normalizer in [
+        ("emails", emails, normalize_emails),
+        ("phone_numbers", phones, normalize_phone_numbers),
+        ("product_names", products, normalize_product_names),
+    ]:
+        expected = normalizer(data)
+        result = MemoizedNormalizer(kind)(data)
+        assert result == expected, f"{kind} memoized test failed: expected {expected}, got {result}"
+
+    print("✓ Memoized normalization tests passed!")
+
+def test_counters_and_bounds():
+    """
+    Test hit/miss counters, the LRU bound and invalid arguments.
+    """
+
+    normalizer = MemoizedNormalizer("emails", maxsize=2)
+    normalizer(["a@b.co", "a@b.co", "bad", "a@b.co"])
+    assert (normalizer.hits, normalizer.misses) == (2, 2), f"Counter test failed: {normalizer.hits}/{normalizer.misses}"
+    assert normalizer.hit_rate == 0.5, f"Hit rate test failed: got {normalizer.hit_rate}"
+
+    # With room for two values, the least recently used one is evicted
+    normalizer(["bad", "c@d.co", "a@b.co"])
+    assert normalizer.misses == 4, f"Eviction test failed: expected 4 misses, got {normalizer.misses}"
+
+    normalizer.cache_clear()
+    assert (normalizer.hits, normalizer.misses, normalizer.hit_rate) == (0, 0, 0.0)
+
+    for kwargs in ({"kind": "zip_codes"}, {"kind": "emails", "maxsize": 0}):
+        try:
+            MemoizedNormalizer(**kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected ValueError for {kwargs}")
+
+    print("✓ Memoized counter tests passed!")
+
+if __name__ == "__main__":
+    test_matches_uncached_normalizers()
+    test_counters_and_bounds()
@@ -0,0 +1,93 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from normalize_columns import (
+    normalize_email_column,
+    normalize_phone_number_column,
+    normalize_product_name_column,
+    parse_timestamp_column,
+)
+from normalize_emails import normalize_emails
+from normalize_phone_number import normalize_phone_numbers
+from normalize_product_names import normalize_product_names
+from normalize_timestamps import TimestampNormalizer
+
+EMAILS = [
+    " Alice@GMAIL.com ", "BOB+work@Yahoo.Com   ", "invalid-email", "  eve@domain.", "a@b.co",
+    "user@@domain.com", "a@b@c.com", "@domain.com", "user@", "user name@domain.com",
+    "...@x.co", "ü@Bücher.DE", "user@do_main.c0m", "user@sub.domain.museum", "a@b+c.co", "",
+]
+PHONES = [
+    "(555) 123-4567", "+1 555 123 4567", "555-123-45", "555-123-456789", "abc-def-ghij",
+    " (555) 123-4567 ", "+1-555-123-4567", "٥٥٥-123-4567", "555–123–4567", "",
+]
+TIMESTAMPS = [
+    "15-01-2024 10:30:45", " 29-02-2024 00:00:00 ", "29-02-2023 00:00:00", "15-13-2024 10:30:45", "15-01-2024 24:00:00",
+    "5-1-2024 10:30:45", "15-01-2024  9:30:45", "15-01-2024 10:30:4٥", "2024-01-15T10:30:45Z", "not a date", "", None,
+]
+PRODUCTS = ["  Apple Inc.  ", "MICROSOFT CORPORATION", "Google LLC", "Adobe Systems Incorporated", "  ", "A"]
+
+def test_matches_list_normalizers():
+    """
+    Test that the valid rows of each column, in order, are exactly
+    what the list-based normalizers return for the same input.
+    """
+
+    for column_normalizer, list_normalizer, data in [
+        (normalize_email_column, normalize_emails, EMAILS),
+        (normalize_phone_number_column, normalize_phone_numbers, PHONES),
+        (normalize_product_name_column, normalize_product_names, PRODUCTS),
+    ]:
+        values, valid = column_normalizer(data)
+        assert len(values) == len(data) and len(valid) == len(data), "Output must stay row-aligned"
+        expected = list_normalizer(data)
+        result = values[valid].tolist()
+        assert result == expected, f"{column_normalizer.__name__} failed: expected {expected}, got {result}"
+        assert (values[~valid] == "").all(), "Invalid rows should be blanked"
+
+    print("✓ Columnar normalization tests passed!")
+
+def test_array_inputs():
+    """
+    Test numpy arrays and object arrays with nulls as input.
+    """
+
+    values, valid = normalize_email_column(np.array(["A@B.co", "bad"]))
+    assert values.tolist() == ["a@b.co", ""] and valid.tolist() == [True, False]
+
+    values, valid = normalize_phone_number_column(np.array(["555.123.4567", None], dtype=object))
+    assert values.tolist() == ["5551234567", ""] and valid.tolist() == [True, False]
+
+    values, valid = normalize_product_name_column([])
+    assert len(values) == 0 and len(valid) == 0
+
+    print("✓ Columnar input tests passed!")
+
+def test_timestamp_column():
+    """
+    Test that vectorized timestamp parsing gives the same moments as parsing
+    each row with the declared format, with NaT for the rest.
+    """
+
+    fmt = "%d-%m-%Y %H:%M:%S"
+    normalizer = TimestampNormalizer([fmt])
+    expected = [normalizer.normalize(stamp or "") for stamp in TIMESTAMPS]
+
+    for strptime_format in (fmt, None):
+        values, valid = parse_timestamp_column(TIMESTAMPS, strptime_format)
+        result = [str(value).replace("T", " ") if ok else None for value, ok in zip(values, valid)]
+        assert values.dtype == np.dtype("datetime64[s]"), f"Unexpected dtype {values.dtype}"
+        assert result == expected, f"Timestamp column test failed: expected {expected}, got {result}"
+        assert np.isnat(values[~valid]).all(), "Unparsed rows should be NaT"
+
+    values, valid = parse_timestamp_column(["01/15/2024", "12/01/2023"], "%m/%d/%Y")
+    assert values.tolist() == [np.datetime64("2024-01-15T00:00:00").item(), np.datetime64("2023-12-01T00:00:00").item()]
+    assert not parse_timestamp_column(["not a date"]).valid.any()
+
+    print("✓ Columnar timestamp tests passed!")
+
+if __name__ == "__main__":
+    test_matches_list_normalizers()
+    test_array_inputs()
+    test_timestamp_column()
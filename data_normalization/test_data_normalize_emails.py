@@ -1,4 +1,13 @@
-from normalize_emails import normalize_emails
+import os
+import tempfile
+
+from normalize_emails import (
+    EmailReason,
+    iter_normalize_emails,
+    normalize_emails,
+    normalize_emails_file,
+    normalize_emails_with_reasons,
+)
 
 def test_sample_data():
     """
@@ -151,6 +160,87 @@ def test_edge_cases_and_stress():
     
     print("✓ All edge case tests passed!")
 
+def test_streaming_modes():
+    """
+    Test the lazy generator and the file-to-file entry point.
+    Both should produce exactly what the list API produces, without
+    requiring the whole input to be materialized up front.
+    """
+
+    raw = [" Alice@GMAIL.com ", "invalid-email", "frank@valid-domain.org\n", "  eve@domain."]
+    expected = ["alice@gmail.com", "frank@valid-domain.org"]
+
+    # The generator works on any iterable, including a one-shot iterator
+    result = list(iter_normalize_emails(iter(raw)))
+    assert result == expected, f"Generator test failed: expected {expected}, got {result}"
+    assert result == normalize_emails(raw), "Generator and list API disagree"
+
+    # File-to-file normalization writes one valid email per line
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = os.path.join(tmp_dir, "raw.txt")
+        target_path = os.path.join(tmp_dir, "clean.txt")
+        with open(source_path, "w", encoding="utf-8") as source:
+            source.write("\n".join(raw))
+        written = normalize_emails_file(source_path, target_path)
+        with open(target_path, encoding="utf-8") as target:
+            lines = target.read().splitlines()
+    assert written == 2, f"Expected 2 emails written, got {written}"
+    assert lines == expected, f"File test failed: expected {expected}, got {lines}"
+
+    print("✓ All streaming tests passed!")
+
+def test_engines_agree():
+    """
+    Test that the prefiltered engine accepts exactly what the plain regex accepts.
+    The cheap string checks must only ever skip rows the regex would reject.
+    """
+
+    samples = [
+        " Alice@GMAIL.com ", "a@b.co", "a@b.c", "@b.co", "a@.co", "a@b.co.", "a@@b.co",
+        "a@b@c.co", "ab.co", "", "x", "user@sub.domain.museum", "user@do main.com",
+        "user_name@domain-x.io", "user@domain..com", "ü@bücher.de", "a@-b.co",
+    ]
+    for engine in ("regex", "prefilter"):
+        result = normalize_emails(samples, engine=engine)
+        expected = normalize_emails(samples, engine="regex")
+        assert result == expected, f"Engine {engine} disagrees: expected {expected}, got {result}"
+
+    try:
+        normalize_emails(samples, engine="missing")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown engine should raise ValueError")
+
+    print("✓ All engine agreement tests passed!")
+
+def test_reject_reasons():
+    """
+    Test that the reporting mode accepts exactly what normalize_emails accepts
+    and records one reason code per input row.
+    """
+
+    email_list = [" Alice@GMAIL.com ", "   ", "testdomain.com", "a@b@c.com", "@domain.com", "user@domain", "a@b.c", "user name@domain.com", "user@", "user@.com"]
+    report = normalize_emails_with_reasons(email_list)
+
+    assert report.accepted == normalize_emails(email_list), f"Accepted mismatch: got {report.accepted}"
+    assert len(report) == len(email_list), f"Expected one code per row, got {len(report)}"
+    expected = [
+        EmailReason.ACCEPTED, EmailReason.EMPTY, EmailReason.MISSING_AT, EmailReason.MULTIPLE_AT,
+        EmailReason.MISSING_LOCAL_PART, EmailReason.MISSING_TLD, EmailReason.INVALID_FORMAT,
+        EmailReason.INVALID_FORMAT, EmailReason.MISSING_DOMAIN, EmailReason.MISSING_DOMAIN,
+    ]
+    result = [report.reason(row) for row in range(len(report))]
+    assert result == expected, f"Reason test failed: expected {expected}, got {result}"
+
+    counts = report.counts()
+    assert counts["accepted"] == 1 and counts["invalid_format"] == 2, f"Counter test failed: got {counts}"
+    assert sum(counts.values()) == len(email_list)
+    assert report.rejected_rows(EmailReason.INVALID_FORMAT) == [6, 7]
+    assert report.rejected_rows() == list(range(1, 10))
+
+    print("✓ All reject reason tests passed!")
+
 def run_all_tests():
     """
     Execute all test functions and provide comprehensive feedback.
@@ -165,6 +255,9 @@ def run_all_tests():
         test_normalization_cases()
         test_edge_cases_and_stress()
         test_sample_data()
+        test_streaming_modes()
+        test_engines_agree()
+        test_reject_reasons()
         print("\n🎉 All tests passed! The email normalization function is robust and reliable.")
     except AssertionError as e:
         print(f"\n❌ Test failed: {e}")
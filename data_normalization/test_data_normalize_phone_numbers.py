@@ -1,4 +1,10 @@
-from normalize_phone_number import normalize_phone_numbers
+from normalize_phone_number import (
+    PhoneReason,
+    match_calling_code,
+    normalize_phone_numbers,
+    normalize_phone_numbers_e164,
+    normalize_phone_numbers_with_reasons,
+)
 
 def test_sample_data():
     """
@@ -34,5 +40,86 @@ def test_sample_data():
 
     print("✓ Sample data integration test passed!")
 
+def test_engines_agree():
+    """
+    Test that the str.translate engine returns exactly what the regex engine returns,
+    including for non-ASCII digits and separators outside the translation table.
+    """
+
+    phone_list = [
+        "(555) 123-4567", "+1 555 123 4567", "+1-555-123-4567", "+15551234567", "1+5551234567",
+        "555-123-45", "", "+1", "  555\t123\n4567 ", "\u0665\u0665\u0665-123-4567",
+        "555\u2013123\u20134567", "555\u00a0123\u00a04567", "\u00b2\u00b3555-123-4567",
+    ]
+    expected = normalize_phone_numbers(phone_list, engine="regex")
+    result = normalize_phone_numbers(phone_list, engine="translate")
+    assert result == expected, f"Engine mismatch: expected {expected}, got {result}"
+    assert len(result) == 9, f"Expected 9 valid phone numbers, got {len(result)}"
+
+    try:
+        normalize_phone_numbers(phone_list, engine="missing")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown engine should raise ValueError")
+
+    print("✓ Engine agreement test passed!")
+
+def test_e164_mode():
+    """
+    Test E.164 normalization of national and international numbers.
+    National numbers use the default calling code; international numbers are
+    resolved through the calling-code trie and checked against its length rules.
+    """
+
+    phone_list = [
+        "(555) 123-4567",        # NANP national
+        "+1 555 123 4567",       # NANP international
+        "011 44 20 7946 0958",   # US international dialing prefix
+        "+44 (0)20 7946 0958",   # UK with trunk prefix in parentheses
+        "+49 30 901820",         # Germany, short national number
+        "+351 912 345 678",      # Portugal, three-digit calling code
+        "+33 1 42 68",           # France, too short
+        "+999 123 456 789",      # Unassigned calling code
+        "not-a-phone-number",
+    ]
+    result = normalize_phone_numbers_e164(phone_list)
+    expected = ["+15551234567", "+15551234567", "+442079460958", "+442079460958", "+4930901820", "+351912345678"]
+    assert result == expected, f"E.164 test failed: expected {expected}, got {result}"
+
+    result = normalize_phone_numbers_e164(["020 7946 0958", "0044 20 7946 0958", "+1 555"], default_calling_code="44")
+    expected = ["+442079460958", "+442079460958"]
+    assert result == expected, f"UK default test failed: expected {expected}, got {result}"
+
+    # Longest-prefix match: "35" is not a calling code but "351" is
+    assert match_calling_code("351912345678").calling_code == "351"
+    assert match_calling_code("4930901820").calling_code == "49"
+    assert match_calling_code("999") is None
+
+    print("✓ E.164 mode test passed!")
+
+def test_reject_reasons():
+    """
+    Test that the reporting mode accepts exactly what normalize_phone_numbers
+    accepts and records why every other row was dropped.
+    """
+
+    phone_list = ["(555) 123-4567", " ", "not-a-phone-number", "555-123-45", "555-123-456789", "+1 ٥٥٥ 123 4567"]
+    report = normalize_phone_numbers_with_reasons(phone_list)
+
+    assert report.accepted == normalize_phone_numbers(phone_list), f"Accepted mismatch: got {report.accepted}"
+    expected = [
+        PhoneReason.ACCEPTED, PhoneReason.EMPTY, PhoneReason.NO_DIGITS,
+        PhoneReason.TOO_FEW_DIGITS, PhoneReason.TOO_MANY_DIGITS, PhoneReason.ACCEPTED,
+    ]
+    result = [report.reason(row) for row in range(len(report))]
+    assert result == expected, f"Reason test failed: expected {expected}, got {result}"
+    assert report.counts()["accepted"] == 2, f"Counter test failed: got {report.counts()}"
+
+    print("✓ Reject reason test passed!")
+
 if __name__ == "__main__":
-    test_sample_data()
\ No newline at end of file
+    test_sample_data()
+    test_engines_agree()
+    test_e164_mode()
+    test_reject_reasons()
\ No newline at end of file
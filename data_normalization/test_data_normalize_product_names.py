@@ -1,4 +1,4 @@
-from normalize_product_names import normalize_product_names
+from normalize_product_names import SuffixReplacer, normalize_product_names, trie_pattern
 
 def test_sample_data():
     """
@@ -39,5 +39,29 @@ def test_sample_data():
 
     print("✓ Sample data integration test passed!")
 
+def test_single_pass_engine():
+    """
+    Test that the single-pass replacer agrees with the sequential engine on the
+    sample data, prefers the longest overlapping rule, and accepts custom rules.
+    """
+
+    product_names = ["  Apple Inc.  ", "MICROSOFT CORPORATION", "Adobe Systems Incorporated", "netflix inc.", "A", "  "]
+    expected = normalize_product_names(product_names)
+    result = normalize_product_names(product_names, engine="single_pass")
+    assert result == expected, f"Engine mismatch: expected {expected}, got {result}"
+
+    replacer = SuffixReplacer({"Co": "Company", "Co.": "Co", "Gmbh": "GmbH", "": "ignored"})
+    assert replacer("Acme Co. Gmbh") == "Acme Co GmbH", f"Longest match test failed: got {replacer('Acme Co. Gmbh')}"
+    assert replacer("Acme Co") == "Acme Company", f"Shorter rule test failed: got {replacer('Acme Co')}"
+
+    result = normalize_product_names(["widget gmbh"], replacer, engine="single_pass")
+    assert result == ["Widget GmbH"], f"Custom replacer test failed: got {result}"
+    assert SuffixReplacer({})("Acme") == "Acme"
+
+    assert trie_pattern(["Inc.", "Incorporated"]) == r"Inc(?:\.|orporated)"
+
+    print("✓ Single-pass engine test passed!")
+
 if __name__ == "__main__":
-    test_sample_data()
\ No newline at end of file
+    test_sample_data()
+    test_single_pass_engine()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import contextlib
+import io
+
+from normalize_timestamps import TimestampNormalizer, normalize_timestamp, normalize_timestamps
+
+def test_sample_data():
+    """
+    Test the four formats of the original exercise, which all
+    describe the same moment.
+    """
+
+    timestamps = [
+        "2024-01-15T10:30:45Z",
+        "2024/01/15 10:30:45",
+        "15-01-2024 10:30:45",
+        "01/15/24 10:30:45",
+    ]
+    expected = ["2024-01-15 10:30:45"] * 4
+
+    for engine in ("strptime", "sniffing"):
+        result = normalize_timestamps(timestamps, engine=engine)
+        assert result == expected, f"{engine} sample test failed: expected {expected}, got {result}"
+
+    print("✓ Timestamp sample data test passed!")
+
+def test_engines_agree():
+    """
+    Test that slicing at fixed offsets gives what strptime gives, including
+    out-of-range fields, non-padded values and unparseable rows.
+    """
+
+    timestamps = [
+        " 31-12-1999 23:59:59 ", "29-02-2024 00:00:00", "29-02-2023 00:00:00", "15-13-2024 10:30:45",
+        "15-01-2024 24:00:00", "2024-1-5T10:30:45Z", "12/31/69 00:00:00", "12/31/68 00:00:00",
+        "0999/01/01 00:00:00", "15-01-2024 10:30:4", "15-01-2024 10:30:4٥", "not a date", "",
+    ]
+
+    expected = normalize_timestamps(timestamps, engine="strptime")
+    result = normalize_timestamps(timestamps, engine="sniffing")
+    assert result == expected, f"Engine test failed: expected {expected}, got {result}"
+    assert "1969-12-31 00:00:00" in result and "2068-12-31 00:00:00" in result, "Two-digit years follow strptime"
+    assert "2024-01-05 10:30:45" in result, "Non-padded values should fall back to strptime"
+
+    print("✓ Timestamp engine tests passed!")
+
+def test_format_cache_per_source():
+    """
+    Test that each source remembers its own winning format, from a sniffed
+    sample or from the last value parsed, and that nothing is printed.
+    """
+
+    normalizer = TimestampNormalizer()
+    european = ["15-01-2024 10:30:45", "16-01-2024 11:00:00", "bad"]
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        assert normalizer.sniff(european, source="eu_feed") == "%d-%m-%Y %H:%M:%S"
+        assert normalizer.preferred_format("us_feed") == "%Y-%m-%dT%H:%M:%SZ"
+        assert normalizer.normalize("01/15/24 10:30:45", source="us_feed") == "2024-01-15 10:30:45"
+        result = list(normalizer.iter_normalize(european, source="eu_feed"))
+    assert output.getvalue() == "", "The normalizer should not print"
+
+    assert normalizer.preferred_format("eu_feed") == "%d-%m-%Y %H:%M:%S"
+    assert normalizer.preferred_format("us_feed") == "%m/%d/%y %H:%M:%S", "Last success should be tried first"
+    assert result == ["2024-01-15 10:30:45", "2024-01-16 11:00:00"], f"Iteration test failed: got {result}"
+    assert normalizer.sniff(["bad"], source="empty") is None
+    assert normalize_timestamp("bad") is None
+
+    try:
+        normalize_timestamps([], engine="dateutil")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for an unknown engine")
+
+    print("✓ Timestamp format cache tests passed!")
+
+if __name__ == "__main__":
+    test_sample_data()
+    test_engines_agree()
+    test_format_cache_per_source()
@@ -0,0 +1,52 @@
+from normalize_emails import normalize_emails
+from normalize_phone_number import normalize_phone_numbers
+from normalize_product_names import normalize_product_names
+from parallel_normalize import iter_chunks, parallel_normalize
+
+def test_matches_sequential_normalizers():
+    """
+    Test that the process pool returns exactly what the single-threaded
+    normalizers return, in the same order, even when chunks are tiny.
+    """
+
+    emails = [" Alice@GMAIL.com ", "invalid-email", "frank@valid-domain.org", "  eve@domain."] * 5
+    phones = ["(555) 123-4567", "555-123-45", "+1 555 123 4567", "not-a-phone-number"] * 5
+    products = ["  Apple Inc.  ", "A", "oracle corporation", "  "] * 5
+
+    for kind, data, normalizer in [
+        ("emails", emails, normalize_emails),
+        ("phone_numbers", phones, normalize_phone_numbers),
+        ("product_names", products, normalize_product_names),
+    ]:
+        expected = normalizer(data)
+        result = parallel_normalize(kind, data, workers=2, chunk_size=3)
+        assert result == expected, f"{kind} parallel test failed: expected {expected}, got {result}"
+        result = parallel_normalize(kind, iter(data), workers=1)
+        assert result == expected, f"{kind} in-process test failed: expected {expected}, got {result}"
+
+    print("✓ Parallel normalization tests passed!")
+
+def test_boundary_conditions():
+    """
+    Test empty input, chunking and invalid arguments.
+    """
+
+    result = parallel_normalize("emails", [], workers=2)
+    assert result == [], f"Empty input test failed: got {result}"
+
+    chunks = list(iter_chunks(range(7), 3))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]], f"Chunking test failed: got {chunks}"
+
+    for kwargs in ({"kind": "zip_codes"}, {"kind": "emails", "chunk_size": 0}):
+        try:
+            parallel_normalize(data=["a@b.co"], **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected ValueError for {kwargs}")
+
+    print("✓ Parallel boundary condition tests passed!")
+
+if __name__ == "__main__":
+    test_matches_sequential_normalizers()
+    test_boundary_conditions()
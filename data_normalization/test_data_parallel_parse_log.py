@@ -0,0 +1,112 @@
+import os
+import tempfile
+from functools import partial
+
+from parallel_parse_log import (
+    count_values,
+    newline_aligned_ranges,
+    parallel_aggregate_log_file,
+    parallel_parse_log_file,
+)
+from parse_log_entries import ACCESS_LOG, parse_log_file
+
+LINES = [
+    "2024-06-18 10:23:45 GET /api/users 200 0.045\n",
+    "2024-06-18 10:24:12 POST /api/orders 201 0.234\r\n",
+    "not a log line\n",
+    "2024-06-18 10:24:33 GET /api/products 404 0.012\n",
+    "\n",
+    "2024-06-18 10:25:01 PUT /api/users/123 500 1.205\n",
+    "2024-06-18 10:25:15 GET /health 200 0.003\n",
+]
+# The last line of a file may lack its newline
+LAST_LINE = "2024-06-18 10:25:20 GET /health 200 0.004"
+
+def _write_log(directory: str, lines: list[str]) -> str:
+    path = os.path.join(directory, "access.log")
+    with open(path, "w", encoding="utf-8", newline="") as log_file:
+        log_file.writelines(lines)
+    return path
+
+def test_matches_line_by_line_parsing():
+    """
+    Test that parsing byte ranges, in-process or in a pool and with ranges
+    as small as one line, gives what parsing the file line by line gives.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_log(directory, LINES * 20 + [LAST_LINE])
+        expected = list(parse_log_file(path, ACCESS_LOG))
+        assert len(expected) == 101
+
+        for workers, chunk_bytes in [(1, 10), (2, 10), (2, 1000), (None, 1 << 20)]:
+            result = list(parallel_parse_log_file(path, workers=workers, chunk_bytes=chunk_bytes))
+            assert result == expected, f"Range parsing with workers={workers}, chunk_bytes={chunk_bytes} failed"
+
+        count_statuses = partial(count_values, position=ACCESS_LOG.field_names.index("status"))
+        counts = parallel_aggregate_log_file(path, count_statuses, workers=2, chunk_bytes=100)
+        assert counts == {200: 41, 201: 20, 404: 20, 500: 20}, f"Aggregation test failed: got {counts}"
+
+    print("✓ Parallel log parsing tests passed!")
+
+def test_lone_carriage_return():
+    """
+    Test that a lone "\r" keeps its line whole in the serial and the parallel
+    parser alike, and that a pool run can be abandoned after its first line.
+    """
+
+    lines = [
+        "2024-06-18 10:23:45 GET /api/users 200 0.045\r2024-06-18 10:23:46 GET /a 200 0.001\n",
+        "2024-06-18 10:24:12 POST /api/orders 201 0.234\r\n",
+        "2024-06-18 10:24:33 GET /api/products 404 0.012\n",
+        "2024-06-18 10:24:34 GET /api/products 404 0.013\r",
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_log(directory, lines * 10)
+        expected = list(parse_log_file(path, ACCESS_LOG))
+        # Two lines per copy, plus the file's last line, whose "\r" the parser's split() drops
+        assert len(expected) == 21, f"Lines joined by a lone \\r should not parse, got {len(expected)}"
+
+        for workers, chunk_bytes in [(1, 10), (2, 10), (2, 100)]:
+            result = list(parallel_parse_log_file(path, workers=workers, chunk_bytes=chunk_bytes))
+            assert result == expected, f"Lone \\r test with workers={workers}, chunk_bytes={chunk_bytes} failed"
+
+        records = parallel_parse_log_file(path, workers=2, chunk_bytes=10)
+        assert next(records) == expected[0]
+        records.close()
+
+    print("✓ Lone carriage return tests passed!")
+
+def test_newline_aligned_ranges():
+    """
+    Test that ranges cover the file exactly, each ending after a newline.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_log(directory, LINES + [LAST_LINE])
+        with open(path, "rb") as log_file:
+            content = log_file.read()
+
+        for chunk_bytes in (1, 7, 50, 10_000):
+            ranges = newline_aligned_ranges(path, chunk_bytes)
+            assert ranges[0][0] == 0 and ranges[-1][1] == len(content)
+            assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+            assert all(content[end - 1:end] == b"\n" for _, end in ranges[:-1]), "Ranges must end after a newline"
+
+        empty = _write_log(directory, [])
+        assert newline_aligned_ranges(empty) == [] and list(parallel_parse_log_file(empty)) == []
+        assert parallel_aggregate_log_file(empty, partial(count_values, position=3)) == {}
+
+        try:
+            newline_aligned_ranges(path, 0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for chunk_bytes=0")
+
+    print("✓ Newline-aligned range tests passed!")
+
+if __name__ == "__main__":
+    test_matches_line_by_line_parsing()
+    test_lone_carriage_return()
+    test_newline_aligned_ranges()
@@ -0,0 +1,104 @@
+import gc
+import os
+import tempfile
+
+from parse_log_entries import (
+    ACCESS_LOG,
+    SEVERITY_LOG,
+    LogField,
+    LogSchema,
+    compile_parser,
+    parse_log_entries,
+    parse_log_file,
+)
+
+ACCESS_LINES = [
+    "2024-06-18 10:23:45 GET /api/users 200 0.045",
+    "2024-06-18 10:24:12 POST /api/orders 201 0.234\n",
+    "2024-06-18 10:24:33 GET /api/products 404 0.012",
+    "2024-06-18 10:25:01 PUT /api/users/123 500 1.205",
+    "2024-06-18 10:25:15 GET /health 200 0.003",
+]
+
+def test_access_log_matches_extract_metrics():
+    """
+    Test that the compiled access-log parser yields the dicts extract_metrics
+    builds, as tuples and as records, and skips lines that do not fit.
+    """
+
+    expected = [
+        {"timestamp": "2024-06-18 10:23:45", "method": "GET", "endpoint": "/api/users", "status": 200, "response_time": 0.045},
+        {"timestamp": "2024-06-18 10:24:12", "method": "POST", "endpoint": "/api/orders", "status": 201, "response_time": 0.234},
+        {"timestamp": "2024-06-18 10:24:33", "method": "GET", "endpoint": "/api/products", "status": 404, "response_time": 0.012},
+        {"timestamp": "2024-06-18 10:25:01", "method": "PUT", "endpoint": "/api/users/123", "status": 500, "response_time": 1.205},
+        {"timestamp": "2024-06-18 10:25:15", "method": "GET", "endpoint": "/health", "status": 200, "response_time": 0.003},
+    ]
+    noise = ["", "bad line", "2024-06-18 10:25:15 GET /health OK 0.003", "2024-06-18 10:25:15 GET /health 200 0.003 extra"]
+
+    tuples = parse_log_entries(ACCESS_LINES + noise)
+    assert tuples == [tuple(metrics.values()) for metrics in expected], f"Tuple test failed: got {tuples}"
+
+    records = parse_log_entries(ACCESS_LINES + noise, output="record")
+    result = [record._asdict() for record in records]
+    assert result == expected, f"Record test failed: expected {expected}, got {result}"
+    assert records[0].status == 200 and not hasattr(records[0], "__dict__"), "Records should use __slots__"
+    assert records[0] == type(records[0])(**expected[0]), "Parsed and constructed records should be equal"
+
+    # The collector is paused while the list is built, and left as it was
+    assert gc.isenabled(), "The collector should be enabled again"
+    gc.disable()
+    try:
+        parse_log_entries(ACCESS_LINES, output="record")
+        assert not gc.isenabled(), "A disabled collector should stay disabled"
+    finally:
+        gc.enable()
+
+    print("✓ Access log parsing tests passed!")
+
+def test_severity_log():
+    """
+    Test the severity-log schema of LogEntry, whose message keeps its spaces.
+    """
+
+    parse = compile_parser(SEVERITY_LOG, output="record")
+    log = parse("2024-06-23 10:30:45 ERROR Database  connection failed\n")
+    assert (log.timestamp, log.severity, log.message) == ("2024-06-23 10:30:45", "ERROR", "Database  connection failed")
+    assert parse("2024-06-23 10:30:45 FATAL").message == ""
+    assert parse("2024-06-23 ERROR") is None
+
+    for schema in (
+        LogSchema("empty", ()),
+        LogSchema("twice", (LogField("a"), LogField("a"))),
+        LogSchema("rest_first", (LogField("message", rest=True), LogField("a"))),
+        LogSchema("keyword", (LogField("class"),)),
+    ):
+        try:
+            compile_parser(schema)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected ValueError for schema {schema.name}")
+
+    print("✓ Severity log parsing tests passed!")
+
+def test_parse_log_file():
+    """
+    Test streaming a file, including an undecodable line.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "access.log")
+        with open(path, "wb") as log_file:
+            log_file.write("".join(line.rstrip("\n") + "\n" for line in ACCESS_LINES).encode())
+            log_file.write(b"2024-06-18 10:25:16 GET /caf\xe9 200 0.001\n")
+        result = list(parse_log_file(path, ACCESS_LOG))
+
+    assert len(result) == 6, f"File test failed: expected 6 records, got {len(result)}"
+    assert result[-1][2] == "/caf�", f"Undecodable bytes should be replaced, got {result[-1][2]!r}"
+
+    print("✓ Log file streaming tests passed!")
+
+if __name__ == "__main__":
+    test_access_log_matches_extract_metrics()
+    test_severity_log()
+    test_parse_log_file()
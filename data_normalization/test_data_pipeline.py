@@ -0,0 +1,159 @@
+from itertools import islice
+
+from pipeline import Pipeline, add_surrogate_keys, product_load_pipeline
+from surrogate_keys import SurrogateKeyGenerator
+
+PRODUCT_CATALOG = [
+    {"sku": "PROD001", "name": "Laptop Pro", "price": 1299.99, "category": "Electronics"},
+    {"sku": "PROD002", "name": "", "price": 45.99, "category": "Books"},
+    {"sku": "PROD003", "name": "Wireless Mouse", "price": 0, "category": "Electronics"},
+    {"sku": "", "name": "Coffee Mug", "price": 12.99, "category": "Kitchen"},
+    {"sku": "PROD005", "name": "Programming Book", "price": 59.99, "category": ""},
+    {"sku": "PROD006", "name": "USB Cable", "price": 15.99, "category": "Electronics"},
+    {"sku": "PROD007", "name": "Notebook", "price": 8.99, "category": "Office"},
+    {"sku": "PROD008", "name": "Headphones", "price": None, "category": "Electronics"},
+    {"sku": "PROD009", "name": "Water Bottle", "price": -25.99, "category": "Sports"},
+]
+
+def test_product_load():
+    """
+    Test the filter, tagging and key generation exercises as one pipeline,
+    with string keys and with batches of surrogate IDs.
+    """
+
+    pipeline = product_load_pipeline(PRODUCT_CATALOG, "CATALOG")
+    result = pipeline.sink(list)
+    expected = ["CATALOG_PROD001", "CATALOG_PROD006", "CATALOG_PROD007"]
+    assert [record["composite_key"] for record in result] == expected, f"Key test failed: got {result}"
+    assert all(record["source_system"] == "CATALOG" for record in result)
+    assert "source_system" not in PRODUCT_CATALOG[0], "Tagging should not change the input records"
+
+    counts = [(stats.name, stats.records_in, stats.records_out) for stats in pipeline.stats]
+    expected_counts = [("is_valid_product", 9, 3), ("tag_source", 3, 3), ("composite_key", 3, 3)]
+    assert counts == expected_counts, f"Stage count test failed: expected {expected_counts}, got {counts}"
+
+    keys = SurrogateKeyGenerator(("source_system", "sku"))
+    batched = product_load_pipeline(PRODUCT_CATALOG, "CATALOG", keys=keys, batch_size=2)
+    result = [(record["sku"], record["product_key"]) for record in batched]
+    assert result == [("PROD001", 0), ("PROD006", 1), ("PROD007", 2)], f"Surrogate key test failed: got {result}"
+    assert (batched.stats[-1].records_in, batched.stats[-1].records_out) == (3, 3)
+
+    print("✓ Product load pipeline tests passed!")
+
+def test_laziness_and_fusion():
+    """
+    Test that nothing runs before the pipeline is consumed, that records go
+    through every stage one at a time, and that stopping early still counts.
+    """
+
+    events = []
+
+    def source():
+        for value in range(1_000):
+            events.append(("read", value))
+            yield value
+
+    def record(name):
+        def stage(value):
+            events.append((name, value))
+            return value
+        return stage
+
+    pipeline = Pipeline(source()).map(record("first")).filter(lambda value: value % 2).map(record("second"))
+    assert events == [], "Building a pipeline should not read the source"
+
+    records = iter(pipeline)
+    result = list(islice(records, 2))
+    assert result == [1, 3]
+    assert events[:5] == [("read", 0), ("first", 0), ("read", 1), ("first", 1), ("second", 1)], f"Got {events[:5]}"
+    assert len(events) == 10, "Only the records needed should be read"
+
+    records.close()
+    counts = [(stats.records_in, stats.records_out) for stats in pipeline.stats]
+    assert counts == [(4, 4), (4, 2), (2, 2)], f"Counts of a pipeline stopped early: got {counts}"
+
+    print("✓ Laziness and fusion tests passed!")
+
+def test_batches_and_timing():
+    """
+    Test batch stages that change the number of records, per-record stages
+    after them, and the timing counters.
+    """
+
+    def drop_first(batch):
+        return batch[1:]
+
+    pipeline = (
+        Pipeline(range(10), batch_size=4, timed=True)
+        .map(lambda value: value * 10, name="times_ten")
+        .map_batch(drop_first)
+        .filter(lambda value: value != 50, name="not_fifty")
+    )
+    result = pipeline.sink(list)
+    assert result == [10, 20, 30, 60, 70, 90], f"Batch test failed: got {result}"
+
+    counts = {stats.name: (stats.records_in, stats.records_out) for stats in pipeline.stats}
+    assert counts == {"times_ten": (10, 10), "drop_first": (10, 7), "not_fifty": (7, 6)}, f"Got {counts}"
+    assert all(stats.seconds > 0 for stats in pipeline.stats), "Timed pipelines should time every stage"
+    assert "seconds" in pipeline.format_stats()
+
+    untimed = Pipeline([{"sku": "A"}], batch_size=1).map_batch(
+        lambda batch: add_surrogate_keys(batch, SurrogateKeyGenerator(["sku"]))
+    )
+    assert untimed.sink(list) == [{"sku": "A", "product_key": 0}] and untimed.stats[0].seconds == 0.0
+
+    try:
+        Pipeline([], batch_size=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for batch_size 0")
+
+    print("✓ Batch and timing tests passed!")
+
+def test_stats_per_run_and_errors():
+    """
+    Test that stats describe the latest run only, and that a record on which
+    a map stage raises counts as in but not as out of that stage.
+    """
+
+    def fail_on_five(value):
+        if value == 5:
+            raise ValueError("bad record")
+        return value
+
+    for batched in (False, True):
+        pipeline = (
+            Pipeline(range(10), batch_size=3)
+            .filter(lambda value: value != 2, name="not_two")
+            .map(fail_on_five)
+            .map(str)
+        )
+        if batched:
+            pipeline.map_batch(list, name="copy")
+        try:
+            pipeline.sink(list)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected the stage's ValueError")
+        # Records 0 to 5 were read; 5 went into fail_on_five and never came out
+        counts = [(stats.records_in, stats.records_out) for stats in pipeline.stats]
+        expected = [(6, 5), (5, 4), (4, 4)] + ([(2, 2)] if batched else [])
+        assert counts == expected, f"Counts of a failed run (batched={batched}): expected {expected}, got {counts}"
+
+    pipeline = Pipeline(list(range(10))).filter(lambda value: value % 3).map(str)
+    for _ in range(2):
+        assert len(pipeline.sink(list)) == 6
+        counts = [(stats.records_in, stats.records_out) for stats in pipeline.stats]
+        assert counts == [(10, 6), (6, 6)], f"Stats should not accumulate across runs, got {counts}"
+    pipeline.reset_stats()
+    assert all(stats.records_in == stats.records_out == 0 for stats in pipeline.stats)
+
+    print("✓ Per-run stats tests passed!")
+
+if __name__ == "__main__":
+    test_product_load()
+    test_laziness_and_fusion()
+    test_batches_and_timing()
+    test_stats_per_run_and_errors()
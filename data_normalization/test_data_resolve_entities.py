@@ -0,0 +1,118 @@
+from integrate_sources import CRM_MAPPING, SALES_MAPPING, integrate_sources
+from resolve_entities import FuzzyIndex, deduplicate, entity_key, hash_join
+
+CRM_DATA = [
+    {"client_id": "CRM001", "company_name": "TechCorp", "revenue": 50000, "industry": "Technology"},
+    {"client_id": "CRM002", "company_name": "RetailCo", "revenue": 75000, "industry": "Retail"},
+    {"client_id": "CRM003", "company_name": "FinanceInc", "revenue": 120000, "industry": "Finance"},
+]
+
+SALES_DATA = [
+    {"customer_ref": "SAL_001", "org_name": "TechCorp Inc.", "total_sales": "50,000", "sector": "Tech"},
+    {"customer_ref": "SAL_002", "org_name": "RetailCo LLC", "total_sales": "75,000", "sector": "Retail"},
+    {"customer_ref": "SAL_003", "org_name": "FinanceInc Corp", "total_sales": "120,000", "sector": "Financial"},
+    {"customer_ref": "SAL_004", "org_name": "Techcorps, Inc", "total_sales": "1,000", "sector": "Tech"},
+    {"customer_ref": "SAL_005", "org_name": "Globex Corporation", "total_sales": "9,000", "sector": "Energy"},
+]
+
+def test_entity_keys():
+    """
+    Test that legal suffixes are stripped as whole trailing words only.
+    """
+
+    cases = {
+        "TechCorp Inc.": "techcorp",
+        "  RetailCo LLC ": "retailco",
+        "FinanceInc Corp": "financeinc",
+        "Acme, Inc.": "acme",
+        "Foo Co. Ltd.": "foo",
+        "Incorporated": "incorporated",
+        "Johnson & Johnson": "johnson johnson",
+        "": "",
+    }
+
+    for name, expected in cases.items():
+        result = entity_key(name)
+        assert result == expected, f"Key test failed for {name!r}: expected {expected!r}, got {result!r}"
+
+    print("✓ Entity key tests passed!")
+
+def test_hash_join():
+    """
+    Test the exact join of the exercise's sources, and the fuzzy fallback for
+    a near-duplicate name.
+    """
+
+    crm = integrate_sources([(CRM_MAPPING, CRM_DATA)])
+    sales = integrate_sources([(SALES_MAPPING, SALES_DATA)])
+
+    exact = [(left["id"], right and right["id"]) for left, right in hash_join(sales, crm)]
+    expected = [("SAL_001", "CRM001"), ("SAL_002", "CRM002"), ("SAL_003", "CRM003"), ("SAL_004", None), ("SAL_005", None)]
+    assert exact == expected, f"Exact join failed: expected {expected}, got {exact}"
+
+    fuzzy = [(left["id"], right and right["id"]) for left, right in hash_join(sales, crm, threshold=0.9)]
+    assert ("SAL_004", "CRM001") in fuzzy and ("SAL_005", None) in fuzzy, f"Fuzzy join failed: got {fuzzy}"
+
+    # A lower threshold matches at least what a higher one does; 0.0 is not exact-only
+    def matched(threshold):
+        return {(left["id"], right["id"]) for left, right in hash_join(sales, crm, threshold=threshold) if right}
+
+    assert ("SAL_004", "CRM001") in matched(0.5) and matched(0.5) <= matched(0.0), "threshold=0.0 lost matches"
+    for threshold in (-0.1, 1.5):
+        try:
+            hash_join(sales, crm, threshold=threshold)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected ValueError for threshold {threshold}")
+
+    print("✓ Hash join tests passed!")
+
+def test_deduplicate():
+    """
+    Test grouping of the integrated records into entities, exact and fuzzy,
+    and that unrelated keys are never compared.
+    """
+
+    records = integrate_sources([(CRM_MAPPING, CRM_DATA), (SALES_MAPPING, SALES_DATA)])
+
+    groups = [[record["id"] for record in group] for group in deduplicate(records)]
+    expected = [["CRM001", "SAL_001", "SAL_004"], ["CRM002", "SAL_002"], ["CRM003", "SAL_003"], ["SAL_005"]]
+    assert groups == expected, f"Fuzzy dedup failed: expected {expected}, got {groups}"
+
+    groups = [[record["id"] for record in group] for group in deduplicate(records, threshold=None)]
+    assert ["SAL_004"] in groups and len(groups) == 5, f"Exact dedup failed: got {groups}"
+
+    index = FuzzyIndex()
+    for key in ("techcorp", "retailco", "financeinc", "globex"):
+        index.add(key, key)
+    assert list(index.candidates("techcorps")) == ["techcorp"], "Only keys sharing a block should be compared"
+    assert index.best_match("techcorq") == "techcorp" and index.best_match("initech") is None
+
+    print("✓ Deduplication tests passed!")
+
+def test_empty_keys_match_nothing():
+    """
+    Test that records whose names leave an empty key (blank, punctuation or
+    legal suffixes only) are neither joined nor grouped with each other.
+    """
+
+    blank = [{"id": "A", "name": ""}, {"id": "B", "name": "  "}, {"id": "C", "name": ", Inc."}, {"id": "D", "name": "--"}]
+    assert {entity_key(record["name"]) for record in blank} == {""}
+
+    for threshold in (None, 0.9, 0.0):
+        pairs = [(left["id"], right and right["id"]) for left, right in hash_join(blank[:2], blank, threshold=threshold)]
+        assert pairs == [("A", None), ("B", None)], f"Empty key join with threshold {threshold} failed: got {pairs}"
+
+        records = blank + [{"id": "E", "name": "Globex"}, {"id": "F", "name": "Globex Corp"}]
+        groups = [[record["id"] for record in group] for group in deduplicate(records, threshold=threshold)]
+        expected = [["A"], ["B"], ["C"], ["D"], ["E", "F"]]
+        assert groups == expected, f"Empty key dedup with threshold {threshold} failed: got {groups}"
+
+    print("✓ Empty key tests passed!")
+
+if __name__ == "__main__":
+    test_entity_keys()
+    test_hash_join()
+    test_deduplicate()
+    test_empty_keys_match_nothing()
@@ -0,0 +1,149 @@
+import os
+import tempfile
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import surrogate_key_store
+from surrogate_key_store import INDEX_FILE, KEYS_FILE, OFFSETS_FILE, SurrogateKeyStore
+from surrogate_keys import UNKNOWN_ID, SurrogateKeyGenerator
+
+BUSINESS_DATA = [
+    {"customer_id": "CUST001", "product_id": "PROD123"},
+    {"customer_id": "CUST002", "product_id": "PROD456"},
+    {"customer_id": "CUST003", "product_id": "PROD789"},
+    {"customer_id": "CUST001", "product_id": "PROD123"},
+]
+
+NEXT_LOAD = [
+    {"customer_id": "CUST004", "product_id": "PROD123"},
+    {"customer_id": "CUST002", "product_id": "PROD456"},
+    {"customer_id": "Ünïcode", "product_id": ""},
+]
+
+def test_stable_ids_across_runs():
+    """
+    Test that IDs survive reopening the store, continue where they stopped,
+    and match those of SurrogateKeyGenerator.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SurrogateKeyStore(directory)
+        ids = store.lookup_or_insert(BUSINESS_DATA)
+        assert ids.tolist() == [0, 1, 2, 0], f"First load failed: got {ids.tolist()}"
+        assert ids.tolist() == SurrogateKeyGenerator().encode(BUSINESS_DATA).tolist()
+
+        reopened = SurrogateKeyStore(directory)
+        assert len(reopened) == 3
+        assert reopened.lookup(NEXT_LOAD).tolist() == [UNKNOWN_ID, 1, UNKNOWN_ID]
+        assert reopened.encode(NEXT_LOAD, verify=True).tolist() == [3, 1, 4]
+        assert reopened.encode([]).tolist() == []
+
+        final = SurrogateKeyStore(directory)
+        assert final.lookup(BUSINESS_DATA + NEXT_LOAD, verify=True).tolist() == [0, 1, 2, 0, 3, 1, 4]
+        assert final.composite_key(0) == "CUST001_PROD123"
+        assert final.business_key(4) == ("Ünïcode", "")
+
+        for bad in (lambda: final.business_key(5), lambda: final.business_key(-1)):
+            try:
+                bad()
+            except IndexError:
+                pass
+            else:
+                raise AssertionError("Expected IndexError for an unassigned surrogate ID")
+
+    print("✓ Surrogate key store stability tests passed!")
+
+def test_verify_detects_mismatch():
+    """
+    Test that verify=True compares the stored bytes of every matched key, so
+    a key whose hash matches but whose bytes differ is not taken for it.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SurrogateKeyStore(directory, ["sku"])
+        assert store.encode([{"sku": ""}, {"sku": "A-1"}, {"sku": "B-2"}]).tolist() == [0, 1, 2]
+        assert store.lookup([{"sku": "B-2"}, {"sku": ""}, {"sku": "C-3"}], verify=True).tolist() == [2, 0, UNKNOWN_ID]
+        assert store.stored_key(0) == b"" and store.stored_key(2) == b"B-2"
+
+        # Same length, so only a byte comparison can tell the key apart
+        with open(os.path.join(directory, KEYS_FILE), "r+b") as keys_file:
+            keys_file.seek(3)
+            keys_file.write(b"X")
+        store = SurrogateKeyStore(directory, ["sku"])
+        assert store.lookup([{"sku": "A-1"}, {"sku": "B-2"}]).tolist() == [1, 2]
+        assert store.lookup([{"sku": "A-1"}, {"sku": "B-2"}], verify=True).tolist() == [1, UNKNOWN_ID]
+        assert store.encode([{"sku": "B-2"}], verify=False).tolist() == [2], "verify=False trusts the hash"
+        assert store.encode([{"sku": "B-2"}]).tolist() == [3], "A key whose stored bytes differ is new"
+        assert store.lookup([{"sku": "A-1"}, {"sku": "B-2"}]).tolist() == [1, 3]
+
+    print("✓ Surrogate key store verify tests passed!")
+
+def test_hash_collisions():
+    """
+    Test that keys whose hashes collide, in one batch or across batches, get
+    IDs of their own and are told apart by every later lookup.
+    """
+
+    key_hash = surrogate_key_store.key_hash
+    surrogate_key_store.key_hash = lambda key: 7 if key.startswith(b"X") else key_hash(key)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            store = SurrogateKeyStore(directory, ["sku"])
+            batch = [{"sku": "X-1"}, {"sku": "X-2"}, {"sku": "A-1"}, {"sku": "X-1"}]
+            assert store.lookup_or_insert(batch).tolist() == [0, 1, 2, 0]
+            assert store.lookup(batch).tolist() == [0, 1, 2, 0], "Keys colliding in one batch should stay apart"
+
+            assert store.encode([{"sku": "X-3"}, {"sku": "X-2"}, {"sku": "B-1"}]).tolist() == [3, 1, 4]
+            reopened = SurrogateKeyStore(directory, ["sku"])
+            for verify in (False, True):
+                ids = reopened.lookup([{"sku": f"X-{i}"} for i in range(1, 5)], verify=verify).tolist()
+                assert ids == [0, 1, 3, UNKNOWN_ID], f"Collision lookup with verify={verify} failed: got {ids}"
+            assert [reopened.business_key(i) for i in (0, 1, 3)] == ["X-1", "X-2", "X-3"]
+    finally:
+        surrogate_key_store.key_hash = key_hash
+
+    print("✓ Surrogate key store collision tests passed!")
+
+def test_crash_recovery():
+    """
+    Test that an append interrupted before its commit leaves the store as it
+    was, and that the next load reuses the IDs it had claimed.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        SurrogateKeyStore(directory).encode(BUSINESS_DATA)
+
+        # A crash after writing the logs and a partial index, before the rename
+        with open(os.path.join(directory, KEYS_FILE), "ab") as keys_file:
+            keys_file.write(b"CUST999\x1fPROD999")
+        with open(os.path.join(directory, OFFSETS_FILE), "ab") as offsets_file:
+            offsets_file.write(b"\x07\x00\x00")
+        with open(os.path.join(directory, INDEX_FILE + ".tmp"), "wb") as index_file:
+            index_file.write(b"SKSTORE1 torn")
+
+        store = SurrogateKeyStore(directory)
+        assert len(store) == 3, "Uncommitted keys should not count"
+        assert store.encode(NEXT_LOAD).tolist() == [3, 1, 4]
+        assert store.business_key(3) == ("CUST004", "PROD123"), "Torn bytes should have been cut off"
+        assert SurrogateKeyStore(directory).lookup(NEXT_LOAD).tolist() == [3, 1, 4]
+
+        for bad in (
+            lambda: SurrogateKeyStore(directory, ["customer_id"]),
+            lambda: store.encode([{"customer_id": "A\x1fB", "product_id": "C"}]),
+        ):
+            try:
+                bad()
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Expected ValueError")
+
+    print("✓ Surrogate key store recovery tests passed!")
+
+if __name__ == "__main__":
+    test_stable_ids_across_runs()
+    test_verify_detects_mismatch()
+    test_hash_collisions()
+    test_crash_recovery()
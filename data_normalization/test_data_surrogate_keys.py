@@ -0,0 +1,105 @@
+import os
+import tempfile
+from array import array
+
+from surrogate_keys import UNKNOWN_ID, SurrogateKeyGenerator, generate_composite_keys, np
+
+BUSINESS_DATA = [
+    {"customer_id": "CUST001", "product_id": "PROD123"},
+    {"customer_id": "CUST002", "product_id": "PROD456"},
+    {"customer_id": "CUST003", "product_id": "PROD789"},
+    {"customer_id": "CUST001", "product_id": "PROD123"},
+]
+
+def test_sample_data():
+    """
+    Test that repeated business keys share a dense ID, and that the
+    composite strings are those of the original exercise.
+    """
+
+    keys = SurrogateKeyGenerator()
+    ids = keys.encode(BUSINESS_DATA)
+
+    assert ids == array("q", [0, 1, 2, 0]), f"Encoding failed: got {ids}"
+    assert len(keys) == 3 and ("CUST002", "PROD456") in keys
+    assert keys.composite_keys(ids) == generate_composite_keys(BUSINESS_DATA)
+    assert keys.composite_key(0) == "CUST001_PROD123"
+    assert keys.composite_key(0) is keys.composite_key(0), "Composite strings should be interned"
+    assert keys.business_key(2) == ("CUST003", "PROD789")
+
+    for bad_id in (3, -1):
+        try:
+            keys.business_key(bad_id)
+        except IndexError:
+            pass
+        else:
+            raise AssertionError(f"Expected IndexError for surrogate ID {bad_id}")
+
+    print("✓ Surrogate key sample data test passed!")
+
+def test_lookup_and_outputs():
+    """
+    Test that lookup does not assign IDs, and the single-field and numpy variants.
+    """
+
+    keys = SurrogateKeyGenerator()
+    keys.encode(BUSINESS_DATA[:2])
+    unseen = {"customer_id": "CUST009", "product_id": "PROD123"}
+
+    result = keys.lookup([BUSINESS_DATA[1], unseen])
+    assert result == array("q", [1, UNKNOWN_ID]) and len(keys) == 2, f"Lookup failed: got {result}"
+
+    customers = SurrogateKeyGenerator(["customer_id"])
+    assert customers.encode(BUSINESS_DATA) == array("q", [0, 1, 2, 0])
+    assert customers.composite_key(2) == "CUST003"
+
+    if np is not None:
+        ids = keys.encode(BUSINESS_DATA, output="numpy")
+        assert ids.dtype == np.int64 and ids.tolist() == [0, 1, 2, 0]
+
+    try:
+        keys.encode(BUSINESS_DATA, output="list")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for an unknown output")
+
+    print("✓ Surrogate key lookup tests passed!")
+
+def test_save_and_load():
+    """
+    Test that a reloaded generator keeps every ID and continues after them,
+    and that saving replaces the file whole.
+    """
+
+    keys = SurrogateKeyGenerator()
+    keys.encode(BUSINESS_DATA)
+    odd = {"customer_id": 'CUST,"4"', "product_id": "PROD\n1"}
+    keys.encode([odd])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keys.csv")
+        keys.save(path)
+        keys.save(path)
+        assert os.listdir(directory) == ["keys.csv"], "No temporary file should be left behind"
+
+        reloaded = SurrogateKeyGenerator.load(path)
+        assert reloaded.key_fields == ("customer_id", "product_id")
+        assert reloaded.lookup(BUSINESS_DATA + [odd]) == keys.lookup(BUSINESS_DATA + [odd])
+        assert reloaded.encode([{"customer_id": "CUST010", "product_id": "PROD000"}]) == array("q", [4])
+
+        with open(path, "a", encoding="utf-8") as key_file:
+            key_file.write("CUST001,PROD123\n")
+        try:
+            SurrogateKeyGenerator.load(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for a repeated key")
+
+    print("✓ Surrogate key persistence tests passed!")
+
+if __name__ == "__main__":
+    test_sample_data()
+    test_lookup_and_outputs()
+    test_save_and_load()